@@ -2,7 +2,9 @@ from .bound import Bound, BoundType
 from .client import Client
 from .container import Container
 from .errors import (
+    BulkWriteError,
     ClientError,
+    ConflictError,
     CustomError,
     InternalError,
     ServerError,
@@ -10,35 +12,74 @@ from .errors import (
 )
 from .event import Event, EventCandidate
 from .observe_events import (
+    CatchUpProgress,
     IfEventIsMissingDuringObserve,
     ObserveEventsOptions,
     ObserveFromLatestEvent,
+    ObserveHub,
+    ReconnectInfo,
+    SubjectRouter,
 )
+from .outbox import Outbox, OutboxMetrics
 from .read_event_types import EventType
 from .read_events import (
+    EventPage,
     IfEventIsMissingDuringRead,
     Order,
     ReadEventsOptions,
     ReadFromLatestEvent,
 )
+from .retry_policy import RetryPolicy
+from .subscriptions import (
+    CheckpointStore,
+    FileCheckpointStore,
+    PartitionedWorkerPool,
+    SqliteCheckpointStore,
+    Subscription,
+)
+from .verify_events import (
+    AuditResult,
+    FileVerificationCheckpointStore,
+    VerificationCheckpoint,
+    VerificationCheckpointStore,
+    VerificationResult,
+    audit_events,
+    verify_hash_chain,
+    verify_hashes,
+    verify_signatures,
+)
 from .write_events import (
+    BulkWriteProgress,
+    EventWriter,
     IsEventQlQueryTrue,
     IsSubjectOnEventId,
     IsSubjectPopulated,
     IsSubjectPristine,
+    PipelinedWriter,
     Precondition,
+    WriteAcknowledgement,
 )
 
 __all__ = [
+    "AuditResult",
     "Bound",
     "BoundType",
+    "BulkWriteError",
+    "BulkWriteProgress",
+    "CatchUpProgress",
+    "CheckpointStore",
     "Client",
     "ClientError",
+    "ConflictError",
     "Container",
     "CustomError",
     "Event",
     "EventCandidate",
+    "EventPage",
     "EventType",
+    "EventWriter",
+    "FileCheckpointStore",
+    "FileVerificationCheckpointStore",
     "IfEventIsMissingDuringObserve",
     "IfEventIsMissingDuringRead",
     "InternalError",
@@ -48,10 +89,28 @@ __all__ = [
     "IsSubjectPristine",
     "ObserveEventsOptions",
     "ObserveFromLatestEvent",
+    "ObserveHub",
     "Order",
+    "Outbox",
+    "OutboxMetrics",
+    "PartitionedWorkerPool",
+    "PipelinedWriter",
     "Precondition",
     "ReadEventsOptions",
     "ReadFromLatestEvent",
+    "ReconnectInfo",
+    "RetryPolicy",
     "ServerError",
+    "SqliteCheckpointStore",
+    "SubjectRouter",
+    "Subscription",
     "ValidationError",
+    "VerificationCheckpoint",
+    "VerificationCheckpointStore",
+    "VerificationResult",
+    "WriteAcknowledgement",
+    "audit_events",
+    "verify_hash_chain",
+    "verify_hashes",
+    "verify_signatures",
 ]
@@ -1,26 +1,79 @@
+import asyncio
+import contextlib
+import dataclasses
+import heapq
 import json
-from collections import OrderedDict
-from collections.abc import AsyncGenerator
+from collections import deque
+from collections.abc import AsyncGenerator, AsyncIterable, Awaitable, Callable, Iterable
 from http import HTTPStatus
+from inspect import isawaitable
 from types import TracebackType
 from typing import Any, Self, TypeAlias, TypeVar
 
-from .errors import CustomError, InternalError, ServerError, ValidationError
+import aiohttp
+
+from .bound import Bound, BoundType
+from .errors import (
+    BulkWriteError,
+    ConflictError,
+    CustomError,
+    InternalError,
+    ServerError,
+    ValidationError,
+)
 from .event import Event, EventCandidate
+from .eventql import (
+    get_count_by_type_query,
+    get_count_events_query,
+    get_subject_exists_query,
+)
 from .http_client import HttpClient, Response
 from .is_event import is_event
 from .is_heartbeat import is_heartbeat
 from .is_stream_error import is_stream_error
 from .is_valid_server_header import is_valid_server_header
-from .observe_events import ObserveEventsOptions
-from .parse_raw_message import parse_raw_message
+from .observe_events import (
+    CatchUpProgress,
+    ObserveEventsOptions,
+    ReconnectInfo,
+    get_catch_up_read_options,
+)
+from .observe_events import get_continuation_options as get_observe_continuation_options
+from .parse_raw_message import parse_raw_message, parse_raw_message_with_raw_data
 from .read_event_types import EventType, is_event_type
-from .read_events import ReadEventsOptions
+from .read_events import (
+    EventPage,
+    Order,
+    ReadEventsOptions,
+    decode_page_cursor,
+    encode_page_cursor,
+    get_continuation_options,
+    get_id_partitions,
+)
+from .read_stream_lines import read_stream_lines
 from .read_subjects import is_subject
-from .write_events import Precondition
+from .retry_policy import RetryPolicy
+from .run_command import SubjectHead, SubjectHeadCache
+from .write_events import (
+    BulkChunk,
+    BulkWriteProgress,
+    IsSubjectOnEventId,
+    IsSubjectPristine,
+    Precondition,
+    WriteAcknowledgement,
+    get_bulk_chunks,
+    get_write_events_request_body,
+    stream_write_events_request_body,
+)
 
 T = TypeVar('T')
 
+# Number of event candidates from which on write requests are streamed
+STREAMING_THRESHOLD = 1_000
+
+# Number of prefetched pages kept per client before the oldest is discarded
+MAX_PREFETCHED_PAGES = 16
+
 # Type aliases for commonly used types
 JsonDict: TypeAlias = dict[str, Any]
 EventCandidateList: TypeAlias = list[EventCandidate]
@@ -37,6 +90,8 @@ class Client:
         api_token: str,
     ) -> None:
         self.__http_client = HttpClient(base_url=base_url, api_token=api_token)
+        self.__subject_head_cache = SubjectHeadCache()
+        self.__prefetched_pages: dict[tuple, asyncio.Task[EventPage]] = {}
 
     async def __aenter__(self) -> Self:
         await self.__http_client.__aenter__()
@@ -48,6 +103,10 @@ class Client:
         exc_val: BaseException | None = None,
         exc_tb: TracebackType | None = None,
     ) -> None:
+        for prefetched_page in self.__prefetched_pages.values():
+            prefetched_page.cancel()
+        self.__prefetched_pages.clear()
+
         await self.__http_client.__aexit__(exc_type, exc_val, exc_tb)
 
     @property
@@ -60,7 +119,14 @@ class Client:
             raise ServerError("Server must be EventSourcingDB")
         if response.status_code != HTTPStatus.OK:
             msg = error_message or f"Unexpected response status: {response}"
-            raise ServerError(msg)
+            raise ServerError(msg, response.status_code)
+
+    @staticmethod
+    def _parse_stream_message(raw_message: bytes, keep_raw_data: bool) -> tuple[Any, bytes | None]:
+        """Parse a stream message, optionally keeping the raw bytes of the event data."""
+        if keep_raw_data:
+            return parse_raw_message_with_raw_data(raw_message)
+        return parse_raw_message(raw_message), None
 
     async def ping(self) -> None:
         specversion_field = "specversion"
@@ -73,7 +139,9 @@ class Client:
         response_body = bytes.decode(await response.body.read(), encoding="utf-8")
 
         if response.status_code != HTTPStatus.OK:
-            raise ServerError(f"Received unexpected response: {response_body}")
+            raise ServerError(
+                f"Received unexpected response: {response_body}", response.status_code
+            )
 
         response_json = json.loads(response_body)
         if (
@@ -112,41 +180,332 @@ class Client:
         event_candidates: EventCandidateList,
         preconditions: PreconditionList | None = None
     ) -> list[Event]:
+        request_body = self._get_write_events_request_body(event_candidates, preconditions)
+        return await self._send_write_events(request_body)
+
+    async def write_events_acknowledged(
+        self,
+        event_candidates: EventCandidateList,
+        preconditions: PreconditionList | None = None
+    ) -> list[WriteAcknowledgement]:
+        """
+        Write events like write_events, but only return their ids, subjects and hashes.
+
+        The written events are not parsed into Event instances, which saves
+        the validation and time parsing of every event.
+        """
+        request_body = self._get_write_events_request_body(event_candidates, preconditions)
+        response_data = self._parse_write_events_response(
+            await self._post_write_events(request_body)
+        )
+
+        return [
+            WriteAcknowledgement.parse(unparsed_event_context)
+            for unparsed_event_context in response_data
+        ]
+
+    async def write_events_without_response(
+        self,
+        event_candidates: EventCandidateList,
+        preconditions: PreconditionList | None = None
+    ) -> None:
+        """Write events like write_events, but do not decode the response at all."""
+        request_body = self._get_write_events_request_body(event_candidates, preconditions)
+        await self._post_write_events(request_body)
+
+    @staticmethod
+    def _get_write_events_request_body(
+        event_candidates: EventCandidateList,
+        preconditions: PreconditionList | None,
+    ) -> bytes | AsyncIterable[bytes]:
         if preconditions is None:
             preconditions = []
 
-        request_body = json.dumps(
-            {
-                'events': [event_candidate.to_json() for event_candidate in event_candidates],
-                'preconditions': [precondition.to_json() for precondition in preconditions]
-            }
+        encoded_event_candidates = (
+            event_candidate.encode() for event_candidate in event_candidates
+        )
+
+        # Large batches are encoded while they are being sent, so that the
+        # request body never has to be held in memory as a whole.
+        if len(event_candidates) >= STREAMING_THRESHOLD:
+            return stream_write_events_request_body(encoded_event_candidates, preconditions)
+
+        return get_write_events_request_body(encoded_event_candidates, preconditions)
+
+    async def _send_write_events(self, request_body: bytes | AsyncIterable[bytes]) -> list[Event]:
+        response_data = self._parse_write_events_response(
+            await self._post_write_events(request_body)
         )
 
+        result = []
+        for unparsed_event_context in response_data:
+            result.append(Event.parse(unparsed_event_context))
+        return result
+
+    async def _post_write_events(self, request_body: bytes | AsyncIterable[bytes]) -> bytes:
         response = await self.http_client.post(
             path='/api/v1/write-events',
             request_body=request_body,
         )
 
-        self._validate_response(response)
+        async with response:
+            if (
+                is_valid_server_header(response)
+                and response.status_code == HTTPStatus.CONFLICT
+            ):
+                raise ConflictError(
+                    f'Failed to write events, a precondition failed: {response}',
+                    response.status_code,
+                )
+
+            self._validate_response(response)
+
+            # The body is always read, so that the connection can be reused.
+            return await response.body.read()
 
-        response_data = await response.body.read()
-        response_data = bytes.decode(response_data, encoding='utf-8')
-        response_data = json.loads(response_data, object_pairs_hook=OrderedDict)
+    @staticmethod
+    def _parse_write_events_response(response_body: bytes) -> list:
+        response_data = json.loads(response_body)
 
         if not isinstance(response_data, list):
             raise ServerError(
                 f'Failed to parse response \'{response_data}\' to list.')
 
-        result = []
-        for unparsed_event_context in response_data:
-            result.append(Event.parse(unparsed_event_context))
-        return result
+        return response_data
+
+    async def write_events_bulk(
+        self,
+        event_candidates: Iterable[EventCandidate],
+        max_chunk_size: int = 1_000,
+        max_chunk_bytes: int = 1_000_000,
+        max_concurrency: int = 1,
+        on_progress: Callable[[BulkWriteProgress], None] | None = None,
+    ) -> EventStream:
+        """
+        Write a large number of events in chunks, without atomicity across chunks.
+
+        Candidates are encoded lazily and split into chunks by count and encoded
+        size. Up to max_concurrency chunks are in flight at once, but a chunk only
+        starts once no running chunk shares a subject with it, so the order of
+        events within each subject is kept. Written events are yielded in input
+        order. If a chunk fails, a BulkWriteError tells the offset to resume from
+        and which later chunks were written anyway.
+        """
+        if max_chunk_size < 1:
+            raise ValidationError('max_chunk_size must be at least 1.')
+        if max_chunk_bytes < 1:
+            raise ValidationError('max_chunk_bytes must be at least 1.')
+        if max_concurrency < 1:
+            raise ValidationError('max_concurrency must be at least 1.')
+
+        chunks = get_bulk_chunks(event_candidates, max_chunk_size, max_chunk_bytes)
+        next_chunk = next(chunks, None)
+        in_flight: deque[tuple[BulkChunk, asyncio.Task[list[Event]]]] = deque()
+        written_count = 0
+        chunk_count = 0
+
+        def can_start(chunk: BulkChunk) -> bool:
+            if any(task.done() and task.exception() is not None for _, task in in_flight):
+                return False
+
+            running = [running_chunk for running_chunk, task in in_flight if not task.done()]
+            return len(running) < max_concurrency and all(
+                chunk.subjects.isdisjoint(running_chunk.subjects) for running_chunk in running
+            )
+
+        try:
+            while True:
+                while next_chunk is not None and can_start(next_chunk):
+                    request_body = get_write_events_request_body(
+                        next_chunk.encoded_event_candidates, []
+                    )
+                    in_flight.append((
+                        next_chunk,
+                        asyncio.create_task(self._send_write_events(request_body)),
+                    ))
+                    next_chunk = next(chunks, None)
+
+                if not in_flight:
+                    return
+
+                first_chunk, first_task = in_flight[0]
+                if not first_task.done():
+                    await asyncio.wait(
+                        [task for _, task in in_flight if not task.done()],
+                        return_when=asyncio.FIRST_COMPLETED,
+                    )
+                    continue
+
+                error = first_task.exception()
+                if error is not None:
+                    break
+
+                in_flight.popleft()
+                for event in first_task.result():
+                    yield event
+
+                written_count += len(first_chunk)
+                chunk_count += 1
+                if on_progress is not None:
+                    on_progress(BulkWriteProgress(written_count, chunk_count))
+
+            # A chunk failed. Let the chunks that are still running finish, so
+            # that the resume information is complete.
+            await asyncio.wait([task for _, task in in_flight])
+
+            written_ranges = []
+            for chunk, task in list(in_flight)[1:]:
+                if task.exception() is None:
+                    written_ranges.append(range(chunk.offset, chunk.offset + len(chunk)))
+                    for event in task.result():
+                        yield event
+
+            raise BulkWriteError(str(error), first_chunk.offset, written_ranges) from error
+        finally:
+            for _, task in in_flight:
+                task.cancel()
+
+    async def run_command(
+        self,
+        subject: str,
+        initial_state: T,
+        evolve: Callable[[T, Event], T],
+        decide: Callable[[T], EventCandidateList | Awaitable[EventCandidateList]],
+        retry_policy: RetryPolicy | None = None,
+    ) -> list[Event]:
+        """
+        Decide on new events based on the current state of a subject, with optimistic concurrency.
+
+        The state is folded from the subject's events with evolve, then decide
+        returns the events to write. They are written on the condition that the
+        subject has not changed in the meantime. On a conflict, only the events
+        after the known head are read, and the command is retried with jittered
+        backoff. Heads and folded states are cached per subject and evolve
+        function, so repeated commands only read what is new. States must
+        therefore be treated as immutable, and evolve must always start from
+        the same initial state.
+        """
+        if retry_policy is None:
+            retry_policy = RetryPolicy()
+        retry_policy.validate()
+
+        cache_key = (subject, evolve)
+        head = self.__subject_head_cache.get(cache_key) or SubjectHead(None, initial_state)
+
+        for attempt in range(retry_policy.max_retries + 1):
+            event_id, state = head.event_id, head.state
+            lower_bound = None if event_id is None else Bound(event_id, BoundType.EXCLUSIVE)
+
+            async for event in self.read_events(
+                subject,
+                ReadEventsOptions(recursive=False, lower_bound=lower_bound),
+            ):
+                state = evolve(state, event)
+                event_id = event.event_id
+
+            head = SubjectHead(event_id, state)
+            self.__subject_head_cache.set(cache_key, head)
+
+            event_candidates = decide(state)
+            if isawaitable(event_candidates):
+                event_candidates = await event_candidates
+            if not event_candidates:
+                return []
+
+            precondition: Precondition = (
+                IsSubjectPristine(subject)
+                if event_id is None
+                else IsSubjectOnEventId(subject, event_id)
+            )
+
+            try:
+                written_events = await self.write_events(event_candidates, [precondition])
+            except ConflictError:
+                if attempt == retry_policy.max_retries:
+                    raise
+                await asyncio.sleep(retry_policy.get_delay(attempt))
+                continue
+
+            for event in written_events:
+                if event.subject == subject:
+                    state = evolve(state, event)
+                    event_id = event.event_id
+            self.__subject_head_cache.set(cache_key, SubjectHead(event_id, state))
+
+            return written_events
+
+        raise InternalError('Failed to run command: Unexpected end of retry loop.')
 
     async def read_events(
         self,
         subject: str,
-        options: ReadEventsOptions
+        options: ReadEventsOptions,
+        keep_raw_data: bool = False,
+        reconnect: RetryPolicy | None = None,
+        limit: int | None = None,
+    ) -> EventStream:
+        """
+        Read the events of a subject.
+
+        If limit is given, reading stops after that many events, and the
+        connection is closed before the last one is returned.
+
+        If reconnect is given, a read that breaks because of a connection
+        error, an incomplete response or a timeout is resumed right after the
+        last returned event, so the stream continues without gaps or
+        duplicates. reconnect.max_retries limits the total number of
+        reconnects, and the backoff starts over whenever events arrive.
+        """
+        if limit is not None and limit < 0:
+            raise ValidationError('limit must not be negative.')
+
+        if reconnect is None:
+            # Closing the inner stream explicitly releases the connection as
+            # soon as the caller stops reading, not once it is finalized.
+            async with contextlib.aclosing(
+                self._read_events_once(subject, options, keep_raw_data, limit)
+            ) as events:
+                async for event in events:
+                    yield event
+            return
+
+        reconnect.validate()
+
+        reconnect_count = 0
+        attempt = 0
+        current_options = options
+        remaining = limit
+
+        while True:
+            events = self._read_events_once(subject, current_options, keep_raw_data, remaining)
+            try:
+                async for event in events:
+                    if remaining is not None:
+                        remaining -= 1
+                    yield event
+                    attempt = 0
+                    current_options = get_continuation_options(options, event.event_id)
+                return
+            except (aiohttp.ClientConnectionError, aiohttp.ClientPayloadError, TimeoutError):
+                if reconnect_count >= reconnect.max_retries:
+                    raise
+            finally:
+                await events.aclose()
+
+            await asyncio.sleep(reconnect.get_delay(attempt))
+            reconnect_count += 1
+            attempt += 1
+
+    async def _read_events_once(
+        self,
+        subject: str,
+        options: ReadEventsOptions,
+        keep_raw_data: bool,
+        limit: int | None = None,
     ) -> EventStream:
+        if limit == 0:
+            return
+
         request_body = json.dumps({
             'subject': subject,
             'options': options.to_json()
@@ -156,16 +515,25 @@ class Client:
             request_body=request_body,
         )
 
+        count = 0
+        last_event: Event | None = None
+
         async with response:
             self._validate_response(response)
             async for raw_message in response.body:
-                message = parse_raw_message(raw_message)
+                message, raw_data = self._parse_stream_message(raw_message, keep_raw_data)
 
                 if is_stream_error(message):
                     raise ServerError(f'{message["payload"]["error"]}.')
 
                 if is_event(message):
-                    event = Event.parse(message['payload'])
+                    event = Event.parse(message['payload'], raw_data)
+                    count += 1
+                    if count == limit:
+                        # Close the connection before handing out the last
+                        # event, since the caller may never ask for more.
+                        last_event = event
+                        break
                     yield event
                     continue
 
@@ -174,7 +542,350 @@ class Client:
                     f'{message}.'
                 )
 
-    async def run_eventql_query(self, query: str) -> AsyncGenerator[Any]:
+        if last_event is not None:
+            yield last_event
+
+    async def read_events_page(
+        self,
+        subject: str,
+        options: ReadEventsOptions,
+        page_size: int,
+        cursor: str | None = None,
+        prefetch_next: bool = False,
+        keep_raw_data: bool = False,
+    ) -> EventPage:
+        """
+        Read a single page of events, starting after the given cursor.
+
+        The returned page contains up to page_size events and, if more events
+        follow, a cursor for the next page. The cursor is opaque, but based on
+        the id of the page's last event, so it stays valid while new events
+        are written. The stream is closed as soon as the page is full. If
+        prefetch_next is set, the next page is read in the background, and a
+        subsequent call for it on the same client returns it right away.
+        """
+        if page_size < 1:
+            raise ValidationError('page_size must be at least 1.')
+
+        key = (
+            subject,
+            json.dumps(options.to_json(), sort_keys=True),
+            page_size,
+            cursor,
+            keep_raw_data,
+        )
+
+        page: EventPage | None = None
+        prefetched_page = self.__prefetched_pages.pop(key, None)
+        if prefetched_page is not None:
+            await asyncio.wait([prefetched_page])
+            # A failed prefetch is simply repeated. A last page is read again
+            # as well, since events may have been written in the meantime.
+            if prefetched_page.exception() is None and prefetched_page.result().next_cursor:
+                page = prefetched_page.result()
+
+        if page is None:
+            page = await self._read_page(subject, options, page_size, cursor, keep_raw_data)
+
+        if prefetch_next and page.next_cursor is not None:
+            next_key = (*key[:3], page.next_cursor, keep_raw_data)
+            if next_key not in self.__prefetched_pages:
+                if len(self.__prefetched_pages) >= MAX_PREFETCHED_PAGES:
+                    oldest_key = next(iter(self.__prefetched_pages))
+                    self.__prefetched_pages.pop(oldest_key).cancel()
+
+                next_page = asyncio.create_task(self._read_page(
+                    subject, options, page_size, page.next_cursor, keep_raw_data
+                ))
+                # Prefetches that are never requested must not log their errors.
+                next_page.add_done_callback(
+                    lambda task: task.cancelled() or task.exception()
+                )
+                self.__prefetched_pages[next_key] = next_page
+
+        return page
+
+    async def _read_page(
+        self,
+        subject: str,
+        options: ReadEventsOptions,
+        page_size: int,
+        cursor: str | None,
+        keep_raw_data: bool,
+    ) -> EventPage:
+        if cursor is not None:
+            options = get_continuation_options(options, decode_page_cursor(cursor))
+
+        # One more event than requested is read to learn whether another page
+        # follows, without leaving the client with a cursor to an empty page.
+        async with contextlib.aclosing(
+            self.read_events(subject, options, keep_raw_data, limit=page_size + 1)
+        ) as stream:
+            events = [event async for event in stream]
+
+        if len(events) <= page_size:
+            return EventPage(events=events, next_cursor=None)
+
+        events.pop()
+        return EventPage(events=events, next_cursor=encode_page_cursor(events[-1].event_id))
+
+    async def read_events_many(
+        self,
+        subjects: Iterable[str],
+        options: ReadEventsOptions,
+        max_concurrency: int = 8,
+        page_size: int = 1_000,
+        keep_raw_data: bool = False,
+    ) -> EventStream:
+        """
+        Read the events of several subjects, merged into a single stream in event id order.
+
+        Each subject is read in pages of page_size events, with at most
+        max_concurrency pages being fetched at a time. The streams are merged
+        lazily using a heap of the next event of each subject, and the next
+        page of a subject is fetched while its current page is consumed, so
+        at most two pages per subject are held in memory. Events that match
+        several subjects, e.g. with recursive reads of nested subjects, are
+        returned only once.
+        """
+        if max_concurrency < 1:
+            raise ValidationError('max_concurrency must be at least 1.')
+        if page_size < 1:
+            raise ValidationError('page_size must be at least 1.')
+        if options.from_latest_event is not None:
+            raise ValidationError('from_latest_event can not be used when reading many subjects.')
+
+        subjects = list(dict.fromkeys(subjects))
+        direction = -1 if options.order == Order.ANTICHRONOLOGICAL else 1
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def read_page(subject: str, page_options: ReadEventsOptions) -> list[Event]:
+            async with semaphore, contextlib.aclosing(
+                self.read_events(subject, page_options, keep_raw_data, limit=page_size)
+            ) as events:
+                return [event async for event in events]
+
+        buffers: list[deque[Event]] = [deque() for _ in subjects]
+        next_pages: list[asyncio.Task[list[Event]] | None] = [
+            asyncio.create_task(read_page(subject, options)) for subject in subjects
+        ]
+        heap: list[tuple[int, int]] = []
+
+        async def advance(index: int) -> None:
+            buffer = buffers[index]
+            next_page = next_pages[index]
+
+            if not buffer and next_page is not None:
+                page = await next_page
+                next_pages[index] = None
+                buffer.extend(page)
+
+                # A full page may be followed by more events, so fetch them
+                # while this page is consumed.
+                if len(page) == page_size:
+                    next_pages[index] = asyncio.create_task(read_page(
+                        subjects[index], get_continuation_options(options, page[-1].event_id)
+                    ))
+
+            if buffer:
+                heapq.heappush(heap, (direction * int(buffer[0].event_id), index))
+
+        try:
+            for index in range(len(subjects)):
+                await advance(index)
+
+            last_event_id: str | None = None
+            while heap:
+                _, index = heapq.heappop(heap)
+                event = buffers[index].popleft()
+                await advance(index)
+
+                if event.event_id == last_event_id:
+                    continue
+                last_event_id = event.event_id
+
+                yield event
+        finally:
+            for next_page in next_pages:
+                if next_page is not None:
+                    next_page.cancel()
+            await asyncio.gather(
+                *[next_page for next_page in next_pages if next_page is not None],
+                return_exceptions=True,
+            )
+
+    async def read_events_parallel(
+        self,
+        subject: str,
+        options: ReadEventsOptions,
+        partition_count: int = 4,
+        ordered: bool = True,
+        max_buffered_events: int = 1_000,
+        keep_raw_data: bool = False,
+    ) -> EventStream:
+        """
+        Read events like read_events, but split into id ranges that are read concurrently.
+
+        The id range between the bounds, or between the first and the last
+        event if no bounds are given, is split into partition_count ranges,
+        each of which is read on its own connection. If ordered is set, events
+        are yielded in the requested order: partitions are consumed one after
+        the other, while later partitions buffer ahead. Otherwise, events are
+        yielded as soon as any partition delivers them, so they are only in
+        order within each partition. At most max_buffered_events events are
+        buffered in total.
+        """
+        if partition_count < 1:
+            raise ValidationError('partition_count must be at least 1.')
+        if max_buffered_events < 1:
+            raise ValidationError('max_buffered_events must be at least 1.')
+        if options.from_latest_event is not None:
+            raise ValidationError('from_latest_event can not be used for parallel reads.')
+
+        id_range = await self._get_event_id_range(subject, options)
+        if id_range is None:
+            return
+
+        partitions = get_id_partitions(id_range[0], id_range[1], partition_count)
+        if options.order == Order.ANTICHRONOLOGICAL:
+            partitions.reverse()
+
+        if ordered:
+            queue_size = max(1, max_buffered_events // len(partitions))
+            queues: list[asyncio.Queue[Event | None]] = [
+                asyncio.Queue(queue_size) for _ in partitions
+            ]
+        else:
+            queues = [asyncio.Queue(max_buffered_events)] * len(partitions)
+
+        async def read_partition(
+            lower_id: int,
+            upper_id: int,
+            queue: asyncio.Queue[Event | None],
+        ) -> None:
+            async with contextlib.aclosing(self.read_events(
+                subject,
+                dataclasses.replace(
+                    options,
+                    lower_bound=Bound(str(lower_id), BoundType.INCLUSIVE),
+                    upper_bound=Bound(str(upper_id), BoundType.INCLUSIVE),
+                ),
+                keep_raw_data,
+            )) as events:
+                async for event in events:
+                    await queue.put(event)
+
+            await queue.put(None)
+
+        tasks = [
+            asyncio.create_task(read_partition(lower_id, upper_id, queue))
+            for (lower_id, upper_id), queue in zip(partitions, queues, strict=True)
+        ]
+
+        try:
+            if ordered:
+                for queue in queues:
+                    while (event := await self._get_partition_item(queue, tasks)) is not None:
+                        yield event
+                return
+
+            remaining_partitions = len(partitions)
+            while remaining_partitions > 0:
+                event = await self._get_partition_item(queues[0], tasks)
+                if event is None:
+                    remaining_partitions -= 1
+                    continue
+                yield event
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    @staticmethod
+    async def _get_partition_item(
+        queue: asyncio.Queue[Event | None],
+        tasks: list[asyncio.Task[None]],
+    ) -> Event | None:
+        while True:
+            if not queue.empty():
+                return queue.get_nowait()
+
+            # Fail as soon as any partition fails, not only once it is reached.
+            for task in tasks:
+                if task.done() and not task.cancelled():
+                    error = task.exception()
+                    if error is not None:
+                        raise error
+
+            getter = asyncio.ensure_future(queue.get())
+            try:
+                await asyncio.wait(
+                    [getter, *[task for task in tasks if not task.done()]],
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+            finally:
+                if not getter.done():
+                    getter.cancel()
+
+            if getter.done() and not getter.cancelled():
+                return getter.result()
+
+    async def _get_event_id_range(
+        self,
+        subject: str,
+        options: ReadEventsOptions,
+    ) -> tuple[int, int] | None:
+        """Return the inclusive range of event ids to read, based on bounds or actual events."""
+        if options.lower_bound is not None:
+            lower_id = int(options.lower_bound.id)
+            if options.lower_bound.type == BoundType.EXCLUSIVE:
+                lower_id += 1
+        else:
+            first_event_id = await self._read_first_event_id(
+                subject, dataclasses.replace(options, order=Order.CHRONOLOGICAL)
+            )
+            if first_event_id is None:
+                return None
+            lower_id = first_event_id
+
+        if options.upper_bound is not None:
+            upper_id = int(options.upper_bound.id)
+            if options.upper_bound.type == BoundType.EXCLUSIVE:
+                upper_id -= 1
+        else:
+            last_event_id = await self._read_first_event_id(
+                subject, dataclasses.replace(options, order=Order.ANTICHRONOLOGICAL)
+            )
+            if last_event_id is None:
+                return None
+            upper_id = last_event_id
+
+        if upper_id < lower_id:
+            return None
+
+        return lower_id, upper_id
+
+    async def _read_first_event_id(self, subject: str, options: ReadEventsOptions) -> int | None:
+        async with contextlib.aclosing(self.read_events(subject, options, limit=1)) as events:
+            async for event in events:
+                return int(event.event_id)
+
+        return None
+
+    async def run_eventql_query(
+        self,
+        query: str,
+        heartbeat_timeout: float | None = None,
+        on_heartbeat: Callable[[float], None] | None = None,
+    ) -> AsyncGenerator[Any]:
+        """
+        Run an EventQL query and return its rows.
+
+        If heartbeat_timeout is given, a TimeoutError is raised once neither
+        a heartbeat nor a row has arrived for that many seconds. on_heartbeat
+        is called with the seconds since the previous heartbeat, or since the
+        connection was established, for each heartbeat.
+        """
         request_body = json.dumps({
             'query': query,
         })
@@ -183,12 +894,20 @@ class Client:
             request_body=request_body,
         )
 
+        loop = asyncio.get_running_loop()
+
         async with response:
             self._validate_response(response)
-            async for raw_message in response.body:
+            last_heartbeat_at = loop.time()
+
+            async for raw_message in read_stream_lines(response.body, heartbeat_timeout):
                 message = parse_raw_message(raw_message)
 
                 if is_heartbeat(message):
+                    if on_heartbeat is not None:
+                        now = loop.time()
+                        on_heartbeat(now - last_heartbeat_at)
+                        last_heartbeat_at = now
                     continue
 
                 if is_stream_error(message):
@@ -205,11 +924,310 @@ class Client:
                     f'{message}.'
                 )
 
+    async def count_events(self, subject: str, recursive: bool = False) -> int:
+        """Count the events of a subject on the server, without transferring them."""
+        rows = [row async for row in self.run_eventql_query(
+            get_count_events_query(subject, recursive)
+        )]
+
+        if not rows:
+            return 0
+
+        count = rows[0]
+        if not isinstance(count, int) or isinstance(count, bool):
+            raise ServerError(f'Failed to parse count \'{count}\' to int.')
+
+        return count
+
+    async def subject_exists(self, subject: str, recursive: bool = False) -> bool:
+        """Return whether at least one event has been written to the subject."""
+        async with contextlib.aclosing(self.run_eventql_query(
+            get_subject_exists_query(subject, recursive)
+        )) as rows:
+            async for _ in rows:
+                return True
+
+        return False
+
+    async def count_by_type(self, subject: str, recursive: bool = False) -> dict[str, int]:
+        """Count the events of a subject per event type on the server."""
+        counts: dict[str, int] = {}
+
+        async for row in self.run_eventql_query(get_count_by_type_query(subject, recursive)):
+            if not isinstance(row, dict):
+                raise ServerError(f'Failed to parse row \'{row}\' to dict.')
+
+            event_type = row.get('type')
+            count = row.get('count')
+            if not isinstance(event_type, str):
+                raise ServerError(f'Failed to parse type \'{event_type}\' to string.')
+            if not isinstance(count, int) or isinstance(count, bool):
+                raise ServerError(f'Failed to parse count \'{count}\' to int.')
+
+            counts[event_type] = count
+
+        return counts
+
+    async def latest_event_id(self, subject: str, recursive: bool = False) -> str | None:
+        """Return the id of the latest event of a subject, or None if there is none."""
+        # Event ids are strings in EventQL, so ordering by them in a query
+        # would not be numeric. Reading a single event backwards is exact.
+        async with contextlib.aclosing(self.read_events(
+            subject,
+            ReadEventsOptions(recursive=recursive, order=Order.ANTICHRONOLOGICAL),
+            limit=1,
+        )) as events:
+            async for event in events:
+                return event.event_id
+
+        return None
+
     async def observe_events(
         self,
         subject: str,
-        options: ObserveEventsOptions
+        options: ObserveEventsOptions,
+        keep_raw_data: bool = False,
+        limit: int | None = None,
+        reconnect: RetryPolicy | None = None,
+        on_reconnect: Callable[[ReconnectInfo], None] | None = None,
+        heartbeat_timeout: float | None = None,
+        on_heartbeat: Callable[[float], None] | None = None,
+    ) -> EventStream:
+        """
+        Observe the events of a subject, first the existing ones, then new ones as they arrive.
+
+        If limit is given, observing stops after that many events, and the
+        connection is closed before the last one is returned.
+
+        If reconnect is given, a stream that breaks or ends, e.g. because of
+        a network error or a server restart, is reopened right after the last
+        returned event, so delivery continues without gaps or duplicates.
+        reconnect.max_retries limits the number of consecutive attempts that
+        fail to connect. The backoff keeps growing until an event or heartbeat
+        arrives on the new connection. Once a connection has been
+        reestablished, on_reconnect is called with the number of reconnects so
+        far and the time the stream was down.
+
+        If heartbeat_timeout is given, a stream on which neither a heartbeat
+        nor an event has arrived for that many seconds fails with a
+        TimeoutError, which triggers a reconnect if enabled. on_heartbeat is
+        called with the seconds since the previous heartbeat, or since the
+        connection was established, for each heartbeat.
+        """
+        if limit is not None and limit < 0:
+            raise ValidationError('limit must not be negative.')
+
+        if reconnect is None:
+            async with contextlib.aclosing(self._observe_events_once(
+                subject,
+                options,
+                keep_raw_data,
+                limit,
+                heartbeat_timeout=heartbeat_timeout,
+                on_heartbeat=on_heartbeat,
+            )) as events:
+                async for event in events:
+                    yield event
+            return
+
+        reconnect.validate()
+
+        loop = asyncio.get_running_loop()
+        reconnect_count = 0
+        attempt = 0
+        current_options = options
+        remaining = limit
+        disconnected_at: float | None = None
+        last_error: BaseException | None = None
+
+        def on_connected() -> None:
+            nonlocal disconnected_at
+            if disconnected_at is None:
+                return
+
+            downtime = loop.time() - disconnected_at
+            disconnected_at = None
+            if on_reconnect is not None:
+                on_reconnect(ReconnectInfo(reconnect_count, downtime, last_error))
+
+        # The backoff only starts over once the new connection has delivered
+        # something, so a server that accepts and immediately closes streams
+        # is not hammered with reconnects.
+        def on_connection_heartbeat(seconds: float) -> None:
+            nonlocal attempt
+            attempt = 0
+            if on_heartbeat is not None:
+                on_heartbeat(seconds)
+
+        while True:
+            events = self._observe_events_once(
+                subject,
+                current_options,
+                keep_raw_data,
+                remaining,
+                on_connected=on_connected,
+                heartbeat_timeout=heartbeat_timeout,
+                on_heartbeat=on_connection_heartbeat,
+            )
+            try:
+                async for event in events:
+                    if remaining is not None:
+                        remaining -= 1
+                    yield event
+                    attempt = 0
+                    current_options = get_observe_continuation_options(
+                        options, event.event_id
+                    )
+
+                # Observing never ends on its own, so an ended stream means
+                # that the server went away, unless the limit was reached.
+                if remaining == 0:
+                    return
+                last_error = None
+            except (
+                aiohttp.ClientConnectionError,
+                aiohttp.ClientPayloadError,
+                TimeoutError,
+            ) as error:
+                if attempt >= reconnect.max_retries:
+                    raise
+                last_error = error
+            finally:
+                await events.aclose()
+
+            if disconnected_at is None:
+                disconnected_at = loop.time()
+
+            await asyncio.sleep(reconnect.get_delay(attempt))
+            reconnect_count += 1
+            attempt += 1
+
+    async def observe_events_with_catch_up(
+        self,
+        subject: str,
+        options: ObserveEventsOptions,
+        keep_raw_data: bool = False,
+        page_size: int = 1_000,
+        on_progress: Callable[[CatchUpProgress], None] | None = None,
+        reconnect: RetryPolicy | None = None,
+        on_reconnect: Callable[[ReconnectInfo], None] | None = None,
+        heartbeat_timeout: float | None = None,
+        on_heartbeat: Callable[[float], None] | None = None,
+    ) -> EventStream:
+        """
+        Observe the events of a subject, but read the existing ones with read_events.
+
+        The id of the latest event at the start is the catch-up target. The
+        events up to it are read page by page, with the next page prefetched
+        while the current one is consumed, and on_progress is called after
+        each page. Afterwards, observing starts right after the last read
+        event, so there are no gaps or duplicates between the two phases, and
+        on_progress is called once more with is_caught_up set.
+
+        If reconnect is given, failed page reads are repeated as well. All
+        other arguments are passed on to observe_events.
+        """
+        if page_size < 1:
+            raise ValidationError('page_size must be at least 1.')
+
+        options.validate()
+        if reconnect is not None:
+            reconnect.validate()
+
+        target = await self.latest_event_id(subject, options.recursive)
+        position: str | None = None
+        read_count = 0
+
+        def report_progress(is_caught_up: bool) -> None:
+            if on_progress is None:
+                return
+
+            lag = 0
+            if target is not None and not is_caught_up:
+                lag = int(target) - (int(position) if position is not None else -1)
+            on_progress(CatchUpProgress(position, target, read_count, lag, is_caught_up))
+
+        if target is not None:
+            read_options = get_catch_up_read_options(options, target)
+            cursor: str | None = None
+
+            while True:
+                page = await self._read_catch_up_page(
+                    subject, read_options, page_size, cursor, keep_raw_data, reconnect
+                )
+                for event in page.events:
+                    yield event
+                    position = event.event_id
+                    read_count += 1
+
+                report_progress(is_caught_up=False)
+                if page.next_cursor is None:
+                    break
+                cursor = page.next_cursor
+
+        report_progress(is_caught_up=True)
+
+        # Without a read event, the original options can not replay anything
+        # up to the target, since the read would have returned it.
+        live_options = options
+        if position is not None:
+            live_options = get_observe_continuation_options(options, position)
+
+        async with contextlib.aclosing(self.observe_events(
+            subject,
+            live_options,
+            keep_raw_data,
+            reconnect=reconnect,
+            on_reconnect=on_reconnect,
+            heartbeat_timeout=heartbeat_timeout,
+            on_heartbeat=on_heartbeat,
+        )) as events:
+            async for event in events:
+                yield event
+
+    async def _read_catch_up_page(
+        self,
+        subject: str,
+        options: ReadEventsOptions,
+        page_size: int,
+        cursor: str | None,
+        keep_raw_data: bool,
+        reconnect: RetryPolicy | None,
+    ) -> EventPage:
+        attempt = 0
+
+        while True:
+            try:
+                return await self.read_events_page(
+                    subject,
+                    options,
+                    page_size,
+                    cursor,
+                    prefetch_next=True,
+                    keep_raw_data=keep_raw_data,
+                )
+            except (aiohttp.ClientConnectionError, aiohttp.ClientPayloadError, TimeoutError):
+                if reconnect is None or attempt >= reconnect.max_retries:
+                    raise
+
+            await asyncio.sleep(reconnect.get_delay(attempt))
+            attempt += 1
+
+    async def _observe_events_once(
+        self,
+        subject: str,
+        options: ObserveEventsOptions,
+        keep_raw_data: bool,
+        limit: int | None = None,
+        on_connected: Callable[[], None] | None = None,
+        heartbeat_timeout: float | None = None,
+        on_heartbeat: Callable[[float], None] | None = None,
     ) -> EventStream:
+        if limit == 0:
+            return
+
+        loop = asyncio.get_running_loop()
+
         request_body = json.dumps({
             'subject': subject,
             'options': options.to_json()
@@ -220,19 +1238,34 @@ class Client:
             request_body=request_body,
         )
 
+        count = 0
+        last_event: Event | None = None
+
         async with response:
             self._validate_response(response)
-            async for raw_message in response.body:
-                message = parse_raw_message(raw_message)
+            if on_connected is not None:
+                on_connected()
+            last_heartbeat_at = loop.time()
+
+            async for raw_message in read_stream_lines(response.body, heartbeat_timeout):
+                message, raw_data = self._parse_stream_message(raw_message, keep_raw_data)
 
                 if is_heartbeat(message):
+                    if on_heartbeat is not None:
+                        now = loop.time()
+                        on_heartbeat(now - last_heartbeat_at)
+                        last_heartbeat_at = now
                     continue
 
                 if is_stream_error(message):
                     raise ServerError(f'{message["payload"]["error"]}.')
 
                 if is_event(message):
-                    event = Event.parse(message['payload'])
+                    event = Event.parse(message['payload'], raw_data)
+                    count += 1
+                    if count == limit:
+                        last_event = event
+                        break
                     yield event
                     continue
 
@@ -241,6 +1274,9 @@ class Client:
                     f'{message}.'
                 )
 
+        if last_event is not None:
+            yield last_event
+
     async def register_event_schema(self, event_type: str, json_schema: JsonDict) -> None:
         request_body = json.dumps({
             'eventType': event_type,
@@ -258,7 +1294,7 @@ class Client:
             if response.status_code != HTTPStatus.OK:
                 error_body = await response.body.read()
                 error_text = bytes.decode(error_body, encoding="utf-8")
-                raise ServerError(error_text)
+                raise ServerError(error_text, response.status_code)
 
     async def read_subjects(
         self,
@@ -308,7 +1344,7 @@ class Client:
             response_data = bytes.decode(response_data, encoding='utf-8')
 
             if response.status_code != HTTPStatus.OK:
-                raise ServerError(response_data)
+                raise ServerError(response_data, response.status_code)
 
             response_json = json.loads(response_data)
 
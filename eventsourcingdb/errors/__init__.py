@@ -1,11 +1,15 @@
+from .bulk_write_error import BulkWriteError
 from .client_error import ClientError
+from .conflict_error import ConflictError
 from .custom_error import CustomError
 from .internal_error import InternalError
 from .server_error import ServerError
 from .validation_error import ValidationError
 
 __all__ = [
+    "BulkWriteError",
     "ClientError",
+    "ConflictError",
     "CustomError",
     "InternalError",
     "ServerError",
@@ -0,0 +1,8 @@
+from .custom_error import CustomError
+
+
+class BulkWriteError(CustomError):
+    def __init__(self, cause: str, resume_offset: int, written_ranges: list[range]) -> None:
+        super().__init__(f"Bulk write error occurred at offset {resume_offset}: {cause}")
+        self.resume_offset = resume_offset
+        self.written_ranges = written_ranges
@@ -0,0 +1,5 @@
+from .server_error import ServerError
+
+
+class ConflictError(ServerError):
+    pass
@@ -2,5 +2,6 @@ from .custom_error import CustomError
 
 
 class ServerError(CustomError):
-    def __init__(self, cause: str) -> None:
+    def __init__(self, cause: str, status_code: int | None = None) -> None:
         super().__init__(f"Server error occurred: {cause}")
+        self.status_code = status_code
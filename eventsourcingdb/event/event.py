@@ -28,9 +28,10 @@ class Event:
     trace_parent: str | None = None
     trace_state: str | None = None
     signature: str | None = None
+    _raw_data: bytes | None = field(default=None, init=False, repr=False, compare=False)
 
     @staticmethod
-    def parse(unknown_object: dict) -> "Event":
+    def parse(unknown_object: dict, raw_data: bytes | None = None) -> "Event":
         source = unknown_object.get("source")
         if not isinstance(source, str):
             raise ValidationError(f"Failed to parse source '{source}' to string.")
@@ -104,6 +105,7 @@ class Event:
             signature=signature,
         )
         event._time_from_server = time_from_server
+        event._raw_data = raw_data
 
         return event
 
@@ -120,7 +122,9 @@ class Event:
         )
 
         metadata_bytes = metadata.encode("utf-8")
-        data_bytes = json.dumps(
+        data_bytes = self._raw_data
+        if data_bytes is None:
+            data_bytes = json.dumps(
                 self.data,
                 separators=(',', ':'),
                 indent=None,
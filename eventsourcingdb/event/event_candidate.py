@@ -1,4 +1,5 @@
-from dataclasses import dataclass
+import json
+from dataclasses import dataclass, field
 from typing import Any
 
 
@@ -7,21 +8,64 @@ class EventCandidate:
     source: str
     subject: str
     type: str
-    data: dict
+    data: dict | bytes
     trace_parent: str | None = None
     trace_state: str | None = None
+    _encoded: bytes | None = field(default=None, init=False, repr=False, compare=False)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        # Any change to a field invalidates the cached encoding of
+        # pre-encoded data.
+        if name != "_encoded":
+            object.__setattr__(self, "_encoded", None)
+        object.__setattr__(self, name, value)
 
     def to_json(self) -> dict[str, Any]:
-        json = {
-            "data": self.data,
+        json_object = {
+            "data": json.loads(self.data) if isinstance(self.data, bytes) else self.data,
             "source": self.source,
             "subject": self.subject,
             "type": self.type,
         }
 
         if self.trace_parent is not None:
-            json["traceparent"] = self.trace_parent
+            json_object["traceparent"] = self.trace_parent
         if self.trace_state is not None:
-            json["tracestate"] = self.trace_state
+            json_object["tracestate"] = self.trace_state
+
+        return json_object
+
+    def encode(self) -> bytes:
+        """
+        Return the candidate as JSON bytes.
+
+        If data is given as bytes, it must already be a serialized JSON object,
+        and is spliced into the result as is. Since bytes can not change, their
+        encoding is cached until a field is reassigned. Data dicts may be
+        modified in place, so they are encoded again on every call.
+        """
+        if self._encoded is not None:
+            return self._encoded
+
+        data_bytes = (
+            self.data
+            if isinstance(self.data, bytes)
+            else json.dumps(self.data).encode("utf-8")
+        )
+
+        metadata: dict[str, str] = {
+            "source": self.source,
+            "subject": self.subject,
+            "type": self.type,
+        }
+        if self.trace_parent is not None:
+            metadata["traceparent"] = self.trace_parent
+        if self.trace_state is not None:
+            metadata["tracestate"] = self.trace_state
+
+        encoded_metadata = json.dumps(metadata).encode("utf-8")
+        encoded = b'{"data":' + data_bytes + b"," + encoded_metadata[1:]
 
-        return json
+        if isinstance(self.data, bytes):
+            self._encoded = encoded
+        return encoded
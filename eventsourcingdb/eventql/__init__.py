@@ -0,0 +1,13 @@
+from .aggregation_queries import (
+    get_count_by_type_query,
+    get_count_events_query,
+    get_subject_condition,
+    get_subject_exists_query,
+)
+
+__all__ = [
+    "get_count_by_type_query",
+    "get_count_events_query",
+    "get_subject_condition",
+    "get_subject_exists_query",
+]
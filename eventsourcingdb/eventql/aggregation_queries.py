@@ -0,0 +1,48 @@
+import json
+
+
+def get_subject_condition(subject: str, recursive: bool) -> str | None:
+    """
+    Return an EventQL condition matching the subject, or None if it matches everything.
+
+    Nested subjects are matched by a range over the subject string instead of
+    a prefix pattern: every subject below /books/ sorts between "/books/" and
+    "/books0", since "0" directly follows "/" in code point order.
+    """
+    escaped_subject = json.dumps(subject)
+
+    if not recursive:
+        return f"e.subject == {escaped_subject}"
+
+    if subject == "/":
+        return None
+
+    prefix = subject.rstrip("/")
+    return (
+        f"(e.subject == {json.dumps(prefix)} OR "
+        f"(e.subject >= {json.dumps(prefix + '/')} AND e.subject < {json.dumps(prefix + '0')}))"
+    )
+
+
+def get_where_clause(subject: str, recursive: bool) -> str:
+    condition = get_subject_condition(subject, recursive)
+    if condition is None:
+        return ""
+
+    return f"WHERE {condition} "
+
+
+def get_count_events_query(subject: str, recursive: bool) -> str:
+    return f"FROM e IN events {get_where_clause(subject, recursive)}PROJECT INTO COUNT()"
+
+
+def get_subject_exists_query(subject: str, recursive: bool) -> str:
+    return f"FROM e IN events {get_where_clause(subject, recursive)}TOP 1 PROJECT INTO e.id"
+
+
+def get_count_by_type_query(subject: str, recursive: bool) -> str:
+    return (
+        f"FROM e IN events {get_where_clause(subject, recursive)}"
+        "GROUP BY e.type "
+        "PROJECT INTO { type: e.type, count: COUNT() }"
+    )
@@ -1,3 +1,4 @@
+from collections.abc import AsyncIterable
 from types import TracebackType
 from typing import Self
 
@@ -50,7 +51,11 @@ class HttpClient:
 
         return f'{first_without_trailing_slash}/{rest_joined}'
 
-    async def post(self, path: str, request_body: str) -> Response:
+    async def post(
+        self,
+        path: str,
+        request_body: str | bytes | AsyncIterable[bytes],
+    ) -> Response:
         if self.__session is None:
             await self.__initialize()
 
@@ -0,0 +1,35 @@
+import json
+import os
+
+from .errors import ValidationError
+
+
+def read_json_file(path: str, description: str) -> dict:
+    """
+    Read a JSON object from a file, returning an empty one if the file is missing.
+
+    The description names the content in the error raised for malformed files.
+    """
+    try:
+        with open(path, encoding="utf-8") as file:
+            content = json.load(file)
+    except FileNotFoundError:
+        return {}
+    except json.JSONDecodeError as error:
+        raise ValidationError(f"Failed to parse {description} in '{path}'.") from error
+
+    if not isinstance(content, dict):
+        raise ValidationError(f"Failed to parse {description} in '{path}'.")
+
+    return content
+
+
+def write_json_file(path: str, content: dict) -> None:
+    # Write to a temporary file first, so that a crash never leaves a
+    # truncated file behind.
+    temporary_path = f"{path}.tmp"
+    with open(temporary_path, "w", encoding="utf-8") as file:
+        json.dump(content, file)
+        file.flush()
+        os.fsync(file.fileno())
+    os.replace(temporary_path, path)
@@ -1,9 +1,21 @@
+from .catch_up_progress import CatchUpProgress
+from .get_catch_up_read_options import get_catch_up_read_options
+from .get_continuation_options import get_continuation_options
 from .if_event_is_missing_during_observe import IfEventIsMissingDuringObserve
 from .observe_events_options import ObserveEventsOptions
 from .observe_from_latest_event import ObserveFromLatestEvent
+from .observe_hub import ObserveHub
+from .reconnect_info import ReconnectInfo
+from .subject_router import SubjectRouter
 
 __all__ = [
+    "CatchUpProgress",
     "IfEventIsMissingDuringObserve",
     "ObserveEventsOptions",
     "ObserveFromLatestEvent",
+    "ObserveHub",
+    "ReconnectInfo",
+    "SubjectRouter",
+    "get_catch_up_read_options",
+    "get_continuation_options",
 ]
@@ -0,0 +1,10 @@
+from dataclasses import dataclass
+
+
+@dataclass
+class CatchUpProgress:
+    position: str | None
+    target: str | None
+    read_count: int
+    lag: int
+    is_caught_up: bool
@@ -0,0 +1,37 @@
+from ..bound import Bound, BoundType
+from ..read_events import (
+    IfEventIsMissingDuringRead,
+    ReadEventsOptions,
+    ReadFromLatestEvent,
+)
+from .if_event_is_missing_during_observe import IfEventIsMissingDuringObserve
+from .observe_events_options import ObserveEventsOptions
+
+
+def get_catch_up_read_options(
+    options: ObserveEventsOptions,
+    target_event_id: str,
+) -> ReadEventsOptions:
+    """Return options that read what observing would replay, up to the given event."""
+    from_latest_event = None
+    if options.from_latest_event is not None:
+        # If the event is missing, observing waits for it, so there is no
+        # history to read. Observing with the original options then waits.
+        if_event_is_missing = IfEventIsMissingDuringRead.READ_NOTHING
+        if options.from_latest_event.if_event_is_missing == (
+            IfEventIsMissingDuringObserve.READ_EVERYTHING
+        ):
+            if_event_is_missing = IfEventIsMissingDuringRead.READ_EVERYTHING
+
+        from_latest_event = ReadFromLatestEvent(
+            subject=options.from_latest_event.subject,
+            type=options.from_latest_event.type,
+            if_event_is_missing=if_event_is_missing,
+        )
+
+    return ReadEventsOptions(
+        recursive=options.recursive,
+        lower_bound=options.lower_bound,
+        upper_bound=Bound(id=target_event_id, type=BoundType.INCLUSIVE),
+        from_latest_event=from_latest_event,
+    )
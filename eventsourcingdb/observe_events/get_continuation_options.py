@@ -0,0 +1,18 @@
+import dataclasses
+
+from ..bound import Bound, BoundType
+from .observe_events_options import ObserveEventsOptions
+
+
+def get_continuation_options(
+    options: ObserveEventsOptions,
+    last_event_id: str,
+) -> ObserveEventsOptions:
+    """Return options that continue observing right after the given event."""
+    # Once an event has been observed, the bound replaces from_latest_event,
+    # since the two can not be combined.
+    return dataclasses.replace(
+        options,
+        lower_bound=Bound(id=last_event_id, type=BoundType.EXCLUSIVE),
+        from_latest_event=None,
+    )
@@ -0,0 +1,217 @@
+import asyncio
+import contextlib
+import json
+from collections.abc import AsyncGenerator
+from types import TracebackType
+from typing import TYPE_CHECKING, Self
+
+from ..bound import Bound, BoundType
+from ..errors import ClientError, ValidationError
+from ..event import Event
+from ..read_events import ReadEventsOptions
+from ..retry_policy import RetryPolicy
+from .observe_events_options import ObserveEventsOptions
+
+if TYPE_CHECKING:
+    from ..client import Client
+
+
+class _Upstream:
+    def __init__(self) -> None:
+        self.queues: list[asyncio.Queue[Event]] = []
+        self.position: str | None = None
+        self.task: asyncio.Task[None] | None = None
+
+
+class ObserveHub:
+    """
+    Shares one observe_events subscription per subject and options among local consumers.
+
+    Each consumer gets its own queue of up to max_queue_size events. The
+    upstream subscription hands every event to all queues, so a consumer
+    whose queue is full holds back the others until it catches up. The
+    upstream is opened with the first consumer and closed with the last.
+
+    A consumer that joins late starts at the hub's current position. If it
+    passes a lower_bound, the events from there up to the current position
+    are replayed with read_events first, and then it switches to the shared
+    subscription without a gap or duplicate. Events of the subscription
+    that lie before the bound, e.g. because the consumer is the first one,
+    are skipped.
+    """
+
+    def __init__(
+        self,
+        client: "Client",
+        max_queue_size: int = 1_000,
+        reconnect: RetryPolicy | None = None,
+    ) -> None:
+        if max_queue_size < 1:
+            raise ValidationError("max_queue_size must be at least 1.")
+
+        self.__client = client
+        self.__max_queue_size = max_queue_size
+        self.__reconnect = reconnect
+        self.__upstreams: dict[tuple[str, str], _Upstream] = {}
+        self.__is_closing = False
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None = None,
+        exc_val: BaseException | None = None,
+        exc_tb: TracebackType | None = None,
+    ) -> None:
+        await self.close()
+
+    async def subscribe(
+        self,
+        subject: str,
+        options: ObserveEventsOptions,
+        lower_bound: Bound | None = None,
+    ) -> AsyncGenerator[Event, None]:
+        if self.__is_closing:
+            raise ClientError("ObserveHub is closed.")
+
+        options.validate()
+        key = (subject, json.dumps(options.to_json(), sort_keys=True))
+        upstream = self.__upstreams.get(key)
+        if upstream is None or (upstream.task is not None and upstream.task.done()):
+            upstream = _Upstream()
+            upstream.task = asyncio.get_running_loop().create_task(
+                self.__run_upstream(upstream, subject, options)
+            )
+            self.__upstreams[key] = upstream
+
+        queue: asyncio.Queue[Event] = asyncio.Queue(self.__max_queue_size)
+        try:
+            if lower_bound is not None:
+                async for event in self.__replay(upstream, subject, options, lower_bound):
+                    yield event
+
+            # There is no await between the replay reaching the upstream's
+            # position and registering the queue, so no event is missed.
+            upstream.queues.append(queue)
+
+            while True:
+                event = await self.__get_next_event(upstream, queue)
+                if event is None:
+                    return
+
+                # The upstream may not have reached the bound yet, e.g. for
+                # the first consumer, so earlier events are skipped.
+                if lower_bound is not None and not self.__is_before(lower_bound, event.event_id):
+                    continue
+                yield event
+        finally:
+            self.__unsubscribe(key, upstream, queue)
+
+    async def close(self) -> None:
+        """Close all upstream subscriptions, which ends all consumers."""
+        self.__is_closing = True
+
+        tasks = [upstream.task for upstream in self.__upstreams.values() if upstream.task]
+        self.__upstreams.clear()
+
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def __run_upstream(
+        self,
+        upstream: _Upstream,
+        subject: str,
+        options: ObserveEventsOptions,
+    ) -> None:
+        async with contextlib.aclosing(self.__client.observe_events(
+            subject, options, reconnect=self.__reconnect
+        )) as events:
+            async for event in events:
+                # Position and recipients are taken together, so a consumer
+                # that registers while this event is handed out has already
+                # replayed it.
+                upstream.position = event.event_id
+                for queue in list(upstream.queues):
+                    await queue.put(event)
+
+    async def __replay(
+        self,
+        upstream: _Upstream,
+        subject: str,
+        options: ObserveEventsOptions,
+        lower_bound: Bound,
+    ) -> AsyncGenerator[Event, None]:
+        bound = lower_bound
+
+        while upstream.position is not None and self.__is_before(bound, upstream.position):
+            replayed_count = 0
+            async with contextlib.aclosing(self.__client.read_events(
+                subject,
+                ReadEventsOptions(
+                    recursive=options.recursive,
+                    lower_bound=bound,
+                    upper_bound=Bound(id=upstream.position, type=BoundType.INCLUSIVE),
+                ),
+            )) as events:
+                async for event in events:
+                    yield event
+                    bound = Bound(id=event.event_id, type=BoundType.EXCLUSIVE)
+                    replayed_count += 1
+
+            if replayed_count == 0:
+                return
+
+    @staticmethod
+    def __is_before(bound: Bound, position: str) -> bool:
+        if bound.type == BoundType.INCLUSIVE:
+            return int(bound.id) <= int(position)
+        return int(bound.id) < int(position)
+
+    @staticmethod
+    async def __get_next_event(upstream: _Upstream, queue: asyncio.Queue[Event]) -> Event | None:
+        task = upstream.task
+        if task is None:
+            return None
+
+        while True:
+            if not queue.empty():
+                return queue.get_nowait()
+
+            if task.done():
+                if not task.cancelled():
+                    error = task.exception()
+                    if error is not None:
+                        raise error
+                return None
+
+            getter = asyncio.ensure_future(queue.get())
+            try:
+                await asyncio.wait([getter, task], return_when=asyncio.FIRST_COMPLETED)
+            finally:
+                if not getter.done():
+                    getter.cancel()
+
+            if getter.done() and not getter.cancelled():
+                return getter.result()
+
+    def __unsubscribe(
+        self,
+        key: tuple[str, str],
+        upstream: _Upstream,
+        queue: asyncio.Queue[Event],
+    ) -> None:
+        if queue in upstream.queues:
+            upstream.queues.remove(queue)
+
+        # Free the queue, in case the upstream is waiting to put into it.
+        while not queue.empty():
+            queue.get_nowait()
+
+        if upstream.queues or self.__upstreams.get(key) is not upstream:
+            return
+
+        del self.__upstreams[key]
+        if upstream.task is not None:
+            upstream.task.cancel()
@@ -0,0 +1,8 @@
+from dataclasses import dataclass
+
+
+@dataclass
+class ReconnectInfo:
+    reconnect_count: int
+    downtime: float
+    error: BaseException | None
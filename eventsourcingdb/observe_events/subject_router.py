@@ -0,0 +1,124 @@
+from collections.abc import Awaitable, Callable
+from typing import TYPE_CHECKING
+
+from ..errors import ValidationError
+from ..event import Event
+from ..retry_policy import RetryPolicy
+from .observe_events_options import ObserveEventsOptions
+
+if TYPE_CHECKING:
+    from ..client import Client
+
+EventHandler = Callable[[Event], Awaitable[None]]
+
+
+def _get_segments(subject: str) -> list[str]:
+    path = subject.strip("/")
+    if path == "":
+        return []
+    return path.split("/")
+
+
+class _SubjectTrieNode:
+    def __init__(self) -> None:
+        self.children: dict[str, _SubjectTrieNode] = {}
+        self.handlers: list[EventHandler] = []
+        self.recursive_handlers: list[EventHandler] = []
+
+
+class SubjectRouter:
+    """
+    Dispatches the events of a single recursive observe_events to handlers by subject.
+
+    Handlers are registered for a subject below the router's subject, either
+    for that subject only or, with recursive, for its whole subtree. They are
+    stored in a trie over the subject segments, so finding the handlers for an
+    event takes one step per segment of its subject, regardless of how many
+    handlers are registered.
+
+    Each event is handed to its handlers one after another, in the order they
+    were registered, before the next event is dispatched.
+    """
+
+    def __init__(
+        self,
+        client: "Client",
+        subject: str = "/",
+        reconnect: RetryPolicy | None = None,
+        heartbeat_timeout: float | None = None,
+    ) -> None:
+        self.__client = client
+        self.__subject = subject
+        self.__segments = _get_segments(subject)
+        self.__reconnect = reconnect
+        self.__heartbeat_timeout = heartbeat_timeout
+        self.__root = _SubjectTrieNode()
+
+    def add_handler(self, subject: str, handler: EventHandler, recursive: bool = True) -> None:
+        segments = _get_segments(subject)
+        if segments[:len(self.__segments)] != self.__segments:
+            raise ValidationError(
+                f"Subject '{subject}' is not within the router's subject '{self.__subject}'."
+            )
+
+        node = self.__root
+        for segment in segments:
+            node = node.children.setdefault(segment, _SubjectTrieNode())
+
+        if recursive:
+            node.recursive_handlers.append(handler)
+            return
+        node.handlers.append(handler)
+
+    def remove_handler(self, subject: str, handler: EventHandler) -> None:
+        path = [self.__root]
+        for segment in _get_segments(subject):
+            child = path[-1].children.get(segment)
+            if child is None:
+                return
+            path.append(child)
+
+        node = path[-1]
+        if handler in node.recursive_handlers:
+            node.recursive_handlers.remove(handler)
+        elif handler in node.handlers:
+            node.handlers.remove(handler)
+
+        # Prune nodes that no longer lead to any handler.
+        for segment, parent, child in zip(
+            reversed(_get_segments(subject)), reversed(path[:-1]), reversed(path[1:]), strict=True
+        ):
+            if child.children or child.handlers or child.recursive_handlers:
+                break
+            del parent.children[segment]
+
+    def get_handlers(self, subject: str) -> list[EventHandler]:
+        """Return the handlers for an event with the given subject, outermost first."""
+        node = self.__root
+        handlers = list(node.recursive_handlers)
+
+        for segment in _get_segments(subject):
+            child = node.children.get(segment)
+            if child is None:
+                return handlers
+            node = child
+            handlers.extend(node.recursive_handlers)
+
+        handlers.extend(node.handlers)
+        return handlers
+
+    async def run(self, options: ObserveEventsOptions | None = None) -> None:
+        """Observe the router's subject recursively and dispatch the events until cancelled."""
+        if options is None:
+            options = ObserveEventsOptions(recursive=True)
+        if not options.recursive:
+            raise ValidationError("SubjectRouter can only observe recursively.")
+
+        async for event in self.__client.observe_events(
+            self.__subject,
+            options,
+            reconnect=self.__reconnect,
+            heartbeat_timeout=self.__heartbeat_timeout,
+        ):
+            for handler in self.get_handlers(event.subject):
+                await handler(event)
@@ -0,0 +1,7 @@
+from .outbox import Outbox
+from .outbox_metrics import OutboxMetrics
+
+__all__ = [
+    "Outbox",
+    "OutboxMetrics",
+]
@@ -0,0 +1,435 @@
+import asyncio
+import json
+import os
+import time
+from collections import deque
+from collections.abc import Callable
+from dataclasses import dataclass
+from types import TracebackType
+from typing import TYPE_CHECKING, Self
+
+import aiohttp
+
+from ..errors import ClientError, CustomError, ServerError, ValidationError
+from ..event import EventCandidate
+from ..json_file import read_json_file, write_json_file
+from ..retry_policy import RetryPolicy
+from ..write_events import get_write_events_request_body, is_rejected_write
+from .outbox_metrics import OutboxMetrics
+
+if TYPE_CHECKING:
+    from ..client import Client
+
+EVENTS_PREFIX = b'"events":['
+LINE_SUFFIX = b"]}\n"
+
+
+@dataclass
+class _Entry:
+    end_offset: int
+    count: int
+    enqueued_at: float
+
+
+class Outbox:
+    """
+    Persists event candidates locally and writes them to the database in the background.
+
+    Each call to append stores its candidates as one line in an append-only
+    file and returns once the line has been synced to disk. Appends that
+    arrive while a sync is running are committed together with the next one.
+    A background flusher sends the stored lines to write_events in large
+    batches, and records the offset of the first undelivered line in a
+    sidecar file after each successful request.
+
+    Delivery is at least once: after a crash, everything after the recorded
+    offset is sent again, and a line that was only partially written is
+    dropped. The candidates of a single append are always written in the
+    same request, and appends are delivered in order.
+
+    Connection errors, timeouts and server errors are retried according to
+    retry_policy. Once its retries are exhausted, drain raises the error,
+    while the flusher keeps retrying. If the server rejects a batch as
+    invalid, its appends are sent one by one, and a rejected append is moved
+    to a dead-letter file and passed to on_rejected, so that it does not
+    block the appends after it.
+    """
+
+    def __init__(
+        self,
+        client: "Client",
+        path: str = "eventsourcingdb-outbox.jsonl",
+        max_batch_size: int = 1_000,
+        max_batch_bytes: int = 1_000_000,
+        retry_policy: RetryPolicy | None = None,
+        compact_threshold: int = 64_000_000,
+        dead_letter_path: str | None = None,
+        on_rejected: Callable[[list[dict], ServerError], None] | None = None,
+    ) -> None:
+        if max_batch_size < 1:
+            raise ValidationError("max_batch_size must be at least 1.")
+        if max_batch_bytes < 1:
+            raise ValidationError("max_batch_bytes must be at least 1.")
+
+        if retry_policy is None:
+            retry_policy = RetryPolicy()
+        retry_policy.validate()
+
+        self.__client = client
+        self.__path = path
+        self.__offset_path = f"{path}.offset"
+        self.__dead_letter_path = dead_letter_path or f"{path}.dead-letter"
+        self.__on_rejected = on_rejected
+        self.__max_batch_size = max_batch_size
+        self.__max_batch_bytes = max_batch_bytes
+        self.__retry_policy = retry_policy
+        self.__compact_threshold = compact_threshold
+
+        self.__entries: deque[_Entry] = deque()
+        self.__delivered_offset = 0
+        self.__committed_offset = 0
+        self.__depth = 0
+        self.__delivered_count = 0
+        self.__rejected_count = 0
+        self.__last_error: str | None = None
+        self.__delivery_error: BaseException | None = None
+        # Appends up to this offset are sent one by one, to find out which of
+        # them the server rejects.
+        self.__isolated_end_offset = 0
+        self.__is_committing = False
+
+        self.__pending_lines: list[tuple[bytes, int, float, asyncio.Future[None]]] = []
+        self.__file_lock = asyncio.Lock()
+        self.__appended = asyncio.Event()
+        self.__committed = asyncio.Event()
+        self.__delivered = asyncio.Event()
+        self.__committer: asyncio.Task[None] | None = None
+        self.__flusher: asyncio.Task[None] | None = None
+        self.__is_closing = False
+
+    async def __aenter__(self) -> Self:
+        await self.open()
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None = None,
+        exc_val: BaseException | None = None,
+        exc_tb: TracebackType | None = None,
+    ) -> None:
+        await self.close()
+
+    @property
+    def metrics(self) -> OutboxMetrics:
+        lag = 0.0
+        if self.__entries:
+            lag = max(0.0, time.time() - self.__entries[0].enqueued_at)
+
+        return OutboxMetrics(
+            depth=self.__depth,
+            pending_bytes=self.__committed_offset - self.__delivered_offset,
+            lag=lag,
+            delivered_count=self.__delivered_count,
+            rejected_count=self.__rejected_count,
+            last_error=self.__last_error,
+        )
+
+    async def open(self) -> None:
+        """Recover undelivered lines from disk and start delivering them."""
+        if self.__flusher is not None:
+            return
+
+        self.__delivered_offset, entries = await asyncio.to_thread(self.__recover)
+        self.__entries.extend(entries)
+        self.__depth = sum(entry.count for entry in entries)
+        self.__committed_offset = entries[-1].end_offset if entries else self.__delivered_offset
+
+        loop = asyncio.get_running_loop()
+        self.__committer = loop.create_task(self.__run_committer())
+        self.__flusher = loop.create_task(self.__run_flusher())
+
+    async def append(self, event_candidates: list[EventCandidate]) -> None:
+        """Store the candidates durably, without waiting for them to be written."""
+        if self.__is_closing:
+            raise ClientError("Outbox is closed.")
+        if self.__committer is None:
+            raise ClientError("Outbox is not open.")
+        if not event_candidates:
+            return
+
+        enqueued_at = time.time()
+        line = b"".join([
+            f'{{"enqueuedAt":{enqueued_at!r},'.encode(),
+            EVENTS_PREFIX,
+            b",".join(event_candidate.encode() for event_candidate in event_candidates),
+            LINE_SUFFIX,
+        ])
+
+        future = asyncio.get_running_loop().create_future()
+        self.__pending_lines.append((line, len(event_candidates), enqueued_at, future))
+        self.__appended.set()
+
+        await future
+
+    async def drain(self) -> None:
+        """
+        Wait until everything appended so far has been written to the database.
+
+        Rejected appends count as done. If delivery keeps failing until the
+        retries of retry_policy are exhausted, the last error is raised.
+        """
+        while self.__pending_lines or self.__is_committing or self.__entries:
+            if self.__delivery_error is not None:
+                raise self.__delivery_error
+            self.__delivered.clear()
+            await self.__delivered.wait()
+
+    async def close(self) -> None:
+        """
+        Sync all pending appends to disk and stop the flusher.
+
+        Lines that have not been delivered yet stay in the file and are sent
+        the next time the outbox is opened. Call drain first to deliver them.
+        """
+        self.__is_closing = True
+        self.__appended.set()
+
+        if self.__committer is not None:
+            await self.__committer
+            self.__committer = None
+
+        if self.__flusher is not None:
+            self.__flusher.cancel()
+            try:
+                await self.__flusher
+            except asyncio.CancelledError:
+                pass
+            self.__flusher = None
+
+    async def __run_committer(self) -> None:
+        while True:
+            while not self.__pending_lines:
+                if self.__is_closing:
+                    return
+                self.__appended.clear()
+                await self.__appended.wait()
+
+            # Everything appended while the previous sync was running is
+            # committed with a single write and fsync.
+            pending_lines, self.__pending_lines = self.__pending_lines, []
+            self.__is_committing = True
+
+            try:
+                async with self.__file_lock:
+                    await asyncio.to_thread(
+                        self.__append_lines, [line for line, _, _, _ in pending_lines]
+                    )
+            except OSError as error:
+                self.__is_committing = False
+                for _, _, _, future in pending_lines:
+                    if not future.done():
+                        future.set_exception(error)
+                self.__delivered.set()
+                continue
+
+            for line, count, enqueued_at, future in pending_lines:
+                self.__committed_offset += len(line)
+                self.__entries.append(_Entry(self.__committed_offset, count, enqueued_at))
+                self.__depth += count
+                if not future.done():
+                    future.set_result(None)
+
+            self.__is_committing = False
+            self.__committed.set()
+
+    async def __run_flusher(self) -> None:
+        attempt = 0
+
+        while True:
+            while not self.__entries:
+                self.__committed.clear()
+                await self.__committed.wait()
+
+            start_offset = self.__delivered_offset
+            if start_offset < self.__isolated_end_offset:
+                batch = [self.__entries[0]]
+            else:
+                batch = self.__take_batch()
+            end_offset = batch[-1].end_offset
+
+            data = b""
+            try:
+                data = await asyncio.to_thread(self.__read, start_offset, end_offset)
+                await self.__client._post_write_events(
+                    get_write_events_request_body(self.__get_encoded_events(data), [])
+                )
+            except (CustomError, aiohttp.ClientError, OSError, TimeoutError) as error:
+                self.__last_error = str(error)
+
+                if isinstance(error, ServerError) and is_rejected_write(error):
+                    attempt = 0
+                    if len(batch) > 1:
+                        self.__isolated_end_offset = end_offset
+                        continue
+
+                    await asyncio.to_thread(self.__write_dead_letter, data, error)
+                    if self.__on_rejected is not None:
+                        self.__on_rejected(json.loads(data)["events"], error)
+                    await self.__advance(batch, end_offset, is_rejected=True)
+                    continue
+
+                if attempt >= self.__retry_policy.max_retries:
+                    # Wake up drain, so that it can report the error. Delivery
+                    # goes on, in case the database becomes available again.
+                    self.__delivery_error = error
+                    self.__delivered.set()
+
+                await asyncio.sleep(
+                    self.__retry_policy.get_delay(min(attempt, self.__retry_policy.max_retries))
+                )
+                attempt += 1
+                continue
+
+            attempt = 0
+            self.__last_error = None
+            self.__delivery_error = None
+            await self.__advance(batch, end_offset, is_rejected=False)
+
+    async def __advance(self, batch: list[_Entry], end_offset: int, is_rejected: bool) -> None:
+        for entry in batch:
+            self.__entries.popleft()
+            self.__depth -= entry.count
+            if is_rejected:
+                self.__rejected_count += entry.count
+            else:
+                self.__delivered_count += entry.count
+        self.__delivered_offset = end_offset
+
+        async with self.__file_lock:
+            await asyncio.to_thread(self.__write_offset, end_offset)
+            if not self.__entries and not self.__pending_lines and (
+                end_offset >= self.__compact_threshold
+            ):
+                await asyncio.to_thread(self.__compact)
+
+        self.__delivered.set()
+
+    def __take_batch(self) -> list[_Entry]:
+        batch: list[_Entry] = []
+        count = 0
+        start_offset = self.__delivered_offset
+
+        for entry in self.__entries:
+            if batch and (
+                count + entry.count > self.__max_batch_size
+                or entry.end_offset - start_offset > self.__max_batch_bytes
+            ):
+                break
+            batch.append(entry)
+            count += entry.count
+
+        return batch
+
+    @staticmethod
+    def __get_encoded_events(data: bytes) -> list[bytes]:
+        encoded_events = []
+        for line in data.splitlines(keepends=True):
+            start = line.index(EVENTS_PREFIX) + len(EVENTS_PREFIX)
+            encoded_events.append(line[start:-len(LINE_SUFFIX)])
+        return encoded_events
+
+    def __append_lines(self, lines: list[bytes]) -> None:
+        # The file is written without a buffer, so that after a failure no
+        # buffered bytes can end up in the file once it has been truncated.
+        file_descriptor = os.open(self.__path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        try:
+            data = memoryview(b"".join(lines))
+            while data:
+                data = data[os.write(file_descriptor, data):]
+            os.fsync(file_descriptor)
+        except OSError:
+            # A partial write would shift the offsets of all following lines,
+            # so the file is cut back to the last committed line.
+            os.ftruncate(file_descriptor, self.__committed_offset)
+            raise
+        finally:
+            os.close(file_descriptor)
+
+    def __write_dead_letter(self, line: bytes, error: ServerError) -> None:
+        rejected_line = b"".join([
+            f'{{"rejectedAt":{time.time()!r},"error":{json.dumps(str(error))},'.encode(),
+            line[1:],
+        ])
+
+        with open(self.__dead_letter_path, "ab") as file:
+            file.write(rejected_line)
+            file.flush()
+            os.fsync(file.fileno())
+
+    def __read(self, start_offset: int, end_offset: int) -> bytes:
+        with open(self.__path, "rb") as file:
+            file.seek(start_offset)
+            return file.read(end_offset - start_offset)
+
+    def __write_offset(self, offset: int) -> None:
+        write_json_file(self.__offset_path, {"offset": offset})
+
+    def __compact(self) -> None:
+        # Everything has been delivered, so the file can start over. If the
+        # process crashes before the offset is reset, recovery notices that
+        # the offset lies beyond the end of the file.
+        with open(self.__path, "r+b") as file:
+            file.truncate(0)
+            file.flush()
+            os.fsync(file.fileno())
+        self.__write_offset(0)
+        self.__delivered_offset = 0
+        self.__committed_offset = 0
+        self.__isolated_end_offset = 0
+
+    def __read_offset(self) -> int:
+        state = read_json_file(self.__offset_path, "outbox offset")
+        if not state:
+            return 0
+
+        offset = state.get("offset")
+        if not isinstance(offset, int) or offset < 0:
+            raise ValidationError(f"Failed to parse outbox offset in '{self.__offset_path}'.")
+
+        return offset
+
+    def __recover(self) -> tuple[int, list[_Entry]]:
+        offset = self.__read_offset()
+
+        try:
+            with open(self.__path, "rb") as file:
+                file.seek(0, os.SEEK_END)
+                if offset > file.tell():
+                    offset = 0
+                file.seek(offset)
+                data = file.read()
+        except FileNotFoundError:
+            return 0, []
+
+        entries = []
+        end_offset = offset
+        for line in data.splitlines(keepends=True):
+            try:
+                if not line.endswith(b"\n"):
+                    raise ValueError("Line is incomplete.")
+                unknown_object = json.loads(line)
+                count = len(unknown_object["events"])
+                enqueued_at = float(unknown_object["enqueuedAt"])
+            except (ValueError, KeyError, TypeError):
+                # The process crashed while this line was being written, so
+                # it was never acknowledged and can be dropped.
+                with open(self.__path, "r+b") as file:
+                    file.truncate(end_offset)
+                    file.flush()
+                    os.fsync(file.fileno())
+                break
+
+            end_offset += len(line)
+            entries.append(_Entry(end_offset, count, enqueued_at))
+
+        return offset, entries
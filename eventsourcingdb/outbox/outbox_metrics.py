@@ -0,0 +1,11 @@
+from dataclasses import dataclass
+
+
+@dataclass
+class OutboxMetrics:
+    depth: int
+    pending_bytes: int
+    lag: float
+    delivered_count: int
+    rejected_count: int
+    last_error: str | None
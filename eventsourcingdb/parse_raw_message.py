@@ -1,8 +1,20 @@
 import json
+import re
 from typing import Any
 
 from .errors.server_error import ServerError
 
+# The first match is taken as the data key of the event payload. A key always
+# follows a brace, comma or whitespace, so a quote preceded by a backslash is
+# an escaped one within a string and is skipped.
+# If the match still turns out to be something else, e.g. a key nested within
+# data that appears before the data key itself, the payload's data is not the
+# null spliced in for it, and parse_raw_message_with_raw_data falls back to
+# parsing the whole message.
+DATA_KEY_PATTERN = re.compile(r'(?<!\\)"data"\s*:\s*')
+
+json_decoder = json.JSONDecoder()
+
 
 def parse_raw_message(raw_message: bytes) -> Any:
     decoded_message: str
@@ -15,3 +27,40 @@ def parse_raw_message(raw_message: bytes) -> Any:
         return json.loads(decoded_message)
     except Exception as error:
         raise ServerError(str(error)) from error
+
+
+def parse_raw_message_with_raw_data(raw_message: bytes) -> tuple[Any, bytes | None]:
+    """
+    Parse a stream message and keep the exact bytes of the event data.
+
+    The data value is decoded only once, and its original bytes are returned
+    alongside the message, so that hashes can be computed over what the server
+    sent instead of a re-serialization. If the message does not contain a data
+    value, the raw data is None.
+    """
+    decoded_message: str
+    try:
+        decoded_message = raw_message.decode("utf8")
+    except Exception as error:
+        raise ServerError(str(error)) from error
+
+    data_key_match = DATA_KEY_PATTERN.search(decoded_message)
+    if data_key_match is None:
+        return parse_raw_message(raw_message), None
+
+    data_start = data_key_match.end()
+    try:
+        data, data_end = json_decoder.raw_decode(decoded_message, data_start)
+        message = json.loads(
+            f"{decoded_message[:data_start]}null{decoded_message[data_end:]}"
+        )
+    except Exception as error:
+        raise ServerError(str(error)) from error
+
+    payload = message.get("payload") if isinstance(message, dict) else None
+    if not isinstance(payload, dict) or "data" not in payload or payload["data"] is not None:
+        return parse_raw_message(raw_message), None
+
+    payload["data"] = data
+
+    return message, decoded_message[data_start:data_end].encode("utf8")
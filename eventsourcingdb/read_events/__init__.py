@@ -1,11 +1,20 @@
+from .event_page import EventPage
+from .get_continuation_options import get_continuation_options
+from .get_id_partitions import get_id_partitions
 from .if_event_is_missing_during_read import IfEventIsMissingDuringRead
 from .order import Order
+from .page_cursor import decode_page_cursor, encode_page_cursor
 from .read_events_options import ReadEventsOptions
 from .read_from_latest_event import ReadFromLatestEvent
 
 __all__ = [
+    "EventPage",
     "IfEventIsMissingDuringRead",
     "Order",
     "ReadEventsOptions",
     "ReadFromLatestEvent",
+    "decode_page_cursor",
+    "encode_page_cursor",
+    "get_continuation_options",
+    "get_id_partitions",
 ]
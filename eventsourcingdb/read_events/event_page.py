@@ -0,0 +1,9 @@
+from dataclasses import dataclass
+
+from ..event.event import Event
+
+
+@dataclass
+class EventPage:
+    events: list[Event]
+    next_cursor: str | None
@@ -0,0 +1,20 @@
+import dataclasses
+
+from ..bound import Bound, BoundType
+from .order import Order
+from .read_events_options import ReadEventsOptions
+
+
+def get_continuation_options(
+    options: ReadEventsOptions,
+    last_event_id: str,
+) -> ReadEventsOptions:
+    """Return options that continue a read right after the given event, in its order."""
+    bound = Bound(id=last_event_id, type=BoundType.EXCLUSIVE)
+
+    # Once an event has been read, the bound replaces from_latest_event,
+    # since the two can not be combined.
+    if options.order == Order.ANTICHRONOLOGICAL:
+        return dataclasses.replace(options, upper_bound=bound, from_latest_event=None)
+
+    return dataclasses.replace(options, lower_bound=bound, from_latest_event=None)
@@ -0,0 +1,21 @@
+from ..errors.validation_error import ValidationError
+
+
+def get_id_partitions(lower_id: int, upper_id: int, count: int) -> list[tuple[int, int]]:
+    """Split the inclusive id range into at most count contiguous, inclusive ranges."""
+    if count < 1:
+        raise ValidationError("count must be at least 1.")
+    if upper_id < lower_id:
+        return []
+
+    size = upper_id - lower_id + 1
+    count = min(count, size)
+
+    partitions = []
+    start = lower_id
+    for index in range(count):
+        end = start + size // count + (1 if index < size % count else 0) - 1
+        partitions.append((start, end))
+        start = end + 1
+
+    return partitions
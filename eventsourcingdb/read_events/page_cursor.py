@@ -0,0 +1,23 @@
+import base64
+import binascii
+import json
+
+from ..errors.validation_error import ValidationError
+
+
+def encode_page_cursor(last_event_id: str) -> str:
+    encoded_cursor = json.dumps({"id": last_event_id}).encode("utf-8")
+    return base64.urlsafe_b64encode(encoded_cursor).decode("ascii")
+
+
+def decode_page_cursor(cursor: str) -> str:
+    """Return the id of the last event of the previous page."""
+    try:
+        unknown_object = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+    except (ValueError, binascii.Error) as error:
+        raise ValidationError(f"Failed to parse cursor '{cursor}'.") from error
+
+    if not isinstance(unknown_object, dict) or not isinstance(unknown_object.get("id"), str):
+        raise ValidationError(f"Failed to parse cursor '{cursor}'.")
+
+    return unknown_object["id"]
@@ -0,0 +1,29 @@
+import asyncio
+from collections.abc import AsyncGenerator
+
+from aiohttp import StreamReader
+
+
+async def read_stream_lines(
+    body: StreamReader,
+    timeout: float | None = None,
+) -> AsyncGenerator[bytes, None]:
+    """
+    Yield the lines of a response body, failing if none arrives in time.
+
+    The timeout only applies while waiting for the next line, so a slow
+    consumer never causes it to expire.
+    """
+    while True:
+        try:
+            async with asyncio.timeout(timeout):
+                line = await body.readline()
+        except TimeoutError as error:
+            raise TimeoutError(
+                f"No heartbeat or data received within {timeout} seconds."
+            ) from error
+
+        if not line:
+            return
+
+        yield line
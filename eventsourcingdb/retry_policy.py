@@ -0,0 +1,32 @@
+import secrets
+from dataclasses import dataclass
+
+from .errors import ValidationError
+
+system_random = secrets.SystemRandom()
+
+
+@dataclass
+class RetryPolicy:
+    max_retries: int = 5
+    initial_delay: float = 0.05
+    max_delay: float = 2.0
+    multiplier: float = 2.0
+    jitter: bool = True
+
+    def validate(self) -> None:
+        if self.max_retries < 0:
+            raise ValidationError("RetryPolicy is invalid: max_retries must not be negative.")
+
+        if self.initial_delay < 0 or self.max_delay < 0:
+            raise ValidationError("RetryPolicy is invalid: delays must not be negative.")
+
+    def get_delay(self, attempt: int) -> float:
+        """Return the delay before the given retry, starting at attempt 0."""
+        delay = min(self.max_delay, self.initial_delay * self.multiplier ** attempt)
+
+        if self.jitter:
+            # Full jitter spreads retries of competing clients over the window.
+            return system_random.uniform(0, delay)
+
+        return delay
@@ -0,0 +1,6 @@
+from .subject_head_cache import SubjectHead, SubjectHeadCache
+
+__all__ = [
+    "SubjectHead",
+    "SubjectHeadCache",
+]
@@ -0,0 +1,42 @@
+from collections import OrderedDict
+from collections.abc import Hashable
+from dataclasses import dataclass
+from typing import Any
+
+from ..errors import ValidationError
+
+
+@dataclass
+class SubjectHead:
+    event_id: str | None
+    state: Any
+
+
+class SubjectHeadCache:
+    """Keeps the latest known event id and folded state per key, evicting the least recently used."""
+
+    def __init__(self, max_size: int = 10_000) -> None:
+        if max_size < 1:
+            raise ValidationError("max_size must be at least 1.")
+
+        self.__max_size = max_size
+        self.__heads: OrderedDict[Hashable, SubjectHead] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self.__heads)
+
+    def get(self, key: Hashable) -> SubjectHead | None:
+        head = self.__heads.get(key)
+        if head is not None:
+            self.__heads.move_to_end(key)
+        return head
+
+    def set(self, key: Hashable, head: SubjectHead) -> None:
+        self.__heads[key] = head
+        self.__heads.move_to_end(key)
+
+        while len(self.__heads) > self.__max_size:
+            self.__heads.popitem(last=False)
+
+    def clear(self) -> None:
+        self.__heads.clear()
@@ -0,0 +1,12 @@
+from .checkpoint_store import CheckpointStore, FileCheckpointStore
+from .partitioned_worker_pool import PartitionedWorkerPool
+from .sqlite_checkpoint_store import SqliteCheckpointStore
+from .subscription import Subscription
+
+__all__ = [
+    "CheckpointStore",
+    "FileCheckpointStore",
+    "PartitionedWorkerPool",
+    "SqliteCheckpointStore",
+    "Subscription",
+]
@@ -0,0 +1,45 @@
+import asyncio
+from abc import ABC, abstractmethod
+
+from ..errors import ValidationError
+from ..json_file import read_json_file, write_json_file
+
+
+class CheckpointStore(ABC):
+    @abstractmethod
+    async def load(self, name: str) -> str | None:
+        ...
+
+    @abstractmethod
+    async def save(self, name: str, event_id: str) -> None:
+        ...
+
+
+class FileCheckpointStore(CheckpointStore):
+    """Stores the checkpoints of all subscriptions in a single JSON file on local disk."""
+
+    def __init__(self, path: str = "eventsourcingdb-checkpoints.json") -> None:
+        self.__path = path
+        self.__lock = asyncio.Lock()
+
+    async def load(self, name: str) -> str | None:
+        async with self.__lock:
+            checkpoints = await asyncio.to_thread(self.__read)
+
+        event_id = checkpoints.get(name)
+        if event_id is not None and not isinstance(event_id, str):
+            raise ValidationError(f"Failed to parse checkpoint '{name}' in '{self.__path}'.")
+
+        return event_id
+
+    async def save(self, name: str, event_id: str) -> None:
+        async with self.__lock:
+            checkpoints = await asyncio.to_thread(self.__read)
+            checkpoints[name] = event_id
+            await asyncio.to_thread(self.__write, checkpoints)
+
+    def __read(self) -> dict:
+        return read_json_file(self.__path, "checkpoints")
+
+    def __write(self, checkpoints: dict) -> None:
+        write_json_file(self.__path, checkpoints)
@@ -0,0 +1,189 @@
+import asyncio
+import contextlib
+import zlib
+from collections import deque
+from collections.abc import Awaitable, Callable
+from concurrent.futures import Executor
+from inspect import isawaitable
+from types import TracebackType
+from typing import Self
+
+from ..errors import ClientError, ValidationError
+from ..event import Event
+
+EventHandler = Callable[[Event], Awaitable[None] | None]
+
+
+class PartitionedWorkerPool:
+    """
+    Handles events concurrently, while keeping the order of events per subject.
+
+    Each event is assigned to one of worker_count workers by the CRC-32 of its
+    subject, and each worker handles its events one after another. Events of
+    the same subject are therefore handled in the order they were dispatched,
+    while events of other subjects are handled in parallel. If an executor is
+    given, e.g. a ProcessPoolExecutor, the handler is called on it, so it must
+    be a regular function, and for processes, it and the events must be
+    picklable.
+
+    The watermark is the id of the latest dispatched event for which this
+    event and all events dispatched before it have been handled, which makes
+    it safe to use as a checkpoint. If the handler fails, the watermark stops
+    before the failed event, and the error is raised by the next call to
+    dispatch or join, or right away by wait_for_error.
+    """
+
+    def __init__(
+        self,
+        handler: EventHandler,
+        worker_count: int = 8,
+        max_queue_size: int = 100,
+        executor: Executor | None = None,
+    ) -> None:
+        if worker_count < 1:
+            raise ValidationError("worker_count must be at least 1.")
+        if max_queue_size < 1:
+            raise ValidationError("max_queue_size must be at least 1.")
+
+        self.__handler = handler
+        self.__worker_count = worker_count
+        self.__max_queue_size = max_queue_size
+        self.__executor = executor
+        self.__queues: list[asyncio.Queue[Event]] = []
+        self.__workers: list[asyncio.Task[None]] = []
+        self.__dispatched_event_ids: deque[str] = deque()
+        self.__handled_event_ids: set[str] = set()
+        self.__watermark: str | None = None
+        self.__error: BaseException | None = None
+        self.__failed: asyncio.Future[None] | None = None
+        self.__is_closing = False
+
+    async def __aenter__(self) -> Self:
+        self.__start()
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None = None,
+        exc_val: BaseException | None = None,
+        exc_tb: TracebackType | None = None,
+    ) -> None:
+        if exc_type is not None:
+            # Events that are still queued are not covered by the watermark,
+            # so they can be dropped instead of delaying the error.
+            await self.__stop()
+            return
+
+        await self.close()
+
+    @property
+    def watermark(self) -> str | None:
+        return self.__watermark
+
+    def get_partition(self, subject: str) -> int:
+        return zlib.crc32(subject.encode("utf-8")) % self.__worker_count
+
+    async def dispatch(self, event: Event) -> None:
+        """Queue an event for its worker, waiting while the worker's queue is full."""
+        if self.__is_closing:
+            raise ClientError("PartitionedWorkerPool is closed.")
+        self.__raise_error()
+
+        self.__start()
+        self.__dispatched_event_ids.append(event.event_id)
+        await self.__queues[self.get_partition(event.subject)].put(event)
+
+    async def join(self) -> None:
+        """Wait until all dispatched events have been handled."""
+        for queue in self.__queues:
+            await queue.join()
+        self.__raise_error()
+
+    async def wait_for_error(self) -> None:
+        """Wait until the handler fails, and raise its error."""
+        self.__start()
+        if self.__failed is not None:
+            # Shielded, so that a cancelled waiter does not cancel the future
+            # shared by all waiters.
+            await asyncio.shield(self.__failed)
+        self.__raise_error()
+
+    async def close(self) -> None:
+        """Handle all dispatched events and stop the workers."""
+        self.__is_closing = True
+        try:
+            await self.join()
+        finally:
+            await self.__stop()
+
+    def __start(self) -> None:
+        if self.__workers:
+            return
+
+        loop = asyncio.get_running_loop()
+        self.__failed = loop.create_future()
+        for _ in range(self.__worker_count):
+            queue: asyncio.Queue[Event] = asyncio.Queue(self.__max_queue_size)
+            self.__queues.append(queue)
+            self.__workers.append(loop.create_task(self.__work(queue)))
+
+    async def __stop(self) -> None:
+        for worker in self.__workers:
+            worker.cancel()
+        for worker in self.__workers:
+            with contextlib.suppress(asyncio.CancelledError):
+                await worker
+
+    async def __work(self, queue: asyncio.Queue[Event]) -> None:
+        loop = asyncio.get_running_loop()
+
+        while True:
+            event = await queue.get()
+
+            # After a failure, events are only taken from the queue, so that
+            # dispatch does not block, but no longer handled.
+            if self.__error is not None:
+                queue.task_done()
+                continue
+
+            # Run the handler as a task, so that any error it raises can be
+            # handed over to dispatch and join instead of ending the worker.
+            handle_task = loop.create_task(self.__handle(event))
+            try:
+                await asyncio.wait([handle_task])
+            finally:
+                handle_task.cancel()
+                queue.task_done()
+
+            error = handle_task.exception()
+            if error is not None:
+                self.__error = error
+                if self.__failed is not None and not self.__failed.done():
+                    self.__failed.set_result(None)
+                continue
+            self.__mark_handled(event.event_id)
+
+    async def __handle(self, event: Event) -> None:
+        if self.__executor is not None:
+            await asyncio.get_running_loop().run_in_executor(
+                self.__executor, self.__handler, event
+            )
+            return
+
+        result = self.__handler(event)
+        if isawaitable(result):
+            await result
+
+    def __mark_handled(self, event_id: str) -> None:
+        self.__handled_event_ids.add(event_id)
+
+        while (
+            self.__dispatched_event_ids
+            and self.__dispatched_event_ids[0] in self.__handled_event_ids
+        ):
+            self.__watermark = self.__dispatched_event_ids.popleft()
+            self.__handled_event_ids.remove(self.__watermark)
+
+    def __raise_error(self) -> None:
+        if self.__error is not None:
+            raise self.__error
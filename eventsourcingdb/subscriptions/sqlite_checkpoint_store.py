@@ -0,0 +1,62 @@
+import asyncio
+import sqlite3
+
+from .checkpoint_store import CheckpointStore
+
+
+class SqliteCheckpointStore(CheckpointStore):
+    """
+    Stores the checkpoints of all subscriptions in a table of an SQLite database.
+
+    Each checkpoint is a single row, so saving it does not rewrite the others,
+    and several processes can share the database. The table is created on
+    first use.
+    """
+
+    def __init__(self, path: str = "eventsourcingdb-checkpoints.sqlite3") -> None:
+        self.__path = path
+        self.__lock = asyncio.Lock()
+        self.__is_initialized = False
+
+    async def load(self, name: str) -> str | None:
+        async with self.__lock:
+            return await asyncio.to_thread(self.__load, name)
+
+    async def save(self, name: str, event_id: str) -> None:
+        async with self.__lock:
+            await asyncio.to_thread(self.__save, name, event_id)
+
+    def __connect(self) -> sqlite3.Connection:
+        connection = sqlite3.connect(self.__path)
+        if not self.__is_initialized:
+            with connection:
+                connection.execute(
+                    "CREATE TABLE IF NOT EXISTS checkpoints "
+                    "(name TEXT PRIMARY KEY, event_id TEXT NOT NULL)"
+                )
+            self.__is_initialized = True
+
+        return connection
+
+    def __load(self, name: str) -> str | None:
+        connection = self.__connect()
+        try:
+            row = connection.execute(
+                "SELECT event_id FROM checkpoints WHERE name = ?", (name,)
+            ).fetchone()
+        finally:
+            connection.close()
+
+        return None if row is None else row[0]
+
+    def __save(self, name: str, event_id: str) -> None:
+        connection = self.__connect()
+        try:
+            with connection:
+                connection.execute(
+                    "INSERT INTO checkpoints (name, event_id) VALUES (?, ?) "
+                    "ON CONFLICT (name) DO UPDATE SET event_id = excluded.event_id",
+                    (name, event_id),
+                )
+        finally:
+            connection.close()
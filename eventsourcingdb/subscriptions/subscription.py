@@ -0,0 +1,201 @@
+import asyncio
+import contextlib
+from collections.abc import AsyncIterator
+from concurrent.futures import Executor
+from inspect import isawaitable
+from typing import TYPE_CHECKING
+
+from ..errors import ValidationError
+from ..event import Event
+from ..observe_events import ObserveEventsOptions, get_continuation_options
+from ..retry_policy import RetryPolicy
+from .checkpoint_store import CheckpointStore
+from .partitioned_worker_pool import EventHandler, PartitionedWorkerPool
+
+if TYPE_CHECKING:
+    from ..client import Client
+
+
+class Subscription:
+    """
+    Observes events with a handler and keeps its position in a checkpoint store.
+
+    The position is the id of the last event the handler has finished. It is
+    saved once commit_every events have been handled since the last save, every
+    commit_interval seconds, and when run ends. When run is called again, e.g.
+    after a restart, observing resumes right after the saved position, so each
+    event is handled at least once, and events handled after the last save are
+    handled again after a crash.
+
+    If catch_up is set, the events that exist when run is called are read
+    with observe_events_with_catch_up first, which is faster for a long
+    backlog.
+
+    With a worker_count above 1 or an executor, events are handled by a
+    PartitionedWorkerPool, in parallel across subjects, and the position is
+    its watermark.
+    """
+
+    def __init__(
+        self,
+        client: "Client",
+        name: str,
+        subject: str,
+        options: ObserveEventsOptions,
+        checkpoint_store: CheckpointStore,
+        commit_every: int = 100,
+        commit_interval: float | None = 1.0,
+        reconnect: RetryPolicy | None = None,
+        heartbeat_timeout: float | None = None,
+        catch_up: bool = False,
+        worker_count: int = 1,
+        executor: Executor | None = None,
+    ) -> None:
+        if commit_every < 1:
+            raise ValidationError("commit_every must be at least 1.")
+        if worker_count < 1:
+            raise ValidationError("worker_count must be at least 1.")
+        if commit_interval is not None and commit_interval <= 0:
+            raise ValidationError("commit_interval must be greater than 0.")
+
+        self.__client = client
+        self.__name = name
+        self.__subject = subject
+        self.__options = options
+        self.__checkpoint_store = checkpoint_store
+        self.__commit_every = commit_every
+        self.__commit_interval = commit_interval
+        self.__reconnect = reconnect
+        self.__heartbeat_timeout = heartbeat_timeout
+        self.__catch_up = catch_up
+        self.__worker_count = worker_count
+        self.__executor = executor
+        self.__pool: PartitionedWorkerPool | None = None
+        self.__position: str | None = None
+        self.__committed_position: str | None = None
+        self.__uncommitted_count = 0
+        self.__commit_lock = asyncio.Lock()
+
+    @property
+    def position(self) -> str | None:
+        if self.__pool is not None and self.__pool.watermark is not None:
+            return self.__pool.watermark
+        return self.__position
+
+    @property
+    def committed_position(self) -> str | None:
+        return self.__committed_position
+
+    async def run(self, handler: EventHandler) -> None:
+        """Handle events from the saved position on, until cancelled or observing fails."""
+        position = await self.__checkpoint_store.load(self.__name)
+        self.__position = position
+        self.__committed_position = position
+        self.__uncommitted_count = 0
+
+        options = self.__options
+        if position is not None:
+            options = get_continuation_options(options, position)
+
+        committer = None
+        if self.__commit_interval is not None:
+            committer = asyncio.get_running_loop().create_task(
+                self.__commit_periodically(self.__commit_interval)
+            )
+
+        try:
+            observe_events = self.__client.observe_events
+            if self.__catch_up:
+                observe_events = self.__client.observe_events_with_catch_up
+
+            async with contextlib.aclosing(observe_events(
+                self.__subject,
+                options,
+                reconnect=self.__reconnect,
+                heartbeat_timeout=self.__heartbeat_timeout,
+            )) as events:
+                if self.__worker_count == 1 and self.__executor is None:
+                    await self.__handle_sequentially(events, handler)
+                else:
+                    await self.__handle_in_parallel(events, handler)
+        finally:
+            if committer is not None:
+                committer.cancel()
+                with contextlib.suppress(asyncio.CancelledError):
+                    await committer
+
+            # Save the events handled so far, even if the handler has failed.
+            await self.commit()
+
+            self.__position = self.position
+            self.__pool = None
+
+    async def commit(self) -> None:
+        """Save the current position, unless it has been saved already."""
+        async with self.__commit_lock:
+            position = self.position
+            if position is None or position == self.__committed_position:
+                return
+
+            self.__uncommitted_count = 0
+            await self.__checkpoint_store.save(self.__name, position)
+            self.__committed_position = position
+
+    async def __handle_sequentially(
+        self,
+        events: AsyncIterator[Event],
+        handler: EventHandler,
+    ) -> None:
+        async for event in events:
+            result = handler(event)
+            if isawaitable(result):
+                await result
+
+            self.__position = event.event_id
+            await self.__count_uncommitted_event()
+
+    async def __handle_in_parallel(
+        self,
+        events: AsyncIterator[Event],
+        handler: EventHandler,
+    ) -> None:
+        async with PartitionedWorkerPool(
+            handler, self.__worker_count, executor=self.__executor
+        ) as pool:
+            self.__pool = pool
+
+            # The handler runs in the background, so its errors are waited for
+            # alongside the next event. Otherwise, a failure would only end run
+            # once another event arrives, which may never happen.
+            loop = asyncio.get_running_loop()
+            failure = loop.create_task(pool.wait_for_error())
+            try:
+                while True:
+                    next_event = asyncio.ensure_future(anext(events))
+                    await asyncio.wait([next_event, failure], return_when=asyncio.FIRST_COMPLETED)
+
+                    if failure.done():
+                        next_event.cancel()
+                        with contextlib.suppress(asyncio.CancelledError, StopAsyncIteration):
+                            await next_event
+                        failure.result()
+
+                    try:
+                        event = next_event.result()
+                    except StopAsyncIteration:
+                        return
+
+                    await pool.dispatch(event)
+                    await self.__count_uncommitted_event()
+            finally:
+                failure.cancel()
+
+    async def __count_uncommitted_event(self) -> None:
+        self.__uncommitted_count += 1
+        if self.__uncommitted_count >= self.__commit_every:
+            await self.commit()
+
+    async def __commit_periodically(self, interval: float) -> None:
+        while True:
+            await asyncio.sleep(interval)
+            await self.commit()
@@ -0,0 +1,20 @@
+from .audit_events import AuditResult, audit_events
+from .verification_checkpoint import VerificationCheckpoint
+from .verification_checkpoint_store import (
+    FileVerificationCheckpointStore,
+    VerificationCheckpointStore,
+)
+from .verify_events import VerificationResult, verify_hashes, verify_signatures
+from .verify_hash_chain import verify_hash_chain
+
+__all__ = [
+    "AuditResult",
+    "FileVerificationCheckpointStore",
+    "VerificationCheckpoint",
+    "VerificationCheckpointStore",
+    "VerificationResult",
+    "audit_events",
+    "verify_hash_chain",
+    "verify_hashes",
+    "verify_signatures",
+]
@@ -0,0 +1,83 @@
+from concurrent.futures import Executor
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from cryptography.hazmat.primitives.asymmetric.ed25519 import Ed25519PublicKey
+
+from ..bound import Bound, BoundType
+from ..errors.validation_error import ValidationError
+from ..read_events import ReadEventsOptions
+from .verification_checkpoint import VerificationCheckpoint
+from .verification_checkpoint_store import VerificationCheckpointStore
+from .verify_hash_chain import verify_hash_chain
+
+if TYPE_CHECKING:
+    from ..client import Client
+
+
+@dataclass
+class AuditResult:
+    verified_count: int
+    checkpoint: VerificationCheckpoint | None
+
+
+async def audit_events(
+    client: "Client",
+    subject: str,
+    checkpoint_store: VerificationCheckpointStore,
+    recursive: bool = False,
+    verification_key: Ed25519PublicKey | None = None,
+    executor: Executor | None = None,
+    checkpoint_interval: int = 10_000,
+) -> AuditResult:
+    """
+    Verify the events of a subject that were written since the last audit.
+
+    Reading starts after the checkpoint stored for the subject, and the chain
+    must continue from the stored hash. The checkpoint is advanced every
+    checkpoint_interval events and once all events have been verified, so the
+    audit time is proportional to the number of new events.
+
+    Args:
+        client: The client to read events with
+        subject: The subject to audit
+        checkpoint_store: The store that keeps the last verified event per subject
+        recursive: Whether to include the events of nested subjects
+        verification_key: Optional public key to verify signatures in addition to hashes
+        executor: Optional executor to compute hashes on
+        checkpoint_interval: Number of verified events after which to save the checkpoint
+
+    Returns:
+        The number of newly verified events and the checkpoint after the audit
+    """
+    if checkpoint_interval < 1:
+        raise ValidationError("checkpoint_interval must be at least 1.")
+
+    checkpoint = await checkpoint_store.load(subject)
+    lower_bound = (
+        None if checkpoint is None else Bound(id=checkpoint.event_id, type=BoundType.EXCLUSIVE)
+    )
+
+    events = client.read_events(
+        subject,
+        ReadEventsOptions(recursive=recursive, lower_bound=lower_bound),
+        keep_raw_data=True,
+    )
+
+    verified_count = 0
+    async for event in verify_hash_chain(
+        events,
+        executor=executor,
+        start_after=checkpoint,
+        verification_key=verification_key,
+    ):
+        checkpoint = VerificationCheckpoint(event_id=event.event_id, hash=event.hash)
+        verified_count += 1
+
+        if verified_count % checkpoint_interval == 0:
+            await checkpoint_store.save(subject, checkpoint)
+
+    if checkpoint is not None and verified_count % checkpoint_interval != 0:
+        await checkpoint_store.save(subject, checkpoint)
+
+    return AuditResult(verified_count=verified_count, checkpoint=checkpoint)
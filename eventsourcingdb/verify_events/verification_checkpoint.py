@@ -0,0 +1,28 @@
+from dataclasses import dataclass
+from typing import Any
+
+from ..errors.validation_error import ValidationError
+
+
+@dataclass
+class VerificationCheckpoint:
+    event_id: str
+    hash: str
+
+    @staticmethod
+    def parse(unknown_object: Any) -> "VerificationCheckpoint":
+        if not isinstance(unknown_object, dict):
+            raise ValidationError(f"Failed to parse checkpoint '{unknown_object}' to object.")
+
+        event_id = unknown_object.get("id")
+        if not isinstance(event_id, str):
+            raise ValidationError(f"Failed to parse event_id '{event_id}' to string.")
+
+        event_hash = unknown_object.get("hash")
+        if not isinstance(event_hash, str):
+            raise ValidationError(f"Failed to parse hash '{event_hash}' to string.")
+
+        return VerificationCheckpoint(event_id=event_id, hash=event_hash)
+
+    def to_json(self) -> dict[str, str]:
+        return {"id": self.event_id, "hash": self.hash}
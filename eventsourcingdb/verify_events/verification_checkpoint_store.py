@@ -0,0 +1,45 @@
+import asyncio
+from abc import ABC, abstractmethod
+
+from ..json_file import read_json_file, write_json_file
+from .verification_checkpoint import VerificationCheckpoint
+
+
+class VerificationCheckpointStore(ABC):
+    @abstractmethod
+    async def load(self, subject: str) -> VerificationCheckpoint | None:
+        ...
+
+    @abstractmethod
+    async def save(self, subject: str, checkpoint: VerificationCheckpoint) -> None:
+        ...
+
+
+class FileVerificationCheckpointStore(VerificationCheckpointStore):
+    """Stores the checkpoints of all subjects in a single JSON file on local disk."""
+
+    def __init__(self, path: str = "eventsourcingdb-verification.json") -> None:
+        self.__path = path
+        self.__lock = asyncio.Lock()
+
+    async def load(self, subject: str) -> VerificationCheckpoint | None:
+        async with self.__lock:
+            checkpoints = await asyncio.to_thread(self.__read)
+
+        unknown_checkpoint = checkpoints.get(subject)
+        if unknown_checkpoint is None:
+            return None
+
+        return VerificationCheckpoint.parse(unknown_checkpoint)
+
+    async def save(self, subject: str, checkpoint: VerificationCheckpoint) -> None:
+        async with self.__lock:
+            checkpoints = await asyncio.to_thread(self.__read)
+            checkpoints[subject] = checkpoint.to_json()
+            await asyncio.to_thread(self.__write, checkpoints)
+
+    def __read(self) -> dict:
+        return read_json_file(self.__path, "verification checkpoints")
+
+    def __write(self, checkpoints: dict) -> None:
+        write_json_file(self.__path, checkpoints)
@@ -0,0 +1,115 @@
+import asyncio
+from collections.abc import Callable, Iterable, Sequence
+from concurrent.futures import Executor, ThreadPoolExecutor
+from dataclasses import dataclass
+
+from cryptography.hazmat.primitives.asymmetric.ed25519 import Ed25519PublicKey
+
+from ..errors.validation_error import ValidationError
+from ..event.event import Event
+
+
+@dataclass
+class VerificationResult:
+    event: Event
+    error: ValidationError | None = None
+
+    @property
+    def is_valid(self) -> bool:
+        return self.error is None
+
+
+def _verify_chunk(
+    events: Sequence[Event],
+    verify: Callable[[Event], None],
+) -> list[VerificationResult]:
+    results = []
+    for event in events:
+        try:
+            verify(event)
+        except ValidationError as error:
+            results.append(VerificationResult(event, error))
+            continue
+
+        results.append(VerificationResult(event))
+    return results
+
+
+async def _verify_in_parallel(
+    events: Iterable[Event],
+    verify: Callable[[Event], None],
+    executor: Executor | None,
+    chunk_size: int,
+) -> list[VerificationResult]:
+    if chunk_size < 1:
+        raise ValidationError("chunk_size must be at least 1.")
+
+    event_list = list(events)
+    chunks = [
+        event_list[offset:offset + chunk_size]
+        for offset in range(0, len(event_list), chunk_size)
+    ]
+    loop = asyncio.get_running_loop()
+
+    if executor is not None:
+        chunk_results = await asyncio.gather(*[
+            loop.run_in_executor(executor, _verify_chunk, chunk, verify) for chunk in chunks
+        ])
+    else:
+        with ThreadPoolExecutor() as own_executor:
+            chunk_results = await asyncio.gather(*[
+                loop.run_in_executor(own_executor, _verify_chunk, chunk, verify)
+                for chunk in chunks
+            ])
+
+    return [result for chunk_result in chunk_results for result in chunk_result]
+
+
+async def verify_hashes(
+    events: Iterable[Event],
+    executor: Executor | None = None,
+    chunk_size: int = 256,
+) -> list[VerificationResult]:
+    """
+    Verify the hashes of many events on a thread pool.
+
+    Args:
+        events: The events to verify
+        executor: Optional executor to use instead of a temporary thread pool
+        chunk_size: Number of events handed to a worker at once
+
+    Returns:
+        One VerificationResult per event, in the order of the given events
+    """
+    return await _verify_in_parallel(
+        events,
+        lambda event: event.verify_hash(),
+        executor,
+        chunk_size,
+    )
+
+
+async def verify_signatures(
+    events: Iterable[Event],
+    verification_key: Ed25519PublicKey,
+    executor: Executor | None = None,
+    chunk_size: int = 256,
+) -> list[VerificationResult]:
+    """
+    Verify the hashes and signatures of many events on a thread pool.
+
+    Args:
+        events: The events to verify
+        verification_key: The public key matching the server's signing key
+        executor: Optional executor to use instead of a temporary thread pool
+        chunk_size: Number of events handed to a worker at once
+
+    Returns:
+        One VerificationResult per event, in the order of the given events
+    """
+    return await _verify_in_parallel(
+        events,
+        lambda event: event.verify_signature(verification_key),
+        executor,
+        chunk_size,
+    )
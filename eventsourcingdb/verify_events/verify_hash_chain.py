@@ -0,0 +1,178 @@
+import asyncio
+from collections import deque
+from collections.abc import AsyncGenerator, AsyncIterable
+from concurrent.futures import Executor
+
+from cryptography.hazmat.primitives.asymmetric.ed25519 import Ed25519PublicKey
+
+from ..errors.validation_error import ValidationError
+from ..event.event import Event
+from .verification_checkpoint import VerificationCheckpoint
+
+GENESIS_PREDECESSOR_HASH = "0" * 64
+
+HASH_ERROR = "Failed to verify hash."
+SIGNATURE_ERROR = "Failed to verify signature."
+
+
+def _parse_event_id(event_id: str) -> int | None:
+    try:
+        return int(event_id)
+    except ValueError:
+        return None
+
+
+class _ChainTracker:
+    """Checks order and predecessor links, remembering only the previous event."""
+
+    def __init__(self, start_after: VerificationCheckpoint | None) -> None:
+        self.__previous_id: int | None = None
+        self.__previous_event_id = ""
+        self.__previous_hash = ""
+        self.__previous_predecessor_hash: str | None = None
+        self.__direction = 0
+
+        if start_after is not None:
+            self.__previous_id = _parse_event_id(start_after.event_id)
+            self.__previous_event_id = start_after.event_id
+            self.__previous_hash = start_after.hash
+            self.__direction = 1
+
+    def remember(self, event: Event) -> None:
+        self.__previous_id = _parse_event_id(event.event_id)
+        self.__previous_event_id = event.event_id
+        self.__previous_hash = event.hash
+        self.__previous_predecessor_hash = event.predecessor_hash
+
+    def get_error(self, current: Event) -> str | None:
+        current_id = _parse_event_id(current.event_id)
+
+        if current_id == 0 and current.predecessor_hash != GENESIS_PREDECESSOR_HASH:
+            return "The first event must not have a predecessor."
+
+        previous_id = self.__previous_id
+        if previous_id is None or current_id is None:
+            return None
+
+        direction = 1 if current_id > previous_id else -1
+        if current_id == previous_id or direction == -self.__direction:
+            return f"Event id is out of order after event '{self.__previous_event_id}'."
+        self.__direction = direction
+
+        # Predecessor links span the whole database, so they can only be checked
+        # for events that are adjacent by id, in either reading direction.
+        if current_id == previous_id + 1 and current.predecessor_hash != self.__previous_hash:
+            return (
+                f"Predecessor hash does not match hash of event '{self.__previous_event_id}'."
+            )
+        if (
+            previous_id == current_id + 1
+            and self.__previous_predecessor_hash is not None
+            and self.__previous_predecessor_hash != current.hash
+        ):
+            return (
+                f"Predecessor hash of event '{self.__previous_event_id}' does not match hash."
+            )
+
+        return None
+
+
+def _get_chain_error(position: int, event: Event, reason: str) -> ValidationError:
+    return ValidationError(
+        f"Failed to verify hash chain at position {position} "
+        f"(event '{event.event_id}'): {reason}"
+    )
+
+
+async def verify_hash_chain(
+    events: AsyncIterable[Event],
+    executor: Executor | None = None,
+    max_pending: int = 64,
+    start_after: VerificationCheckpoint | None = None,
+    verification_key: Ed25519PublicKey | None = None,
+) -> AsyncGenerator[Event, None]:
+    """
+    Verify the hash of each event and the link to its predecessor while streaming.
+
+    Events are yielded only after they have been verified, so the first break
+    in the chain raises a ValidationError that names its position in the
+    stream and the id of the offending event. Only the previous event is kept
+    for the link check, so memory stays constant regardless of stream length.
+
+    Args:
+        events: An async iterable of events, e.g. the result of read_events
+        executor: Optional executor to compute hashes on, e.g. for large payloads
+        max_pending: Maximum number of events hashed ahead when using an executor
+        start_after: Optional checkpoint of an already verified event the stream continues
+        verification_key: Optional public key to verify signatures in addition to hashes
+
+    Returns:
+        An async generator yielding the verified events in their original order
+    """
+    if max_pending < 1:
+        raise ValidationError("max_pending must be at least 1.")
+
+    tracker = _ChainTracker(start_after)
+    position = 0
+
+    def verify(event: Event) -> None:
+        if verification_key is None:
+            event.verify_hash()
+            return
+        event.verify_signature(verification_key)
+
+    verify_error = HASH_ERROR if verification_key is None else SIGNATURE_ERROR
+
+    if executor is None:
+        async for event in events:
+            try:
+                verify(event)
+            except ValidationError as error:
+                raise _get_chain_error(position, event, verify_error) from error
+
+            link_error = tracker.get_error(event)
+            if link_error is not None:
+                raise _get_chain_error(position, event, link_error)
+
+            yield event
+            tracker.remember(event)
+            position += 1
+        return
+
+    loop = asyncio.get_running_loop()
+    pending: deque[tuple[int, Event, asyncio.Future[None]]] = deque()
+
+    try:
+        async for event in events:
+            link_error = tracker.get_error(event)
+            if link_error is not None:
+                # Earlier events may still be hashing; their failures come first.
+                while pending:
+                    yield await _await_verification(pending, verify_error)
+                raise _get_chain_error(position, event, link_error)
+
+            pending.append((position, event, loop.run_in_executor(executor, verify, event)))
+            tracker.remember(event)
+            position += 1
+
+            while len(pending) >= max_pending:
+                yield await _await_verification(pending, verify_error)
+
+        while pending:
+            yield await _await_verification(pending, verify_error)
+    finally:
+        for _, _, future in pending:
+            future.cancel()
+
+
+async def _await_verification(
+    pending: deque[tuple[int, Event, asyncio.Future[None]]],
+    verify_error: str,
+) -> Event:
+    position, event, future = pending.popleft()
+    try:
+        await future
+    except ValidationError as error:
+        raise _get_chain_error(position, event, verify_error) from error
+
+    return event
@@ -1,3 +1,12 @@
+from .bulk_write_progress import BulkWriteProgress
+from .event_writer import EventWriter
+from .get_bulk_chunks import BulkChunk, get_bulk_chunks
+from .get_write_events_request_body import (
+    get_write_events_request_body,
+    stream_write_events_request_body,
+)
+from .is_rejected_write import is_rejected_write
+from .pipelined_writer import PipelinedWriter
 from .preconditions import (
     IsEventQlQueryTrue,
     IsSubjectOnEventId,
@@ -5,11 +14,21 @@ from .preconditions import (
     IsSubjectPristine,
     Precondition,
 )
+from .write_acknowledgement import WriteAcknowledgement
 
 __all__ = [
+    "BulkChunk",
+    "BulkWriteProgress",
+    "EventWriter",
     "IsEventQlQueryTrue",
     "IsSubjectOnEventId",
     "IsSubjectPopulated",
     "IsSubjectPristine",
+    "PipelinedWriter",
     "Precondition",
+    "WriteAcknowledgement",
+    "get_bulk_chunks",
+    "get_write_events_request_body",
+    "is_rejected_write",
+    "stream_write_events_request_body",
 ]
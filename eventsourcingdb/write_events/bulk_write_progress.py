@@ -0,0 +1,7 @@
+from dataclasses import dataclass
+
+
+@dataclass
+class BulkWriteProgress:
+    written_count: int
+    chunk_count: int
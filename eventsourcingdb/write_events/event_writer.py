@@ -0,0 +1,247 @@
+import asyncio
+from dataclasses import dataclass, field
+from types import TracebackType
+from typing import TYPE_CHECKING, Self
+
+from ..errors import ClientError, ValidationError
+from ..event import Event, EventCandidate
+from .get_write_events_request_body import get_write_events_request_body
+from .is_rejected_write import is_rejected_write
+from .preconditions import Precondition
+
+if TYPE_CHECKING:
+    from ..client import Client
+
+
+@dataclass
+class _PendingWrite:
+    event_candidates: list[EventCandidate]
+    encoded_event_candidates: list[bytes]
+    preconditions: list[Precondition]
+    size: int
+    enqueued_at: float
+    future: asyncio.Future[list[Event]] = field(repr=False)
+
+
+class EventWriter:
+    """
+    Coalesces concurrent writes into as few write_events requests as possible.
+
+    Writes are queued and flushed as one request once the batch is full, its
+    encoded size reaches the byte limit, or the oldest write has waited for
+    max_delay seconds. Only one request is in flight at a time, so writes are
+    sent in the order they were made, and the writes queued in the meantime
+    form the next batch. The batch size shrinks when requests take longer than
+    target_latency and grows again when they are fast.
+
+    Writes with preconditions are never combined with other writes, since the
+    preconditions apply to the request as a whole. If the server rejects a
+    batch with a client error status, its writes are retried one by one.
+    """
+
+    def __init__(
+        self,
+        client: "Client",
+        max_batch_size: int = 1_000,
+        max_batch_bytes: int = 1_000_000,
+        max_delay: float = 0.005,
+        target_latency: float = 0.1,
+    ) -> None:
+        if max_batch_size < 1:
+            raise ValidationError("max_batch_size must be at least 1.")
+        if max_batch_bytes < 1:
+            raise ValidationError("max_batch_bytes must be at least 1.")
+
+        self.__client = client
+        self.__max_batch_size = max_batch_size
+        self.__max_batch_bytes = max_batch_bytes
+        self.__max_delay = max_delay
+        self.__target_latency = target_latency
+        self.__batch_size = max_batch_size
+        self.__pending: list[_PendingWrite] = []
+        self.__changed = asyncio.Event()
+        self.__task: asyncio.Task[None] | None = None
+        self.__is_closing = False
+
+    async def __aenter__(self) -> Self:
+        self.__start()
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None = None,
+        exc_val: BaseException | None = None,
+        exc_tb: TracebackType | None = None,
+    ) -> None:
+        await self.close()
+
+    @property
+    def batch_size(self) -> int:
+        return self.__batch_size
+
+    async def write(
+        self,
+        event_candidates: list[EventCandidate],
+        preconditions: list[Precondition] | None = None,
+    ) -> list[Event]:
+        if self.__is_closing:
+            raise ClientError("EventWriter is closed.")
+
+        self.__start()
+
+        # The candidates are encoded once here, and the result is used both to
+        # size the batch and as the request body.
+        encoded_event_candidates = [
+            event_candidate.encode() for event_candidate in event_candidates
+        ]
+
+        loop = asyncio.get_running_loop()
+        pending_write = _PendingWrite(
+            event_candidates=list(event_candidates),
+            encoded_event_candidates=encoded_event_candidates,
+            preconditions=list(preconditions or []),
+            size=sum(len(encoded) for encoded in encoded_event_candidates),
+            enqueued_at=loop.time(),
+            future=loop.create_future(),
+        )
+        self.__pending.append(pending_write)
+        self.__changed.set()
+
+        return await pending_write.future
+
+    async def close(self) -> None:
+        """Flush all queued writes and stop the writer."""
+        self.__is_closing = True
+        self.__changed.set()
+
+        if self.__task is not None:
+            await self.__task
+            self.__task = None
+
+    def __start(self) -> None:
+        if self.__task is None:
+            self.__task = asyncio.get_running_loop().create_task(self.__run())
+
+    async def __run(self) -> None:
+        loop = asyncio.get_running_loop()
+
+        while True:
+            while not self.__pending:
+                if self.__is_closing:
+                    return
+                self.__changed.clear()
+                await self.__changed.wait()
+
+            deadline = self.__pending[0].enqueued_at + self.__max_delay
+            while not self.__is_batch_ready() and not self.__is_closing:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+
+                self.__changed.clear()
+                try:
+                    async with asyncio.timeout(timeout):
+                        await self.__changed.wait()
+                except TimeoutError:
+                    break
+
+            batch = self.__take_batch()
+            if batch:
+                await self.__flush(batch)
+
+    def __is_batch_ready(self) -> bool:
+        if self.__pending[0].preconditions:
+            return True
+
+        count = 0
+        size = 0
+        for pending_write in self.__pending:
+            if pending_write.preconditions:
+                return True
+            count += len(pending_write.event_candidates)
+            size += pending_write.size
+            if count >= self.__batch_size or size >= self.__max_batch_bytes:
+                return True
+
+        return False
+
+    def __take_batch(self) -> list[_PendingWrite]:
+        batch: list[_PendingWrite] = []
+        count = 0
+        size = 0
+
+        while self.__pending:
+            pending_write = self.__pending[0]
+            if pending_write.future.done():
+                # The caller has given up on this write before it was sent.
+                self.__pending.pop(0)
+                continue
+
+            if batch and (
+                pending_write.preconditions
+                or count + len(pending_write.event_candidates) > self.__batch_size
+                or size + pending_write.size > self.__max_batch_bytes
+            ):
+                break
+
+            batch.append(self.__pending.pop(0))
+            count += len(pending_write.event_candidates)
+            size += pending_write.size
+
+            if pending_write.preconditions:
+                break
+
+        return batch
+
+    async def __flush(self, batch: list[_PendingWrite]) -> None:
+        loop = asyncio.get_running_loop()
+        started_at = loop.time()
+
+        # Run the request as a task, so that any error it raises can be handed
+        # over to the waiting callers instead of ending the writer.
+        write_task = loop.create_task(self.__client._send_write_events(
+            get_write_events_request_body(
+                [
+                    encoded_event_candidate
+                    for pending_write in batch
+                    for encoded_event_candidate in pending_write.encoded_event_candidates
+                ],
+                batch[0].preconditions if len(batch) == 1 else [],
+            )
+        ))
+        await asyncio.wait([write_task])
+
+        error = write_task.exception()
+        if error is not None and is_rejected_write(error) and len(batch) > 1:
+            # The server rejected the batch as a whole, so nothing was written.
+            # Retry each write on its own, so that only the faulty one fails.
+            # Other errors, e.g. during an outage or after the batch may have
+            # been written, fail the whole batch.
+            for pending_write in batch:
+                await self.__flush([pending_write])
+            return
+        if error is not None:
+            for pending_write in batch:
+                if not pending_write.future.done():
+                    pending_write.future.set_exception(error)
+            return
+
+        self.__adapt_batch_size(loop.time() - started_at)
+
+        written_events = write_task.result()
+        offset = 0
+        for pending_write in batch:
+            count = len(pending_write.event_candidates)
+            if not pending_write.future.done():
+                pending_write.future.set_result(written_events[offset:offset + count])
+            offset += count
+
+    def __adapt_batch_size(self, latency: float) -> None:
+        if latency > self.__target_latency:
+            self.__batch_size = max(1, self.__batch_size // 2)
+            return
+
+        self.__batch_size = min(
+            self.__max_batch_size,
+            self.__batch_size + max(1, self.__batch_size // 4),
+        )
@@ -0,0 +1,47 @@
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass, field
+
+from ..event import EventCandidate
+
+
+@dataclass
+class BulkChunk:
+    offset: int
+    encoded_event_candidates: list[bytes] = field(default_factory=list)
+    subjects: set[str] = field(default_factory=set)
+    size: int = 0
+
+    def __len__(self) -> int:
+        return len(self.encoded_event_candidates)
+
+
+def get_bulk_chunks(
+    event_candidates: Iterable[EventCandidate],
+    max_chunk_size: int,
+    max_chunk_bytes: int,
+) -> Iterator[BulkChunk]:
+    """
+    Encode event candidates lazily and group them into chunks.
+
+    A chunk ends once it holds max_chunk_size candidates or adding the next
+    candidate would exceed max_chunk_bytes. A single candidate larger than
+    max_chunk_bytes forms a chunk of its own.
+    """
+    chunk = BulkChunk(offset=0)
+
+    for offset, event_candidate in enumerate(event_candidates):
+        encoded_event_candidate = event_candidate.encode()
+        size = len(encoded_event_candidate) + 1
+
+        if len(chunk) > 0 and (
+            len(chunk) >= max_chunk_size or chunk.size + size > max_chunk_bytes
+        ):
+            yield chunk
+            chunk = BulkChunk(offset=offset)
+
+        chunk.encoded_event_candidates.append(encoded_event_candidate)
+        chunk.subjects.add(event_candidate.subject)
+        chunk.size += size
+
+    if len(chunk) > 0:
+        yield chunk
@@ -0,0 +1,44 @@
+import json
+from collections.abc import AsyncGenerator, Iterable
+
+from .preconditions import Precondition
+
+
+def get_write_events_request_body(
+    encoded_event_candidates: Iterable[bytes],
+    preconditions: Iterable[Precondition],
+) -> bytes:
+    encoded_preconditions = json.dumps([precondition.to_json() for precondition in preconditions])
+    return b"".join([
+        b'{"events":[',
+        b",".join(encoded_event_candidates),
+        f'],"preconditions":{encoded_preconditions}}}'.encode(),
+    ])
+
+
+async def stream_write_events_request_body(
+    encoded_event_candidates: Iterable[bytes],
+    preconditions: Iterable[Precondition],
+    chunk_size: int = 65_536,
+) -> AsyncGenerator[bytes, None]:
+    """
+    Yield the request body in chunks of roughly chunk_size bytes.
+
+    The encoded candidates are consumed lazily, so only one chunk of the body
+    is held in memory at a time, regardless of the number of candidates.
+    """
+    chunk = bytearray(b'{"events":[')
+
+    for index, encoded_event_candidate in enumerate(encoded_event_candidates):
+        if index > 0:
+            chunk += b","
+        chunk += encoded_event_candidate
+
+        if len(chunk) >= chunk_size:
+            yield bytes(chunk)
+            chunk.clear()
+
+    encoded_preconditions = json.dumps([precondition.to_json() for precondition in preconditions])
+    chunk += f'],"preconditions":{encoded_preconditions}}}'.encode()
+
+    yield bytes(chunk)
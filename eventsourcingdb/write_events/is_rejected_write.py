@@ -0,0 +1,20 @@
+from http import HTTPStatus
+
+from ..errors import ServerError
+
+# Client error statuses that say nothing about the request itself
+TRANSIENT_CLIENT_ERROR_STATUSES = {
+    HTTPStatus.REQUEST_TIMEOUT,
+    HTTPStatus.TOO_MANY_REQUESTS,
+}
+
+
+def is_rejected_write(error: BaseException) -> bool:
+    """Return whether the server rejected a write request, so that none of its events were written."""
+    if not isinstance(error, ServerError) or error.status_code is None:
+        return False
+
+    return (
+        HTTPStatus.BAD_REQUEST <= error.status_code < HTTPStatus.INTERNAL_SERVER_ERROR
+        and error.status_code not in TRANSIENT_CLIENT_ERROR_STATUSES
+    )
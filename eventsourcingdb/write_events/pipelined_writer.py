@@ -0,0 +1,157 @@
+import asyncio
+from types import TracebackType
+from typing import TYPE_CHECKING, Self
+
+from ..errors import ClientError, ValidationError
+from ..event import Event, EventCandidate
+from .preconditions import (
+    IsSubjectOnEventId,
+    IsSubjectPopulated,
+    IsSubjectPristine,
+    Precondition,
+)
+
+if TYPE_CHECKING:
+    from ..client import Client
+
+
+class PipelinedWriter:
+    """
+    Keeps several write_events requests in flight while keeping per-subject order.
+
+    Each write is assigned the partitions of the subjects it touches, either
+    the full subjects or, with partition_depth, their first segments. A write
+    starts once all earlier writes sharing one of its partitions are done, so
+    writes within a partition are applied in submission order, while writes to
+    unrelated partitions run concurrently, up to max_in_flight requests.
+
+    Writes with an EventQL precondition can not be attributed to a subject, so
+    they wait for all earlier writes and all later writes wait for them.
+    """
+
+    def __init__(
+        self,
+        client: "Client",
+        max_in_flight: int = 8,
+        partition_depth: int | None = None,
+    ) -> None:
+        if max_in_flight < 1:
+            raise ValidationError("max_in_flight must be at least 1.")
+        if partition_depth is not None and partition_depth < 1:
+            raise ValidationError("partition_depth must be at least 1.")
+
+        self.__client = client
+        self.__partition_depth = partition_depth
+        self.__semaphore = asyncio.Semaphore(max_in_flight)
+        self.__tails: dict[str, asyncio.Task[list[Event]]] = {}
+        self.__barrier: asyncio.Task[list[Event]] | None = None
+        self.__running: dict[asyncio.Task[list[Event]], set[str] | None] = {}
+        self.__is_closing = False
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None = None,
+        exc_val: BaseException | None = None,
+        exc_tb: TracebackType | None = None,
+    ) -> None:
+        await self.close()
+
+    def get_partition(self, subject: str) -> str:
+        if self.__partition_depth is None:
+            return subject
+
+        segments = subject.strip("/").split("/")
+        return "/" + "/".join(segments[:self.__partition_depth])
+
+    def submit(
+        self,
+        event_candidates: list[EventCandidate],
+        preconditions: list[Precondition] | None = None,
+    ) -> asyncio.Future[list[Event]]:
+        """Schedule a write and return a future for the written events."""
+        if self.__is_closing:
+            raise ClientError("PipelinedWriter is closed.")
+
+        preconditions = list(preconditions or [])
+        partitions = self.__get_partitions(event_candidates, preconditions)
+
+        if partitions is None:
+            dependencies = set(self.__running)
+        else:
+            dependencies = {
+                self.__tails[partition] for partition in partitions if partition in self.__tails
+            }
+            if self.__barrier is not None:
+                dependencies.add(self.__barrier)
+
+        task = asyncio.get_running_loop().create_task(
+            self.__write(dependencies, list(event_candidates), preconditions)
+        )
+        self.__running[task] = partitions
+
+        if partitions is None:
+            self.__barrier = task
+            self.__tails.clear()
+        else:
+            for partition in partitions:
+                self.__tails[partition] = task
+
+        task.add_done_callback(self.__forget)
+
+        return task
+
+    async def write(
+        self,
+        event_candidates: list[EventCandidate],
+        preconditions: list[Precondition] | None = None,
+    ) -> list[Event]:
+        return await self.submit(event_candidates, preconditions)
+
+    async def close(self) -> None:
+        """Wait for all submitted writes and stop accepting new ones."""
+        self.__is_closing = True
+
+        if self.__running:
+            await asyncio.wait(list(self.__running))
+
+    def __get_partitions(
+        self,
+        event_candidates: list[EventCandidate],
+        preconditions: list[Precondition],
+    ) -> set[str] | None:
+        subjects = {event_candidate.subject for event_candidate in event_candidates}
+
+        for precondition in preconditions:
+            if isinstance(precondition, (IsSubjectPristine, IsSubjectPopulated, IsSubjectOnEventId)):
+                subjects.add(precondition.subject)
+                continue
+            return None
+
+        return {self.get_partition(subject) for subject in subjects}
+
+    async def __write(
+        self,
+        dependencies: set[asyncio.Task[list[Event]]],
+        event_candidates: list[EventCandidate],
+        preconditions: list[Precondition],
+    ) -> list[Event]:
+        if dependencies:
+            # Earlier writes only have to be finished, not successful, just
+            # like with sequential calls to write_events.
+            await asyncio.wait(dependencies)
+
+        async with self.__semaphore:
+            return await self.__client.write_events(event_candidates, preconditions)
+
+    def __forget(self, task: asyncio.Task[list[Event]]) -> None:
+        partitions = self.__running.pop(task, None)
+
+        if self.__barrier is task:
+            self.__barrier = None
+
+        for partition in partitions or []:
+            if self.__tails.get(partition) is task:
+                del self.__tails[partition]
@@ -0,0 +1,30 @@
+from dataclasses import dataclass
+
+from ..errors.validation_error import ValidationError
+
+
+@dataclass
+class WriteAcknowledgement:
+    event_id: str
+    subject: str
+    hash: str
+
+    @staticmethod
+    def parse(unknown_object: dict) -> "WriteAcknowledgement":
+        event_id = unknown_object.get("id")
+        if not isinstance(event_id, str):
+            raise ValidationError(f"Failed to parse event_id '{event_id}' to string.")
+
+        subject = unknown_object.get("subject")
+        if not isinstance(subject, str):
+            raise ValidationError(f"Failed to parse subject '{subject}' to string.")
+
+        event_hash = unknown_object.get("hash")
+        if not isinstance(event_hash, str):
+            raise ValidationError(f"Failed to parse hash '{event_hash}' to string.")
+
+        return WriteAcknowledgement(
+            event_id=event_id,
+            subject=subject,
+            hash=event_hash,
+        )
@@ -2,7 +2,7 @@ from hashlib import sha256
 
 import pytest
 
-from eventsourcingdb import EventCandidate
+from eventsourcingdb import EventCandidate, ReadEventsOptions
 from eventsourcingdb.errors.validation_error import ValidationError
 
 from ..conftest import TestData
@@ -57,3 +57,33 @@ class TestVerifyHash:
 
         with pytest.raises(ValidationError):
             written_event.verify_hash()
+
+    @staticmethod
+    @pytest.mark.asyncio
+    async def test_verifies_the_event_hash_against_the_raw_data(
+        database: Database,
+        test_data: TestData,
+    ) -> None:
+        client = database.get_client()
+
+        await client.write_events(
+            [
+                EventCandidate(
+                    source=test_data.TEST_SOURCE_STRING,
+                    subject="/test",
+                    type="io.eventsourcingdb.test",
+                    data={"title": "Die Verwandlung", "author": "Franz Kafka", "price": 12.5, "note": "über"},
+                )
+            ],
+        )
+
+        events = [
+            event
+            async for event in client.read_events(
+                "/test", ReadEventsOptions(recursive=False), keep_raw_data=True
+            )
+        ]
+
+        assert len(events) == 1
+        assert events[0].data["note"] == "über"
+        events[0].verify_hash()
@@ -0,0 +1,31 @@
+from typing import TYPE_CHECKING
+
+from eventsourcingdb import EventCandidate
+
+from ..database import Database
+
+if TYPE_CHECKING:
+    from ...conftest import TestData
+
+
+async def write_numbered_events(
+    database: Database,
+    test_data: "TestData",
+    count: int,
+    subject_count: int | None = None,
+) -> None:
+    """
+    Write count events whose data holds their index.
+
+    Without a subject_count, all events go to /test. Otherwise they are spread
+    over the subjects /test/0 to /test/<subject_count - 1> in turn.
+    """
+    await database.get_client().write_events([
+        EventCandidate(
+            source=test_data.TEST_SOURCE_STRING,
+            subject="/test" if subject_count is None else f"/test/{index % subject_count}",
+            type="io.eventsourcingdb.test",
+            data={"index": index},
+        )
+        for index in range(count)
+    ])
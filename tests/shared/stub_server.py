@@ -0,0 +1,132 @@
+import asyncio
+import json
+from collections.abc import Awaitable, Callable
+from types import TracebackType
+from typing import Any, Self
+
+import pytest
+from aiohttp import ClientResponse, web
+
+from eventsourcingdb import Client
+
+Handler = Callable[[web.Request], Awaitable[web.StreamResponse]]
+
+HEADERS = {"Server": "EventSourcingDB/stub"}
+HEARTBEAT_LINE = b'{"type":"heartbeat"}\n'
+
+
+def get_event_payload(event_id: int, subject: str = "/test") -> dict[str, Any]:
+    return {
+        "specversion": "1.0",
+        "id": str(event_id),
+        "time": "2025-01-01T00:00:00.000000000Z",
+        "source": "tag:thenativeweb.io,2023:eventsourcingdb:test",
+        "subject": subject,
+        "type": "io.eventsourcingdb.test",
+        "datacontenttype": "application/json",
+        "data": {"index": event_id},
+        "predecessorhash": "0" * 64,
+        "hash": "0" * 64,
+    }
+
+
+def get_event_line(event_id: int, subject: str = "/test") -> bytes:
+    message = {"type": "event", "payload": get_event_payload(event_id, subject)}
+    return json.dumps(message).encode("utf-8") + b"\n"
+
+
+def track_closed_responses(monkeypatch: pytest.MonkeyPatch) -> list[ClientResponse]:
+    """Record every client response that is closed, in the order of closing."""
+    closed_responses: list[ClientResponse] = []
+    close = ClientResponse.close
+
+    def record_close(response: ClientResponse) -> None:
+        closed_responses.append(response)
+        close(response)
+
+    monkeypatch.setattr(ClientResponse, "close", record_close)
+    return closed_responses
+
+
+async def stream_lines(
+    request: web.Request,
+    lines: list[bytes],
+    drop_connection: bool = False,
+    stall: bool = False,
+) -> web.StreamResponse:
+    response = web.StreamResponse(headers=HEADERS)
+    await response.prepare(request)
+
+    for line in lines:
+        await response.write(line)
+
+    if stall:
+        # Keep the connection open without sending anything, until the
+        # server shuts down.
+        await asyncio.Event().wait()
+
+    if drop_connection:
+        # Closing the transport before the chunked body is complete makes the
+        # client see a broken stream instead of a regular end.
+        if request.transport is not None:
+            request.transport.close()
+        return response
+
+    await response.write_eof()
+    return response
+
+
+class StubServer:
+    """
+    Serves hand-written responses on a local port, for behavior a real database can not show.
+
+    Handlers are registered per path before the server is started. The path
+    and JSON body of every request are recorded in requests, in the order
+    they arrived.
+    """
+
+    def __init__(self) -> None:
+        self.__app = web.Application(middlewares=[self.__record])
+        self.__runner: web.AppRunner | None = None
+        self.__client: Client | None = None
+        self.requests: list[tuple[str, Any]] = []
+
+    def add_post(self, path: str, handler: Handler) -> None:
+        self.__app.router.add_post(path, handler)
+
+    def get_requests(self, path: str) -> list[Any]:
+        return [body for request_path, body in self.requests if request_path == path]
+
+    def get_client(self) -> Client:
+        if self.__client is None:
+            raise RuntimeError("StubServer is not running.")
+        return self.__client
+
+    async def __aenter__(self) -> Self:
+        # Streaming handlers may never finish on their own, so they are not
+        # waited for on shutdown.
+        self.__runner = web.AppRunner(self.__app, shutdown_timeout=0.1)
+        await self.__runner.setup()
+        site = web.TCPSite(self.__runner, "127.0.0.1", 0)
+        await site.start()
+
+        port = self.__runner.addresses[0][1]
+        self.__client = Client(f"http://127.0.0.1:{port}", "stub-api-token")
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None = None,
+        exc_val: BaseException | None = None,
+        exc_tb: TracebackType | None = None,
+    ) -> None:
+        if self.__client is not None:
+            await self.__client.__aexit__(None, None, None)
+        if self.__runner is not None:
+            await self.__runner.cleanup()
+
+    @web.middleware
+    async def __record(self, request: web.Request, handler: Handler) -> web.StreamResponse:
+        body = await request.read()
+        self.requests.append((request.path, json.loads(body) if body else None))
+        return await handler(request)
@@ -0,0 +1,76 @@
+import pytest
+
+from eventsourcingdb import EventCandidate
+
+from .conftest import TestData
+from .shared.database import Database
+
+
+class TestAggregations:
+    @staticmethod
+    @pytest.mark.asyncio
+    async def test_counts_events(prepared_database: Database, test_data: TestData) -> None:
+        client = prepared_database.get_client()
+
+        assert await client.count_events(test_data.REGISTERED_SUBJECT) == 2
+        assert await client.count_events("/users") == 0
+        assert await client.count_events("/users", recursive=True) == 4
+        assert await client.count_events("/", recursive=True) == 4
+
+    @staticmethod
+    @pytest.mark.asyncio
+    async def test_does_not_count_subjects_sharing_a_prefix(
+        database: Database,
+        test_data: TestData,
+    ) -> None:
+        client = database.get_client()
+        await client.write_events([
+            EventCandidate(
+                source=test_data.TEST_SOURCE_STRING,
+                subject=subject,
+                type="io.eventsourcingdb.test",
+                data={},
+            )
+            for subject in ["/books", "/books/42", "/books-archive", "/booksellers/1"]
+        ])
+
+        assert await client.count_events("/books", recursive=True) == 2
+
+    @staticmethod
+    @pytest.mark.asyncio
+    async def test_checks_whether_a_subject_exists(
+        prepared_database: Database,
+        test_data: TestData,
+    ) -> None:
+        client = prepared_database.get_client()
+
+        assert await client.subject_exists(test_data.REGISTERED_SUBJECT) is True
+        assert await client.subject_exists("/users") is False
+        assert await client.subject_exists("/users", recursive=True) is True
+        assert await client.subject_exists("/unknown", recursive=True) is False
+
+    @staticmethod
+    @pytest.mark.asyncio
+    async def test_counts_events_by_type(
+        prepared_database: Database,
+        test_data: TestData,
+    ) -> None:
+        client = prepared_database.get_client()
+
+        assert await client.count_by_type("/users", recursive=True) == {
+            test_data.REGISTERED_TYPE: 2,
+            test_data.LOGGED_IN_TYPE: 2,
+        }
+        assert await client.count_by_type("/unknown") == {}
+
+    @staticmethod
+    @pytest.mark.asyncio
+    async def test_returns_the_latest_event_id(
+        prepared_database: Database,
+        test_data: TestData,
+    ) -> None:
+        client = prepared_database.get_client()
+
+        assert await client.latest_event_id(test_data.REGISTERED_SUBJECT) == "2"
+        assert await client.latest_event_id("/users", recursive=True) == "3"
+        assert await client.latest_event_id("/unknown") is None
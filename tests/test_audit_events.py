@@ -0,0 +1,77 @@
+import pytest
+
+from eventsourcingdb import (
+    EventCandidate,
+    FileVerificationCheckpointStore,
+    VerificationCheckpoint,
+    audit_events,
+)
+from eventsourcingdb.errors.validation_error import ValidationError
+
+from .conftest import TestData
+from .shared.database import Database
+
+
+class TestAuditEvents:
+    @staticmethod
+    @pytest.mark.asyncio
+    async def test_verifies_all_events_on_the_first_run(
+        prepared_database: Database,
+        tmp_path,
+    ) -> None:
+        client = prepared_database.get_client()
+        checkpoint_store = FileVerificationCheckpointStore(str(tmp_path / "checkpoints.json"))
+
+        result = await audit_events(client, "/", checkpoint_store, recursive=True)
+
+        total_event_count = 4
+        assert result.verified_count == total_event_count
+        assert result.checkpoint is not None
+        assert result.checkpoint.event_id == "3"
+        assert await checkpoint_store.load("/") == result.checkpoint
+
+    @staticmethod
+    @pytest.mark.asyncio
+    async def test_only_verifies_new_events_on_subsequent_runs(
+        prepared_database: Database,
+        test_data: TestData,
+        tmp_path,
+    ) -> None:
+        client = prepared_database.get_client()
+        checkpoint_store = FileVerificationCheckpointStore(str(tmp_path / "checkpoints.json"))
+
+        await audit_events(client, "/", checkpoint_store, recursive=True)
+
+        result = await audit_events(client, "/", checkpoint_store, recursive=True)
+        assert result.verified_count == 0
+
+        await client.write_events(
+            [
+                EventCandidate(
+                    source=test_data.TEST_SOURCE_STRING,
+                    subject=test_data.REGISTERED_SUBJECT,
+                    type=test_data.REGISTERED_TYPE,
+                    data=test_data.APFEL_FRED_DATA,
+                )
+            ]
+        )
+
+        result = await audit_events(client, "/", checkpoint_store, recursive=True)
+        assert result.verified_count == 1
+        assert result.checkpoint is not None
+        assert result.checkpoint.event_id == "4"
+
+    @staticmethod
+    @pytest.mark.asyncio
+    async def test_fails_if_the_chain_does_not_continue_from_the_checkpoint(
+        prepared_database: Database,
+        tmp_path,
+    ) -> None:
+        client = prepared_database.get_client()
+        checkpoint_store = FileVerificationCheckpointStore(str(tmp_path / "checkpoints.json"))
+        await checkpoint_store.save("/", VerificationCheckpoint(event_id="1", hash="0" * 64))
+
+        with pytest.raises(ValidationError):
+            await audit_events(client, "/", checkpoint_store, recursive=True)
+
+        assert await checkpoint_store.load("/") == VerificationCheckpoint(event_id="1", hash="0" * 64)
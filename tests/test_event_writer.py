@@ -0,0 +1,173 @@
+import asyncio
+
+import pytest
+from aiohttp import web
+
+from eventsourcingdb import (
+    ClientError,
+    EventCandidate,
+    EventWriter,
+    IsSubjectPristine,
+    ReadEventsOptions,
+    ServerError,
+)
+
+from .conftest import TestData
+from .shared.database import Database
+from .shared.stub_server import HEADERS, StubServer
+
+
+class TestEventWriter:
+    @staticmethod
+    @pytest.mark.asyncio
+    async def test_returns_the_written_events_to_each_caller(
+        database: Database,
+        test_data: TestData,
+    ) -> None:
+        client = database.get_client()
+        write_count = 20
+
+        async with EventWriter(client, max_batch_size=8) as writer:
+            results = await asyncio.gather(*[
+                writer.write([
+                    EventCandidate(
+                        source=test_data.TEST_SOURCE_STRING,
+                        subject=f"/test/{index}",
+                        type="io.eventsourcingdb.test",
+                        data={"index": index},
+                    )
+                ])
+                for index in range(write_count)
+            ])
+
+        for index, written_events in enumerate(results):
+            assert len(written_events) == 1
+            assert written_events[0].subject == f"/test/{index}"
+            assert written_events[0].data == {"index": index}
+
+        read_events = [
+            event async for event in client.read_events("/test", ReadEventsOptions(recursive=True))
+        ]
+        assert len(read_events) == write_count
+
+    @staticmethod
+    @pytest.mark.asyncio
+    async def test_only_fails_the_write_whose_precondition_fails(
+        prepared_database: Database,
+        test_data: TestData,
+    ) -> None:
+        client = prepared_database.get_client()
+
+        async with EventWriter(client) as writer:
+            results = await asyncio.gather(
+                writer.write(
+                    [
+                        EventCandidate(
+                            source=test_data.TEST_SOURCE_STRING,
+                            subject=test_data.REGISTERED_SUBJECT,
+                            type=test_data.REGISTERED_TYPE,
+                            data=test_data.APFEL_FRED_DATA,
+                        )
+                    ],
+                    [IsSubjectPristine(test_data.REGISTERED_SUBJECT)],
+                ),
+                writer.write([
+                    EventCandidate(
+                        source=test_data.TEST_SOURCE_STRING,
+                        subject="/test",
+                        type="io.eventsourcingdb.test",
+                        data={},
+                    )
+                ]),
+                return_exceptions=True,
+            )
+
+        assert isinstance(results[0], ServerError)
+        assert isinstance(results[1], list)
+        assert len(results[1]) == 1
+
+    @staticmethod
+    @pytest.mark.asyncio
+    async def test_only_fails_the_invalid_write_of_a_batch(
+        database: Database,
+        test_data: TestData,
+    ) -> None:
+        client = database.get_client()
+
+        async with EventWriter(client) as writer:
+            results = await asyncio.gather(
+                writer.write([
+                    EventCandidate(
+                        source=test_data.TEST_SOURCE_STRING,
+                        subject="",
+                        type="io.eventsourcingdb.test",
+                        data={},
+                    )
+                ]),
+                writer.write([
+                    EventCandidate(
+                        source=test_data.TEST_SOURCE_STRING,
+                        subject="/test",
+                        type="io.eventsourcingdb.test",
+                        data={},
+                    )
+                ]),
+                return_exceptions=True,
+            )
+
+        assert isinstance(results[0], ServerError)
+        assert isinstance(results[1], list)
+
+    @staticmethod
+    @pytest.mark.asyncio
+    async def test_fails_the_whole_batch_if_the_server_is_unavailable(
+        test_data: TestData,
+    ) -> None:
+        async def write_events(_: web.Request) -> web.Response:
+            return web.Response(status=503, headers=HEADERS)
+
+        server = StubServer()
+        server.add_post("/api/v1/write-events", write_events)
+
+        async with server:
+            async with EventWriter(server.get_client()) as writer:
+                results = await asyncio.gather(
+                    *[
+                        writer.write([
+                            EventCandidate(
+                                source=test_data.TEST_SOURCE_STRING,
+                                subject=f"/test/{index}",
+                                type="io.eventsourcingdb.test",
+                                data={},
+                            )
+                        ])
+                        for index in range(3)
+                    ],
+                    return_exceptions=True,
+                )
+
+            for result in results:
+                assert isinstance(result, ServerError)
+                assert result.status_code == 503
+            assert len(server.get_requests("/api/v1/write-events")) == 1
+
+    @staticmethod
+    @pytest.mark.asyncio
+    async def test_throws_an_error_when_writing_after_close(
+        database: Database,
+        test_data: TestData,
+    ) -> None:
+        client = database.get_client()
+
+        writer = EventWriter(client)
+        await writer.close()
+
+        with pytest.raises(ClientError):
+            await writer.write([
+                EventCandidate(
+                    source=test_data.TEST_SOURCE_STRING,
+                    subject="/test",
+                    type="io.eventsourcingdb.test",
+                    data={},
+                )
+            ])
@@ -1,7 +1,8 @@
 import asyncio
+import contextlib
 
 import pytest
-from aiohttp import ClientConnectorDNSError
+from aiohttp import ClientConnectorDNSError, ClientPayloadError, web
 
 from eventsourcingdb import (
     Bound,
@@ -10,12 +11,21 @@ from eventsourcingdb import (
     IfEventIsMissingDuringObserve,
     ObserveEventsOptions,
     ObserveFromLatestEvent,
+    ReconnectInfo,
+    RetryPolicy,
     ServerError,
 )
 
 from .conftest import TestData
 from .shared.database import Database
 from .shared.event.assert_event import assert_event_equals
+from .shared.stub_server import (
+    HEARTBEAT_LINE,
+    StubServer,
+    get_event_line,
+    stream_lines,
+    track_closed_responses,
+)
 
 
 class TestObserveEvents:
@@ -51,6 +61,190 @@ class TestObserveEvents:
             if observed_items_count == total_store_items_count:
                 break
 
+    @staticmethod
+    @pytest.mark.asyncio
+    async def test_stops_observing_after_the_limit(prepared_database: Database) -> None:
+        client = prepared_database.get_client()
+
+        events = [
+            event
+            async for event in client.observe_events(
+                "/", ObserveEventsOptions(recursive=True), limit=3
+            )
+        ]
+
+        assert [event.event_id for event in events] == ["0", "1", "2"]
+
+    @staticmethod
+    @pytest.mark.asyncio
+    async def test_observes_events_with_reconnect_enabled(prepared_database: Database) -> None:
+        client = prepared_database.get_client()
+        reconnects: list[ReconnectInfo] = []
+
+        events = [
+            event
+            async for event in client.observe_events(
+                "/",
+                ObserveEventsOptions(recursive=True),
+                limit=4,
+                reconnect=RetryPolicy(),
+                on_reconnect=reconnects.append,
+            )
+        ]
+
+        assert [event.event_id for event in events] == ["0", "1", "2", "3"]
+        assert reconnects == []
+
+    @staticmethod
+    @pytest.mark.asyncio
+    async def test_releases_the_connection_when_closed_early(
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        async def handle(request: web.Request) -> web.StreamResponse:
+            return await stream_lines(
+                request, [get_event_line(index) for index in range(3)], stall=True
+            )
+
+        server = StubServer()
+        server.add_post("/api/v1/observe-events", handle)
+        closed_responses = track_closed_responses(monkeypatch)
+
+        async with server:
+            events = server.get_client().observe_events(
+                "/test", ObserveEventsOptions(recursive=False)
+            )
+            async with contextlib.aclosing(events):
+                async for _ in events:
+                    break
+
+            assert len(closed_responses) == 1
+
+    @staticmethod
+    @pytest.mark.asyncio
+    async def test_raises_the_error_once_reconnect_attempts_are_exhausted(
+        database: Database,
+    ) -> None:
+        client = database.get_client("with_invalid_url")
+
+        with pytest.raises(ClientConnectorDNSError):
+            async for _ in client.observe_events(
+                "/",
+                ObserveEventsOptions(recursive=True),
+                reconnect=RetryPolicy(max_retries=2, initial_delay=0.01),
+            ):
+                pass
+
+    @staticmethod
+    @pytest.mark.asyncio
+    async def test_resumes_after_the_last_event_if_the_connection_drops() -> None:
+        async def observe_events(request: web.Request) -> web.StreamResponse:
+            lower_bound = (await request.json())["options"].get("lowerBound")
+            if lower_bound is None:
+                return await stream_lines(
+                    request,
+                    [get_event_line(index) for index in range(3)],
+                    drop_connection=True,
+                )
+
+            assert lower_bound["type"] == "exclusive"
+            first_id = int(lower_bound["id"]) + 1
+            return await stream_lines(
+                request, [get_event_line(index) for index in range(first_id, 6)]
+            )
+
+        server = StubServer()
+        server.add_post("/api/v1/observe-events", observe_events)
+        reconnects: list[ReconnectInfo] = []
+
+        async with server:
+            events = [
+                event
+                async for event in server.get_client().observe_events(
+                    "/test",
+                    ObserveEventsOptions(recursive=False),
+                    limit=6,
+                    reconnect=RetryPolicy(initial_delay=0.01),
+                    on_reconnect=reconnects.append,
+                )
+            ]
+
+        assert [event.event_id for event in events] == ["0", "1", "2", "3", "4", "5"]
+        assert [
+            body["options"].get("lowerBound")
+            for body in server.get_requests("/api/v1/observe-events")
+        ] == [None, {"id": "2", "type": "exclusive"}]
+        assert len(reconnects) == 1
+        assert reconnects[0].reconnect_count == 1
+        assert reconnects[0].downtime >= 0
+        assert isinstance(reconnects[0].error, ClientPayloadError)
+
+    @staticmethod
+    @pytest.mark.asyncio
+    async def test_keeps_backing_off_if_streams_end_before_anything_arrives() -> None:
+        async def observe_events(request: web.Request) -> web.StreamResponse:
+            return await stream_lines(request, [])
+
+        server = StubServer()
+        server.add_post("/api/v1/observe-events", observe_events)
+
+        async with server:
+            with pytest.raises(TimeoutError):
+                async with asyncio.timeout(0.5):
+                    async for _ in server.get_client().observe_events(
+                        "/test",
+                        ObserveEventsOptions(recursive=False),
+                        reconnect=RetryPolicy(initial_delay=0.01, max_delay=1, jitter=False),
+                    ):
+                        pass
+
+        # The delays grow from 10ms to 20ms, 40ms, and so on, so only a
+        # handful of reconnects fit into half a second.
+        assert len(server.get_requests("/api/v1/observe-events")) <= 7
+
+    @staticmethod
+    @pytest.mark.asyncio
+    async def test_observes_events_with_a_heartbeat_timeout(prepared_database: Database) -> None:
+        client = prepared_database.get_client()
+
+        events = [
+            event
+            async for event in client.observe_events(
+                "/",
+                ObserveEventsOptions(recursive=True),
+                limit=4,
+                heartbeat_timeout=10,
+            )
+        ]
+
+        assert len(events) == 4
+
+    @staticmethod
+    @pytest.mark.asyncio
+    async def test_raises_a_timeout_error_if_the_stream_stalls() -> None:
+        async def observe_events(request: web.Request) -> web.StreamResponse:
+            return await stream_lines(
+                request, [HEARTBEAT_LINE, get_event_line(0), HEARTBEAT_LINE], stall=True
+            )
+
+        server = StubServer()
+        server.add_post("/api/v1/observe-events", observe_events)
+        event_ids: list[str] = []
+        heartbeat_intervals: list[float] = []
+
+        async with server:
+            with pytest.raises(TimeoutError):
+                async for event in server.get_client().observe_events(
+                    "/test",
+                    ObserveEventsOptions(recursive=False),
+                    heartbeat_timeout=0.2,
+                    on_heartbeat=heartbeat_intervals.append,
+                ):
+                    event_ids.append(event.event_id)
+
+        assert event_ids == ["0"]
+        assert len(heartbeat_intervals) == 2
+        assert all(interval >= 0 for interval in heartbeat_intervals)
+
     @staticmethod
     @pytest.mark.asyncio
     async def test_observes_event_from_a_single_subject(
@@ -0,0 +1,107 @@
+import asyncio
+
+import pytest
+
+from eventsourcingdb import (
+    CatchUpProgress,
+    EventCandidate,
+    IfEventIsMissingDuringObserve,
+    ObserveEventsOptions,
+    ObserveFromLatestEvent,
+    ValidationError,
+)
+
+from .conftest import TestData
+from .shared.database import Database
+
+
+class TestObserveEventsWithCatchUp:
+    @staticmethod
+    @pytest.mark.asyncio
+    async def test_throws_error_if_page_size_is_invalid(database: Database) -> None:
+        client = database.get_client()
+
+        with pytest.raises(ValidationError):
+            async for _ in client.observe_events_with_catch_up(
+                "/", ObserveEventsOptions(recursive=True), page_size=0
+            ):
+                pass
+
+    @staticmethod
+    @pytest.mark.asyncio
+    async def test_reads_existing_events_and_observes_new_ones(
+        prepared_database: Database,
+        test_data: TestData,
+    ) -> None:
+        client = prepared_database.get_client()
+        progress: list[CatchUpProgress] = []
+        event_ids: list[str] = []
+
+        async for event in client.observe_events_with_catch_up(
+            "/",
+            ObserveEventsOptions(recursive=True),
+            page_size=3,
+            on_progress=progress.append,
+        ):
+            event_ids.append(event.event_id)
+            if event.event_id == "3":
+                await client.write_events([
+                    EventCandidate(
+                        source=test_data.TEST_SOURCE_STRING,
+                        subject=test_data.REGISTERED_SUBJECT,
+                        type=test_data.REGISTERED_TYPE,
+                        data={},
+                    )
+                ])
+            if event.event_id == "4":
+                break
+
+        assert event_ids == ["0", "1", "2", "3", "4"]
+        assert progress == [
+            CatchUpProgress(
+                position="2", target="3", read_count=3, lag=1, is_caught_up=False
+            ),
+            CatchUpProgress(
+                position="3", target="3", read_count=4, lag=0, is_caught_up=False
+            ),
+            CatchUpProgress(
+                position="3", target="3", read_count=4, lag=0, is_caught_up=True
+            ),
+        ]
+
+    @staticmethod
+    @pytest.mark.asyncio
+    async def test_waits_for_a_missing_latest_event(
+        prepared_database: Database,
+        test_data: TestData,
+    ) -> None:
+        client = prepared_database.get_client()
+
+        async def observe_first_event_id() -> str:
+            async for event in client.observe_events_with_catch_up(
+                "/",
+                ObserveEventsOptions(
+                    recursive=True,
+                    from_latest_event=ObserveFromLatestEvent(
+                        subject=test_data.REGISTERED_SUBJECT,
+                        type="io.thenativeweb.users.deleted",
+                        if_event_is_missing=IfEventIsMissingDuringObserve.WAIT_FOR_EVENT,
+                    ),
+                ),
+            ):
+                return event.event_id
+            return ""
+
+        task = asyncio.create_task(observe_first_event_id())
+        await asyncio.sleep(0.5)
+
+        await client.write_events([
+            EventCandidate(
+                source=test_data.TEST_SOURCE_STRING,
+                subject=test_data.REGISTERED_SUBJECT,
+                type="io.thenativeweb.users.deleted",
+                data={},
+            )
+        ])
+
+        assert await asyncio.wait_for(task, 10) == "4"
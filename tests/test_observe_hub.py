@@ -0,0 +1,143 @@
+import asyncio
+
+import pytest
+from aiohttp import ClientConnectorDNSError, web
+
+from eventsourcingdb import (
+    Bound,
+    BoundType,
+    ClientError,
+    EventCandidate,
+    ObserveEventsOptions,
+    ObserveHub,
+    ValidationError,
+)
+
+from .conftest import TestData
+from .shared.database import Database
+from .shared.stub_server import StubServer, get_event_line, stream_lines
+
+
+async def take_event_ids(
+    hub: ObserveHub,
+    count: int,
+    lower_bound: Bound | None = None,
+) -> list[str]:
+    event_ids: list[str] = []
+    async for event in hub.subscribe(
+        "/", ObserveEventsOptions(recursive=True), lower_bound=lower_bound
+    ):
+        event_ids.append(event.event_id)
+        if len(event_ids) == count:
+            break
+
+    return event_ids
+
+
+class TestObserveHub:
+    @staticmethod
+    @pytest.mark.asyncio
+    async def test_throws_error_if_max_queue_size_is_invalid(database: Database) -> None:
+        client = database.get_client()
+
+        with pytest.raises(ValidationError):
+            ObserveHub(client, max_queue_size=0)
+
+    @staticmethod
+    @pytest.mark.asyncio
+    async def test_hands_events_to_all_consumers(prepared_database: Database) -> None:
+        client = prepared_database.get_client()
+
+        async with ObserveHub(client, max_queue_size=1) as hub:
+            first, second = await asyncio.gather(
+                take_event_ids(hub, 4),
+                take_event_ids(hub, 4),
+            )
+
+        assert first == ["0", "1", "2", "3"]
+        assert second == ["0", "1", "2", "3"]
+
+    @staticmethod
+    @pytest.mark.asyncio
+    async def test_replays_missed_events_for_late_consumers(
+        prepared_database: Database,
+        test_data: TestData,
+    ) -> None:
+        client = prepared_database.get_client()
+
+        async with ObserveHub(client) as hub:
+            early = asyncio.create_task(take_event_ids(hub, 5))
+            await asyncio.sleep(0.5)
+
+            late = asyncio.create_task(
+                take_event_ids(hub, 4, Bound(id="1", type=BoundType.INCLUSIVE))
+            )
+            live = asyncio.create_task(take_event_ids(hub, 1))
+            await asyncio.sleep(0.5)
+
+            await client.write_events([
+                EventCandidate(
+                    source=test_data.TEST_SOURCE_STRING,
+                    subject=test_data.REGISTERED_SUBJECT,
+                    type=test_data.REGISTERED_TYPE,
+                    data={},
+                )
+            ])
+
+            assert await early == ["0", "1", "2", "3", "4"]
+            assert await late == ["1", "2", "3", "4"]
+            assert await live == ["4"]
+
+    @staticmethod
+    @pytest.mark.asyncio
+    async def test_ends_consumers_when_closed(prepared_database: Database) -> None:
+        client = prepared_database.get_client()
+        hub = ObserveHub(client)
+
+        consumer = asyncio.create_task(take_event_ids(hub, 10))
+        await asyncio.sleep(0.5)
+        await hub.close()
+
+        assert await consumer == ["0", "1", "2", "3"]
+
+        with pytest.raises(ClientError):
+            await take_event_ids(hub, 1)
+
+    @staticmethod
+    @pytest.mark.asyncio
+    async def test_raises_errors_of_the_subscription(database: Database) -> None:
+        client = database.get_client("with_invalid_url")
+
+        async with ObserveHub(client) as hub:
+            with pytest.raises(ClientConnectorDNSError):
+                await take_event_ids(hub, 1)
+
+    @staticmethod
+    @pytest.mark.asyncio
+    async def test_skips_events_before_the_lower_bound_of_the_first_consumer() -> None:
+        async def observe_events(request: web.Request) -> web.StreamResponse:
+            return await stream_lines(request, [get_event_line(index) for index in range(6)])
+
+        server = StubServer()
+        server.add_post("/api/v1/observe-events", observe_events)
+
+        async with server, ObserveHub(server.get_client()) as hub:
+            inclusive_event_ids = [
+                event.event_id
+                async for event in hub.subscribe(
+                    "/test",
+                    ObserveEventsOptions(recursive=False),
+                    lower_bound=Bound(id="2", type=BoundType.INCLUSIVE),
+                )
+            ]
+            exclusive_event_ids = [
+                event.event_id
+                async for event in hub.subscribe(
+                    "/test",
+                    ObserveEventsOptions(recursive=False),
+                    lower_bound=Bound(id="4", type=BoundType.EXCLUSIVE),
+                )
+            ]
+
+        assert inclusive_event_ids == ["2", "3", "4", "5"]
+        assert exclusive_event_ids == ["5"]
@@ -0,0 +1,251 @@
+import asyncio
+import json
+import os
+from pathlib import Path
+
+import pytest
+from aiohttp import web
+
+from eventsourcingdb import (
+    ClientError,
+    EventCandidate,
+    Outbox,
+    ReadEventsOptions,
+    RetryPolicy,
+    ServerError,
+)
+
+from .conftest import TestData
+from .shared.database import Database
+from .shared.stub_server import HEADERS, StubServer
+
+
+def get_outbox_candidate(test_data: TestData, subject: str, value: int) -> EventCandidate:
+    return EventCandidate(
+        source=test_data.TEST_SOURCE_STRING,
+        subject=subject,
+        type="io.eventsourcingdb.test",
+        data={"value": value},
+    )
+
+
+async def accept_write(_: web.Request) -> web.Response:
+    return web.Response(text="[]", headers=HEADERS, content_type="application/json")
+
+
+class TestOutbox:
+    @staticmethod
+    @pytest.mark.asyncio
+    async def test_writes_appended_events_in_order(
+        database: Database,
+        test_data: TestData,
+        tmp_path: Path,
+    ) -> None:
+        client = database.get_client()
+        append_count = 50
+
+        async with Outbox(client, path=str(tmp_path / "outbox.jsonl")) as outbox:
+            await asyncio.gather(*[
+                outbox.append([
+                    EventCandidate(
+                        source=test_data.TEST_SOURCE_STRING,
+                        subject="/test",
+                        type="io.eventsourcingdb.test",
+                        data={"index": index},
+                    )
+                ])
+                for index in range(append_count)
+            ])
+            await outbox.drain()
+
+            assert outbox.metrics.depth == 0
+            assert outbox.metrics.delivered_count == append_count
+
+        read_events = [
+            event async for event in client.read_events("/test", ReadEventsOptions(recursive=False))
+        ]
+        assert [event.data for event in read_events] == [
+            {"index": index} for index in range(append_count)
+        ]
+
+    @staticmethod
+    @pytest.mark.asyncio
+    async def test_delivers_undelivered_events_after_reopening(
+        database: Database,
+        test_data: TestData,
+        tmp_path: Path,
+    ) -> None:
+        client = database.get_client()
+        path = tmp_path / "outbox.jsonl"
+
+        outbox = Outbox(client, path=str(path))
+        await outbox.open()
+        await outbox.append([
+            EventCandidate(
+                source=test_data.TEST_SOURCE_STRING,
+                subject="/test",
+                type="io.eventsourcingdb.test",
+                data={"value": 23},
+            )
+        ])
+        await outbox.drain()
+        await outbox.close()
+
+        # Simulate a crash while a line was being written.
+        path.write_bytes(path.read_bytes() + b'{"enqueuedAt":1.0,"events":[{"data"')
+
+        async with Outbox(client, path=str(path)) as outbox:
+            assert outbox.metrics.depth == 0
+
+            await outbox.append([
+                EventCandidate(
+                    source=test_data.TEST_SOURCE_STRING,
+                    subject="/test",
+                    type="io.eventsourcingdb.test",
+                    data={"value": 42},
+                )
+            ])
+            await outbox.drain()
+
+        read_events = [
+            event async for event in client.read_events("/test", ReadEventsOptions(recursive=False))
+        ]
+        assert [event.data for event in read_events] == [{"value": 23}, {"value": 42}]
+
+    @staticmethod
+    @pytest.mark.asyncio
+    async def test_rejects_appends_after_closing(
+        database: Database,
+        test_data: TestData,
+        tmp_path: Path,
+    ) -> None:
+        client = database.get_client()
+
+        async with Outbox(client, path=str(tmp_path / "outbox.jsonl")) as outbox:
+            pass
+
+        with pytest.raises(ClientError):
+            await outbox.append([
+                EventCandidate(
+                    source=test_data.TEST_SOURCE_STRING,
+                    subject="/test",
+                    type="io.eventsourcingdb.test",
+                    data={"value": 23},
+                )
+            ])
+
+    @staticmethod
+    @pytest.mark.asyncio
+    async def test_removes_a_partially_written_line_if_syncing_fails(
+        test_data: TestData,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        path = tmp_path / "outbox.jsonl"
+        server = StubServer()
+        server.add_post("/api/v1/write-events", accept_write)
+        fsync = os.fsync
+
+        def fail_fsync(_: int) -> None:
+            raise OSError("Failed to sync file.")
+
+        async with server, Outbox(server.get_client(), path=str(path)) as outbox:
+            await outbox.append([get_outbox_candidate(test_data, "/test", 23)])
+            size = path.stat().st_size
+
+            monkeypatch.setattr(os, "fsync", fail_fsync)
+            with pytest.raises(OSError, match="Failed to sync file."):
+                await outbox.append([get_outbox_candidate(test_data, "/test", 42)])
+            monkeypatch.setattr(os, "fsync", fsync)
+
+            assert path.stat().st_size == size
+
+            await outbox.append([get_outbox_candidate(test_data, "/test", 64)])
+            await outbox.drain()
+
+        values = [
+            event["data"]["value"]
+            for request in server.get_requests("/api/v1/write-events")
+            for event in request["events"]
+        ]
+        assert values == [23, 64]
+
+    @staticmethod
+    @pytest.mark.asyncio
+    async def test_moves_rejected_appends_to_the_dead_letter_file(
+        test_data: TestData,
+        tmp_path: Path,
+    ) -> None:
+        path = tmp_path / "outbox.jsonl"
+        rejected: list[tuple[list[dict], ServerError]] = []
+
+        async def write_events(request: web.Request) -> web.Response:
+            body = await request.json()
+            if any(event["subject"] == "" for event in body["events"]):
+                return web.Response(status=400, headers=HEADERS)
+            return await accept_write(request)
+
+        server = StubServer()
+        server.add_post("/api/v1/write-events", write_events)
+
+        async with server:
+            outbox = Outbox(
+                server.get_client(),
+                path=str(path),
+                on_rejected=lambda events, error: rejected.append((events, error)),
+            )
+            await outbox.open()
+            await asyncio.gather(
+                outbox.append([get_outbox_candidate(test_data, "/test", 23)]),
+                outbox.append([get_outbox_candidate(test_data, "", 42)]),
+                outbox.append([get_outbox_candidate(test_data, "/test", 64)]),
+            )
+            await outbox.drain()
+            await outbox.close()
+
+        assert outbox.metrics.delivered_count == 2
+        assert outbox.metrics.rejected_count == 1
+
+        delivered_values = [
+            event["data"]["value"]
+            for request in server.get_requests("/api/v1/write-events")
+            if all(event["subject"] for event in request["events"])
+            for event in request["events"]
+        ]
+        assert delivered_values == [23, 64]
+
+        assert len(rejected) == 1
+        assert rejected[0][0][0]["data"] == {"value": 42}
+        assert rejected[0][1].status_code == 400
+
+        dead_letters = (tmp_path / "outbox.jsonl.dead-letter").read_text().splitlines()
+        assert len(dead_letters) == 1
+        dead_letter = json.loads(dead_letters[0])
+        assert dead_letter["events"][0]["data"] == {"value": 42}
+        assert "400" in dead_letter["error"]
+
+    @staticmethod
+    @pytest.mark.asyncio
+    async def test_raises_from_drain_once_retries_are_exhausted(
+        test_data: TestData,
+        tmp_path: Path,
+    ) -> None:
+        async def write_events(_: web.Request) -> web.Response:
+            return web.Response(status=503, headers=HEADERS)
+
+        server = StubServer()
+        server.add_post("/api/v1/write-events", write_events)
+
+        async with server, Outbox(
+            server.get_client(),
+            path=str(tmp_path / "outbox.jsonl"),
+            retry_policy=RetryPolicy(max_retries=2, initial_delay=0.01),
+        ) as outbox:
+            await outbox.append([get_outbox_candidate(test_data, "/test", 23)])
+
+            with pytest.raises(ServerError) as error:
+                await asyncio.wait_for(outbox.drain(), 5)
+
+            assert error.value.status_code == 503
+            assert outbox.metrics.depth == 1
+            assert len(server.get_requests("/api/v1/write-events")) >= 3
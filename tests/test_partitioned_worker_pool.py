@@ -0,0 +1,98 @@
+import asyncio
+
+import pytest
+
+from eventsourcingdb import (
+    ClientError,
+    Event,
+    PartitionedWorkerPool,
+    ReadEventsOptions,
+    ValidationError,
+)
+
+from .conftest import TestData
+from .shared.database import Database
+from .shared.event.write_numbered_events import write_numbered_events
+from .shared.stub_server import get_event_payload
+
+
+class TestPartitionedWorkerPool:
+    @staticmethod
+    def test_throws_error_if_worker_count_is_invalid() -> None:
+        async def handle(_: Event) -> None:
+            pass
+
+        with pytest.raises(ValidationError):
+            PartitionedWorkerPool(handle, worker_count=0)
+
+    @staticmethod
+    @pytest.mark.asyncio
+    async def test_keeps_the_order_of_events_per_subject(
+        database: Database,
+        test_data: TestData,
+    ) -> None:
+        client = database.get_client()
+        await write_numbered_events(database, test_data, 50, subject_count=5)
+        handled_indexes: dict[str, list[int]] = {}
+
+        async def handle(event: Event) -> None:
+            # Let later events overtake earlier ones, unless they share a worker.
+            await asyncio.sleep(0.01 if event.data["index"] % 2 == 0 else 0)
+            handled_indexes.setdefault(event.subject, []).append(event.data["index"])
+
+        async with PartitionedWorkerPool(handle, worker_count=4, max_queue_size=2) as pool:
+            async for event in client.read_events("/", ReadEventsOptions(recursive=True)):
+                await pool.dispatch(event)
+
+        assert pool.watermark == "49"
+        assert sorted(handled_indexes) == [f"/test/{index}" for index in range(5)]
+        for subject, indexes in handled_indexes.items():
+            assert indexes == [
+                index for index in range(50) if f"/test/{index % 5}" == subject
+            ]
+
+    @staticmethod
+    @pytest.mark.asyncio
+    async def test_stops_the_watermark_before_a_failed_event(
+        prepared_database: Database,
+    ) -> None:
+        client = prepared_database.get_client()
+
+        async def handle(event: Event) -> None:
+            if event.event_id == "2":
+                raise ValueError("Failed to handle event.")
+
+        events = [
+            event async for event in client.read_events("/", ReadEventsOptions(recursive=True))
+        ]
+
+        pool = PartitionedWorkerPool(handle, worker_count=2)
+        for event in events:
+            await pool.dispatch(event)
+
+        with pytest.raises(ValueError, match="Failed to handle event."):
+            await pool.close()
+
+        assert pool.watermark == "1"
+
+        with pytest.raises(ClientError):
+            await pool.dispatch(events[0])
+
+    @staticmethod
+    @pytest.mark.asyncio
+    async def test_raises_the_error_from_wait_for_error_once_the_handler_fails() -> None:
+        async def handle(event: Event) -> None:
+            if event.event_id == "1":
+                raise ValueError("Failed to handle event.")
+
+        pool = PartitionedWorkerPool(handle, worker_count=2)
+        for event_id in range(2):
+            await pool.dispatch(Event.parse(get_event_payload(event_id)))
+
+        with pytest.raises(ValueError, match="Failed to handle event."):
+            await asyncio.wait_for(pool.wait_for_error(), 2)
+
+        assert pool.watermark == "0"
+
+        with pytest.raises(ValueError, match="Failed to handle event."):
+            await pool.close()
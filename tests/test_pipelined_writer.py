@@ -0,0 +1,153 @@
+import asyncio
+
+import pytest
+from aiohttp import web
+
+from eventsourcingdb import (
+    EventCandidate,
+    IsSubjectOnEventId,
+    PipelinedWriter,
+    ReadEventsOptions,
+)
+
+from .conftest import TestData
+from .shared.database import Database
+from .shared.stub_server import HEADERS, StubServer, get_event_payload
+
+
+class TestPipelinedWriter:
+    @staticmethod
+    @pytest.mark.asyncio
+    async def test_keeps_the_order_of_writes_within_a_subject(
+        database: Database,
+        test_data: TestData,
+    ) -> None:
+        client = database.get_client()
+        write_count = 30
+
+        async with PipelinedWriter(client, max_in_flight=4) as writer:
+            futures = [
+                writer.submit([
+                    EventCandidate(
+                        source=test_data.TEST_SOURCE_STRING,
+                        subject=f"/test/{index % 3}",
+                        type="io.eventsourcingdb.test",
+                        data={"index": index},
+                    )
+                ])
+                for index in range(write_count)
+            ]
+            results = await asyncio.gather(*futures)
+
+        assert [written_events[0].data["index"] for written_events in results] == list(
+            range(write_count)
+        )
+
+        for subject_index in range(3):
+            indices = [
+                event.data["index"]
+                async for event in client.read_events(
+                    f"/test/{subject_index}", ReadEventsOptions(recursive=False)
+                )
+            ]
+            assert indices == list(range(subject_index, write_count, 3))
+
+    @staticmethod
+    @pytest.mark.asyncio
+    async def test_maps_subjects_to_partitions(
+        database: Database,
+    ) -> None:
+        client = database.get_client()
+
+        writer = PipelinedWriter(client, partition_depth=2)
+
+        assert writer.get_partition("/books/42/loans") == "/books/42"
+        assert writer.get_partition("/books") == "/books"
+
+        await writer.close()
+
+    @staticmethod
+    @pytest.mark.asyncio
+    async def test_writes_subjects_of_the_same_partition_one_after_another(
+        test_data: TestData,
+    ) -> None:
+        written_subjects: list[str] = []
+        running_subjects: set[str] = set()
+        overlapping_subjects: list[set[str]] = []
+
+        async def write_events(request: web.Request) -> web.Response:
+            subject = (await request.json())["events"][0]["subject"]
+            running_subjects.add(subject)
+            overlapping_subjects.append(set(running_subjects))
+
+            # Give other writes the chance to start while this one is running.
+            await asyncio.sleep(0.02)
+
+            running_subjects.remove(subject)
+            written_subjects.append(subject)
+            return web.json_response(
+                [get_event_payload(len(written_subjects) - 1, subject)], headers=HEADERS
+            )
+
+        server = StubServer()
+        server.add_post("/api/v1/write-events", write_events)
+        subjects = ["/books/42/a", "/books/42/b", "/books/43/a"] * 3
+
+        async with server, PipelinedWriter(
+            server.get_client(), max_in_flight=4, partition_depth=2
+        ) as writer:
+            await asyncio.gather(*[
+                writer.submit([
+                    EventCandidate(
+                        source=test_data.TEST_SOURCE_STRING,
+                        subject=subject,
+                        type="io.eventsourcingdb.test",
+                        data={},
+                    )
+                ])
+                for subject in subjects
+            ])
+
+        assert [
+            subject for subject in written_subjects if subject.startswith("/books/42/")
+        ] == [subject for subject in subjects if subject.startswith("/books/42/")]
+        assert all(
+            not {"/books/42/a", "/books/42/b"} <= running for running in overlapping_subjects
+        )
+        # Writes to another partition still run alongside them.
+        assert any(len(running) > 1 for running in overlapping_subjects)
+
+    @staticmethod
+    @pytest.mark.asyncio
+    async def test_applies_preconditions_after_earlier_writes(
+        database: Database,
+        test_data: TestData,
+    ) -> None:
+        client = database.get_client()
+
+        async with PipelinedWriter(client) as writer:
+            first = writer.submit([
+                EventCandidate(
+                    source=test_data.TEST_SOURCE_STRING,
+                    subject="/test",
+                    type="io.eventsourcingdb.test",
+                    data={},
+                )
+            ])
+            second = writer.submit(
+                [
+                    EventCandidate(
+                        source=test_data.TEST_SOURCE_STRING,
+                        subject="/test",
+                        type="io.eventsourcingdb.test",
+                        data={},
+                    )
+                ],
+                [IsSubjectOnEventId("/test", "0")],
+            )
+
+            first_events = await first
+            second_events = await second
+
+        assert first_events[0].event_id == "0"
+        assert second_events[0].event_id == "1"
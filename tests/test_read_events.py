@@ -1,7 +1,8 @@
 import asyncio
+import contextlib
 
 import pytest
-from aiohttp import ClientConnectorDNSError
+from aiohttp import ClientConnectorDNSError, web
 
 from eventsourcingdb import (
     Bound,
@@ -10,12 +11,19 @@ from eventsourcingdb import (
     Order,
     ReadEventsOptions,
     ReadFromLatestEvent,
+    RetryPolicy,
 )
 from eventsourcingdb.errors.server_error import ServerError
 
 from .conftest import TestData
 from .shared.database import Database
 from .shared.event.assert_event import assert_event_equals
+from .shared.stub_server import (
+    StubServer,
+    get_event_line,
+    stream_lines,
+    track_closed_responses,
+)
 
 
 class TestReadEvents:
@@ -429,3 +437,122 @@ class TestReadEvents:
         assert events_processed > events_to_process, (
             "Expected to process some events before cancellation"
         )
+
+    @staticmethod
+    @pytest.mark.asyncio
+    async def test_reads_events_with_reconnect_enabled(
+        prepared_database: Database,
+    ) -> None:
+        client = prepared_database.get_client()
+        options = ReadEventsOptions(recursive=True)
+
+        expected_ids = [event.event_id async for event in client.read_events("/", options)]
+        actual_ids = [
+            event.event_id
+            async for event in client.read_events("/", options, reconnect=RetryPolicy())
+        ]
+
+        assert actual_ids == expected_ids
+
+    @staticmethod
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        ("order", "bound_key", "expected_ids"),
+        [
+            (Order.CHRONOLOGICAL, "lowerBound", ["0", "1", "2", "3", "4", "5"]),
+            (Order.ANTICHRONOLOGICAL, "upperBound", ["5", "4", "3", "2", "1", "0"]),
+        ],
+    )
+    async def test_resumes_after_the_last_event_if_the_connection_drops(
+        order: Order,
+        bound_key: str,
+        expected_ids: list[str],
+    ) -> None:
+        async def read_events(request: web.Request) -> web.StreamResponse:
+            bound = (await request.json())["options"].get(bound_key)
+            if bound is None:
+                return await stream_lines(
+                    request,
+                    [get_event_line(int(event_id)) for event_id in expected_ids[:3]],
+                    drop_connection=True,
+                )
+
+            assert bound["type"] == "exclusive"
+            remaining_ids = expected_ids[expected_ids.index(bound["id"]) + 1:]
+            return await stream_lines(
+                request, [get_event_line(int(event_id)) for event_id in remaining_ids]
+            )
+
+        server = StubServer()
+        server.add_post("/api/v1/read-events", read_events)
+
+        async with server:
+            actual_ids = [
+                event.event_id
+                async for event in server.get_client().read_events(
+                    "/test",
+                    ReadEventsOptions(recursive=False, order=order),
+                    reconnect=RetryPolicy(initial_delay=0.01),
+                )
+            ]
+
+        assert actual_ids == expected_ids
+        assert [
+            body["options"].get(bound_key)
+            for body in server.get_requests("/api/v1/read-events")
+        ] == [None, {"id": expected_ids[2], "type": "exclusive"}]
+
+    @staticmethod
+    @pytest.mark.asyncio
+    async def test_releases_the_connection_when_closed_early(
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        async def handle(request: web.Request) -> web.StreamResponse:
+            return await stream_lines(
+                request, [get_event_line(index) for index in range(3)], stall=True
+            )
+
+        server = StubServer()
+        server.add_post("/api/v1/read-events", handle)
+        closed_responses = track_closed_responses(monkeypatch)
+
+        async with server:
+            events = server.get_client().read_events(
+                "/test", ReadEventsOptions(recursive=False)
+            )
+            async with contextlib.aclosing(events):
+                async for _ in events:
+                    break
+
+            assert len(closed_responses) == 1
+
+    @staticmethod
+    @pytest.mark.asyncio
+    async def test_raises_the_error_once_reconnects_are_exhausted(database: Database):
+        client = database.get_client("with_invalid_url")
+
+        with pytest.raises(ClientConnectorDNSError):
+            async for _ in client.read_events(
+                "/",
+                ReadEventsOptions(recursive=False),
+                reconnect=RetryPolicy(max_retries=2, initial_delay=0.01),
+            ):
+                pass
+
+    @staticmethod
+    @pytest.mark.asyncio
+    async def test_stops_reading_after_the_limit(
+        prepared_database: Database,
+    ) -> None:
+        client = prepared_database.get_client()
+
+        result = [
+            event
+            async for event in client.read_events(
+                "/",
+                ReadEventsOptions(recursive=True, order=Order.ANTICHRONOLOGICAL),
+                limit=2,
+            )
+        ]
+
+        assert [event.event_id for event in result] == ["3", "2"]
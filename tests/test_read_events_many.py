@@ -0,0 +1,76 @@
+import pytest
+
+from eventsourcingdb import (
+    Order,
+    ReadEventsOptions,
+)
+
+from .conftest import TestData
+from .shared.database import Database
+from .shared.event.write_numbered_events import write_numbered_events
+
+
+class TestReadEventsMany:
+    @staticmethod
+    @pytest.mark.asyncio
+    async def test_merges_the_events_of_all_subjects_in_order(
+        database: Database,
+        test_data: TestData,
+    ) -> None:
+        client = database.get_client()
+        await write_numbered_events(database, test_data, 40, subject_count=4)
+
+        events = [
+            event
+            async for event in client.read_events_many(
+                ["/test/2", "/test/0", "/test/3"],
+                ReadEventsOptions(recursive=False),
+                max_concurrency=2,
+                page_size=3,
+            )
+        ]
+
+        assert [event.data["index"] for event in events] == [
+            index for index in range(40) if index % 4 != 1
+        ]
+
+    @staticmethod
+    @pytest.mark.asyncio
+    async def test_merges_in_anti_chronological_order(
+        database: Database,
+        test_data: TestData,
+    ) -> None:
+        client = database.get_client()
+        await write_numbered_events(database, test_data, 40, subject_count=4)
+
+        events = [
+            event
+            async for event in client.read_events_many(
+                ["/test/0", "/test/1"],
+                ReadEventsOptions(recursive=False, order=Order.ANTICHRONOLOGICAL),
+                page_size=4,
+            )
+        ]
+
+        assert [event.data["index"] for event in events] == [
+            index for index in reversed(range(40)) if index % 4 in (0, 1)
+        ]
+
+    @staticmethod
+    @pytest.mark.asyncio
+    async def test_returns_events_matching_several_subjects_only_once(
+        database: Database,
+        test_data: TestData,
+    ) -> None:
+        client = database.get_client()
+        await write_numbered_events(database, test_data, 12, subject_count=4)
+
+        events = [
+            event
+            async for event in client.read_events_many(
+                ["/test", "/test/1"],
+                ReadEventsOptions(recursive=True),
+            )
+        ]
+
+        assert [event.data["index"] for event in events] == list(range(12))
@@ -0,0 +1,83 @@
+import pytest
+
+from eventsourcingdb import (
+    Order,
+    ReadEventsOptions,
+    ValidationError,
+)
+
+from .conftest import TestData
+from .shared.database import Database
+from .shared.event.write_numbered_events import write_numbered_events
+
+
+class TestReadEventsPage:
+    @staticmethod
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("prefetch_next", [False, True])
+    async def test_reads_all_events_page_by_page(
+        database: Database,
+        test_data: TestData,
+        prefetch_next: bool,
+    ) -> None:
+        client = database.get_client()
+        await write_numbered_events(database, test_data, 25)
+        options = ReadEventsOptions(recursive=False)
+
+        page_sizes = []
+        indexes = []
+        cursor = None
+        while True:
+            page = await client.read_events_page(
+                "/test", options, page_size=10, cursor=cursor, prefetch_next=prefetch_next
+            )
+            page_sizes.append(len(page.events))
+            indexes.extend(event.data["index"] for event in page.events)
+
+            cursor = page.next_cursor
+            if cursor is None:
+                break
+
+        assert page_sizes == [10, 10, 5]
+        assert indexes == list(range(25))
+
+    @staticmethod
+    @pytest.mark.asyncio
+    async def test_does_not_return_a_cursor_to_an_empty_page(
+        database: Database,
+        test_data: TestData,
+    ) -> None:
+        client = database.get_client()
+        await write_numbered_events(database, test_data, 10)
+
+        page = await client.read_events_page("/test", ReadEventsOptions(recursive=False), 10)
+
+        assert len(page.events) == 10
+        assert page.next_cursor is None
+
+    @staticmethod
+    @pytest.mark.asyncio
+    async def test_pages_in_anti_chronological_order(
+        database: Database,
+        test_data: TestData,
+    ) -> None:
+        client = database.get_client()
+        await write_numbered_events(database, test_data, 5)
+        options = ReadEventsOptions(recursive=False, order=Order.ANTICHRONOLOGICAL)
+
+        first_page = await client.read_events_page("/test", options, 3)
+        second_page = await client.read_events_page("/test", options, 3, first_page.next_cursor)
+
+        assert [event.data["index"] for event in first_page.events] == [4, 3, 2]
+        assert [event.data["index"] for event in second_page.events] == [1, 0]
+        assert second_page.next_cursor is None
+
+    @staticmethod
+    @pytest.mark.asyncio
+    async def test_rejects_an_invalid_cursor(database: Database) -> None:
+        client = database.get_client()
+
+        with pytest.raises(ValidationError):
+            await client.read_events_page(
+                "/test", ReadEventsOptions(recursive=False), 10, cursor="invalid"
+            )
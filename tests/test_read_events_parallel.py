@@ -0,0 +1,111 @@
+import pytest
+
+from eventsourcingdb import (
+    Bound,
+    BoundType,
+    IfEventIsMissingDuringRead,
+    Order,
+    ReadEventsOptions,
+    ReadFromLatestEvent,
+    ValidationError,
+)
+
+from .conftest import TestData
+from .shared.database import Database
+from .shared.event.write_numbered_events import write_numbered_events
+
+
+class TestReadEventsParallel:
+    @staticmethod
+    @pytest.mark.asyncio
+    async def test_returns_the_same_events_as_a_single_read(
+        database: Database,
+        test_data: TestData,
+    ) -> None:
+        client = database.get_client()
+        await write_numbered_events(database, test_data, 100, subject_count=3)
+        options = ReadEventsOptions(recursive=True)
+
+        expected_ids = [event.event_id async for event in client.read_events("/test", options)]
+        actual_ids = [
+            event.event_id
+            async for event in client.read_events_parallel("/test", options, partition_count=4)
+        ]
+
+        assert actual_ids == expected_ids
+
+    @staticmethod
+    @pytest.mark.asyncio
+    async def test_respects_bounds_and_anti_chronological_order(
+        database: Database,
+        test_data: TestData,
+    ) -> None:
+        client = database.get_client()
+        await write_numbered_events(database, test_data, 100, subject_count=3)
+        options = ReadEventsOptions(
+            recursive=False,
+            order=Order.ANTICHRONOLOGICAL,
+            lower_bound=Bound(id="10", type=BoundType.EXCLUSIVE),
+            upper_bound=Bound(id="80", type=BoundType.INCLUSIVE),
+        )
+
+        expected_ids = [event.event_id async for event in client.read_events("/test/1", options)]
+        actual_ids = [
+            event.event_id
+            async for event in client.read_events_parallel("/test/1", options, partition_count=3)
+        ]
+
+        assert actual_ids == expected_ids
+
+    @staticmethod
+    @pytest.mark.asyncio
+    async def test_returns_all_events_when_unordered(
+        database: Database,
+        test_data: TestData,
+    ) -> None:
+        client = database.get_client()
+        await write_numbered_events(database, test_data, 100, subject_count=3)
+
+        actual_ids = [
+            event.event_id
+            async for event in client.read_events_parallel(
+                "/test",
+                ReadEventsOptions(recursive=True),
+                partition_count=4,
+                ordered=False,
+                max_buffered_events=10,
+            )
+        ]
+
+        assert sorted(actual_ids, key=int) == [str(index) for index in range(100)]
+
+    @staticmethod
+    @pytest.mark.asyncio
+    async def test_returns_nothing_for_an_empty_subject(database: Database) -> None:
+        client = database.get_client()
+
+        events = [
+            event
+            async for event in client.read_events_parallel("/test", ReadEventsOptions(recursive=True))
+        ]
+
+        assert events == []
+
+    @staticmethod
+    @pytest.mark.asyncio
+    async def test_rejects_from_latest_event(database: Database) -> None:
+        client = database.get_client()
+
+        with pytest.raises(ValidationError):
+            async for _ in client.read_events_parallel(
+                "/test",
+                ReadEventsOptions(
+                    recursive=True,
+                    from_latest_event=ReadFromLatestEvent(
+                        subject="/test",
+                        type="io.eventsourcingdb.test",
+                        if_event_is_missing=IfEventIsMissingDuringRead.READ_EVERYTHING,
+                    ),
+                ),
+            ):
+                pass
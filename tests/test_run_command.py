@@ -0,0 +1,115 @@
+import asyncio
+
+import pytest
+
+from eventsourcingdb import (
+    ConflictError,
+    Event,
+    EventCandidate,
+    IsSubjectPristine,
+    RetryPolicy,
+)
+
+from .conftest import TestData
+from .shared.database import Database
+
+
+def count_events(state: int, _: Event) -> int:
+    return state + 1
+
+
+class TestRunCommand:
+    @staticmethod
+    @pytest.mark.asyncio
+    async def test_decides_based_on_the_folded_state(
+        prepared_database: Database,
+        test_data: TestData,
+    ) -> None:
+        client = prepared_database.get_client()
+
+        written_events = await client.run_command(
+            test_data.REGISTERED_SUBJECT,
+            0,
+            count_events,
+            lambda state: [
+                EventCandidate(
+                    source=test_data.TEST_SOURCE_STRING,
+                    subject=test_data.REGISTERED_SUBJECT,
+                    type=test_data.REGISTERED_TYPE,
+                    data={"previous_count": state},
+                )
+            ],
+        )
+
+        assert len(written_events) == 1
+        assert written_events[0].data == {"previous_count": 2}
+
+    @staticmethod
+    @pytest.mark.asyncio
+    async def test_retries_concurrent_commands_on_conflicts(
+        database: Database,
+        test_data: TestData,
+    ) -> None:
+        client = database.get_client()
+        command_count = 5
+
+        def decide(state: int) -> list[EventCandidate]:
+            return [
+                EventCandidate(
+                    source=test_data.TEST_SOURCE_STRING,
+                    subject="/counter",
+                    type="io.eventsourcingdb.test",
+                    data={"previous_count": state},
+                )
+            ]
+
+        results = await asyncio.gather(*[
+            client.run_command(
+                "/counter",
+                0,
+                count_events,
+                decide,
+                RetryPolicy(max_retries=20, initial_delay=0.01),
+            )
+            for _ in range(command_count)
+        ])
+
+        previous_counts = sorted(
+            written_events[0].data["previous_count"] for written_events in results
+        )
+        assert previous_counts == list(range(command_count))
+
+    @staticmethod
+    @pytest.mark.asyncio
+    async def test_writes_nothing_if_decide_returns_no_events(
+        prepared_database: Database,
+        test_data: TestData,
+    ) -> None:
+        client = prepared_database.get_client()
+
+        written_events = await client.run_command(
+            test_data.REGISTERED_SUBJECT, 0, count_events, lambda _: []
+        )
+
+        assert written_events == []
+
+    @staticmethod
+    @pytest.mark.asyncio
+    async def test_throws_a_conflict_error_if_a_precondition_fails(
+        prepared_database: Database,
+        test_data: TestData,
+    ) -> None:
+        client = prepared_database.get_client()
+
+        with pytest.raises(ConflictError):
+            await client.write_events(
+                [
+                    EventCandidate(
+                        source=test_data.TEST_SOURCE_STRING,
+                        subject=test_data.REGISTERED_SUBJECT,
+                        type=test_data.REGISTERED_TYPE,
+                        data=test_data.APFEL_FRED_DATA,
+                    )
+                ],
+                [IsSubjectPristine(test_data.REGISTERED_SUBJECT)],
+            )
@@ -1,9 +1,10 @@
 import pytest
-from aiohttp import ClientConnectorDNSError
+from aiohttp import ClientConnectorDNSError, web
 
 from eventsourcingdb import EventCandidate
 
 from .shared.database import Database
+from .shared.stub_server import HEARTBEAT_LINE, StubServer, stream_lines
 
 
 class TestRunEventQLQuery:
@@ -71,3 +72,54 @@ class TestRunEventQLQuery:
         second_row = rows_read[1]
         assert second_row["id"] == TestRunEventQLQuery.SECOND_EVENT_ID
         assert second_row["data"]["value"] == TestRunEventQLQuery.SECOND_EVENT_VALUE
+
+    @staticmethod
+    @pytest.mark.asyncio
+    async def test_reads_rows_with_a_heartbeat_timeout(database: Database) -> None:
+        client = database.get_client()
+
+        await client.write_events([
+            EventCandidate(
+                source="https://www.eventsourcingdb.io",
+                subject="/test",
+                type="io.eventsourcingdb.test",
+                data={"value": 23},
+            )
+        ])
+
+        rows = [
+            row
+            async for row in client.run_eventql_query(
+                "FROM e IN events PROJECT INTO e", heartbeat_timeout=10
+            )
+        ]
+
+        assert len(rows) == 1
+
+    @staticmethod
+    @pytest.mark.asyncio
+    async def test_raises_a_timeout_error_if_the_stream_stalls() -> None:
+        async def run_eventql_query(request: web.Request) -> web.StreamResponse:
+            return await stream_lines(
+                request,
+                [HEARTBEAT_LINE, b'{"type":"row","payload":23}\n', HEARTBEAT_LINE],
+                stall=True,
+            )
+
+        server = StubServer()
+        server.add_post("/api/v1/run-eventql-query", run_eventql_query)
+        rows = []
+        heartbeat_intervals: list[float] = []
+
+        async with server:
+            with pytest.raises(TimeoutError):
+                async for row in server.get_client().run_eventql_query(
+                    "FROM e IN events PROJECT INTO e",
+                    heartbeat_timeout=0.2,
+                    on_heartbeat=heartbeat_intervals.append,
+                ):
+                    rows.append(row)
+
+        assert rows == [23]
+        assert len(heartbeat_intervals) == 2
+        assert all(interval >= 0 for interval in heartbeat_intervals)
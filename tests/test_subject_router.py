@@ -0,0 +1,97 @@
+import asyncio
+import contextlib
+
+import pytest
+
+from eventsourcingdb import (
+    Event,
+    ObserveEventsOptions,
+    SubjectRouter,
+    ValidationError,
+)
+
+from .conftest import TestData
+from .shared.database import Database
+
+
+async def ignore_event(_: Event) -> None:
+    pass
+
+
+class TestSubjectRouter:
+    @staticmethod
+    @pytest.mark.asyncio
+    async def test_finds_the_handlers_of_a_subject(database: Database) -> None:
+        router = SubjectRouter(database.get_client())
+
+        async def root_handler(_: Event) -> None:
+            pass
+
+        async def users_handler(_: Event) -> None:
+            pass
+
+        async def registered_handler(_: Event) -> None:
+            pass
+
+        router.add_handler("/", root_handler)
+        router.add_handler("/users", users_handler)
+        router.add_handler("/users/registered", registered_handler, recursive=False)
+
+        assert router.get_handlers("/users/registered") == [
+            root_handler,
+            users_handler,
+            registered_handler,
+        ]
+        assert router.get_handlers("/users/registered/jane") == [root_handler, users_handler]
+        assert router.get_handlers("/users-archive") == [root_handler]
+
+        router.remove_handler("/users", users_handler)
+
+        assert router.get_handlers("/users/registered") == [root_handler, registered_handler]
+
+    @staticmethod
+    @pytest.mark.asyncio
+    async def test_throws_error_if_subject_is_outside_of_the_router(database: Database) -> None:
+        router = SubjectRouter(database.get_client(), "/users")
+
+        with pytest.raises(ValidationError):
+            router.add_handler("/orders", ignore_event)
+
+    @staticmethod
+    @pytest.mark.asyncio
+    async def test_throws_error_if_options_are_not_recursive(database: Database) -> None:
+        router = SubjectRouter(database.get_client())
+
+        with pytest.raises(ValidationError):
+            await router.run(ObserveEventsOptions(recursive=False))
+
+    @staticmethod
+    @pytest.mark.asyncio
+    async def test_dispatches_events_to_matching_handlers(
+        prepared_database: Database,
+        test_data: TestData,
+    ) -> None:
+        router = SubjectRouter(prepared_database.get_client(), "/users")
+        registered_event_ids: list[str] = []
+        all_event_ids: list[str] = []
+        all_events_dispatched = asyncio.Event()
+
+        async def handle_registered(event: Event) -> None:
+            registered_event_ids.append(event.event_id)
+
+        async def handle_all(event: Event) -> None:
+            all_event_ids.append(event.event_id)
+            if len(all_event_ids) == 4:
+                all_events_dispatched.set()
+
+        router.add_handler(test_data.REGISTERED_SUBJECT, handle_registered)
+        router.add_handler("/users", handle_all)
+
+        task = asyncio.create_task(router.run())
+        await asyncio.wait_for(all_events_dispatched.wait(), 10)
+        task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await task
+
+        assert registered_event_ids == ["0", "2"]
+        assert all_event_ids == ["0", "1", "2", "3"]
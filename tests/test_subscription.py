@@ -0,0 +1,236 @@
+import asyncio
+import contextlib
+from pathlib import Path
+
+import pytest
+from aiohttp import web
+
+from eventsourcingdb import (
+    CheckpointStore,
+    Event,
+    FileCheckpointStore,
+    ObserveEventsOptions,
+    SqliteCheckpointStore,
+    Subscription,
+    ValidationError,
+)
+
+from .shared.database import Database
+from .shared.stub_server import StubServer, get_event_line, stream_lines
+
+
+def create_checkpoint_stores(tmp_path: Path) -> list[CheckpointStore]:
+    return [
+        FileCheckpointStore(str(tmp_path / "checkpoints.json")),
+        SqliteCheckpointStore(str(tmp_path / "checkpoints.sqlite3")),
+    ]
+
+
+async def handle_until(subscription: Subscription, event_id: str) -> list[str]:
+    handled_event_ids: list[str] = []
+    is_done = asyncio.Event()
+
+    async def handle(event: Event) -> None:
+        handled_event_ids.append(event.event_id)
+        if event.event_id == event_id:
+            is_done.set()
+
+    task = asyncio.create_task(subscription.run(handle))
+    await asyncio.wait_for(is_done.wait(), 10)
+
+    # Let the subscription finish a commit it may have started for the event.
+    await asyncio.sleep(0.1)
+    task.cancel()
+    with contextlib.suppress(asyncio.CancelledError):
+        await task
+
+    return handled_event_ids
+
+
+class TestCheckpointStores:
+    @staticmethod
+    @pytest.mark.asyncio
+    async def test_saves_and_loads_checkpoints_by_name(tmp_path: Path) -> None:
+        for checkpoint_store in create_checkpoint_stores(tmp_path):
+            assert await checkpoint_store.load("projection") is None
+
+            await checkpoint_store.save("projection", "1")
+            await checkpoint_store.save("other-projection", "2")
+            await checkpoint_store.save("projection", "3")
+
+            assert await checkpoint_store.load("projection") == "3"
+            assert await checkpoint_store.load("other-projection") == "2"
+
+    @staticmethod
+    @pytest.mark.asyncio
+    async def test_throws_error_if_checkpoint_file_is_corrupt(tmp_path: Path) -> None:
+        path = tmp_path / "checkpoints.json"
+        path.write_text("{", encoding="utf-8")
+
+        with pytest.raises(ValidationError):
+            await FileCheckpointStore(str(path)).load("projection")
+
+
+class TestSubscription:
+    @staticmethod
+    @pytest.mark.asyncio
+    async def test_throws_error_if_commit_every_is_invalid(
+        database: Database,
+        tmp_path: Path,
+    ) -> None:
+        with pytest.raises(ValidationError):
+            Subscription(
+                database.get_client(),
+                "projection",
+                "/",
+                ObserveEventsOptions(recursive=True),
+                FileCheckpointStore(str(tmp_path / "checkpoints.json")),
+                commit_every=0,
+            )
+
+    @staticmethod
+    @pytest.mark.asyncio
+    async def test_resumes_after_the_saved_position(
+        prepared_database: Database,
+        tmp_path: Path,
+    ) -> None:
+        client = prepared_database.get_client()
+
+        for checkpoint_store in create_checkpoint_stores(tmp_path):
+            await checkpoint_store.save("projection", "1")
+            subscription = Subscription(
+                client,
+                "projection",
+                "/",
+                ObserveEventsOptions(recursive=True),
+                checkpoint_store,
+            )
+
+            assert await handle_until(subscription, "3") == ["2", "3"]
+            assert subscription.committed_position == "3"
+            assert await checkpoint_store.load("projection") == "3"
+
+    @staticmethod
+    @pytest.mark.asyncio
+    async def test_saves_the_handled_events_if_the_handler_fails(
+        prepared_database: Database,
+        tmp_path: Path,
+    ) -> None:
+        checkpoint_store = FileCheckpointStore(str(tmp_path / "checkpoints.json"))
+        subscription = Subscription(
+            prepared_database.get_client(),
+            "projection",
+            "/",
+            ObserveEventsOptions(recursive=True),
+            checkpoint_store,
+            commit_every=100,
+            commit_interval=None,
+        )
+
+        async def handle(event: Event) -> None:
+            if event.event_id == "2":
+                raise ValueError("Failed to handle event.")
+
+        with pytest.raises(ValueError, match="Failed to handle event."):
+            await subscription.run(handle)
+
+        assert await checkpoint_store.load("projection") == "1"
+
+    @staticmethod
+    @pytest.mark.asyncio
+    async def test_commits_in_batches(prepared_database: Database, tmp_path: Path) -> None:
+        saved_event_ids: list[str] = []
+
+        class RecordingCheckpointStore(FileCheckpointStore):
+            async def save(self, name: str, event_id: str) -> None:
+                saved_event_ids.append(event_id)
+                await super().save(name, event_id)
+
+        subscription = Subscription(
+            prepared_database.get_client(),
+            "projection",
+            "/",
+            ObserveEventsOptions(recursive=True),
+            RecordingCheckpointStore(str(tmp_path / "checkpoints.json")),
+            commit_every=2,
+            commit_interval=None,
+        )
+
+        await handle_until(subscription, "3")
+
+        assert saved_event_ids == ["1", "3"]
+
+    @staticmethod
+    @pytest.mark.asyncio
+    async def test_catches_up_before_observing(
+        prepared_database: Database,
+        tmp_path: Path,
+    ) -> None:
+        checkpoint_store = FileCheckpointStore(str(tmp_path / "checkpoints.json"))
+        await checkpoint_store.save("projection", "0")
+        subscription = Subscription(
+            prepared_database.get_client(),
+            "projection",
+            "/",
+            ObserveEventsOptions(recursive=True),
+            checkpoint_store,
+            catch_up=True,
+        )
+
+        assert await handle_until(subscription, "3") == ["1", "2", "3"]
+
+    @staticmethod
+    @pytest.mark.asyncio
+    async def test_handles_events_in_parallel_with_workers(
+        prepared_database: Database,
+        tmp_path: Path,
+    ) -> None:
+        checkpoint_store = SqliteCheckpointStore(str(tmp_path / "checkpoints.sqlite3"))
+        subscription = Subscription(
+            prepared_database.get_client(),
+            "projection",
+            "/",
+            ObserveEventsOptions(recursive=True),
+            checkpoint_store,
+            worker_count=4,
+        )
+
+        handled_event_ids = await handle_until(subscription, "3")
+
+        assert sorted(handled_event_ids) == ["0", "1", "2", "3"]
+        assert await checkpoint_store.load("projection") == "3"
+
+    @staticmethod
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("worker_count", [1, 2])
+    async def test_raises_the_error_of_the_handler_while_no_events_arrive(
+        tmp_path: Path,
+        worker_count: int,
+    ) -> None:
+        async def observe_events(request: web.Request) -> web.StreamResponse:
+            return await stream_lines(
+                request, [get_event_line(index) for index in range(4)], stall=True
+            )
+
+        def handle(event: Event) -> None:
+            if event.event_id == "1":
+                raise ValueError("Failed to handle event.")
+
+        server = StubServer()
+        server.add_post("/api/v1/observe-events", observe_events)
+        checkpoint_store = FileCheckpointStore(str(tmp_path / "checkpoints.json"))
+
+        async with server:
+            subscription = Subscription(
+                server.get_client(),
+                "projection",
+                "/test",
+                ObserveEventsOptions(recursive=False),
+                checkpoint_store,
+                worker_count=worker_count,
+            )
+
+            with pytest.raises(ValueError, match="Failed to handle event."):
+                await asyncio.wait_for(subscription.run(handle), 2)
+
+        assert await checkpoint_store.load("projection") == "0"
@@ -0,0 +1,82 @@
+from hashlib import sha256
+
+import pytest
+
+from eventsourcingdb import (
+    Container,
+    EventCandidate,
+    ReadEventsOptions,
+    verify_hashes,
+    verify_signatures,
+)
+
+from .conftest import TestData
+from .shared.database import Database
+
+
+class TestVerifyEvents:
+    @staticmethod
+    @pytest.mark.asyncio
+    async def test_verifies_the_hashes_of_all_events(
+        prepared_database: Database,
+    ) -> None:
+        client = prepared_database.get_client()
+
+        events = [
+            event async for event in client.read_events("/", ReadEventsOptions(recursive=True))
+        ]
+
+        results = await verify_hashes(events, chunk_size=1)
+
+        assert [result.event for result in results] == events
+        assert all(result.is_valid for result in results)
+
+    @staticmethod
+    @pytest.mark.asyncio
+    async def test_reports_invalid_hashes_per_event(
+        prepared_database: Database,
+    ) -> None:
+        client = prepared_database.get_client()
+
+        events = [
+            event async for event in client.read_events("/", ReadEventsOptions(recursive=True))
+        ]
+        events[2].hash = sha256(b"invalid data").hexdigest()
+
+        results = await verify_hashes(events)
+
+        assert [result.is_valid for result in results] == [True, True, False, True]
+        assert results[2].error is not None
+
+    @staticmethod
+    @pytest.mark.asyncio
+    async def test_verifies_the_signatures_of_all_events(
+        test_data: TestData,
+    ) -> None:
+        container = Container().with_image_tag("preview").with_signing_key()
+        container.start()
+
+        try:
+            client = container.get_client()
+
+            written_events = await client.write_events(
+                [
+                    EventCandidate(
+                        source=test_data.TEST_SOURCE_STRING,
+                        subject="/test",
+                        type="io.eventsourcingdb.test",
+                        data={"value": value},
+                    )
+                    for value in range(3)
+                ],
+            )
+
+            valid_signature = written_events[1].signature
+            assert valid_signature is not None
+            written_events[1].signature = valid_signature + "0123456789abcdef"
+
+            results = await verify_signatures(written_events, container.get_verification_key())
+
+            assert [result.is_valid for result in results] == [True, False, True]
+        finally:
+            container.stop()
@@ -0,0 +1,113 @@
+from concurrent.futures import ThreadPoolExecutor
+from hashlib import sha256
+
+import pytest
+
+from eventsourcingdb import (
+    Container,
+    EventCandidate,
+    ReadEventsOptions,
+    verify_hash_chain,
+)
+from eventsourcingdb.errors.validation_error import ValidationError
+
+from .conftest import TestData
+from .shared.database import Database
+
+
+class TestVerifyHashChain:
+    @staticmethod
+    @pytest.mark.asyncio
+    async def test_yields_all_events_if_the_chain_is_intact(
+        prepared_database: Database,
+    ) -> None:
+        client = prepared_database.get_client()
+
+        events = client.read_events("/", ReadEventsOptions(recursive=True))
+        verified_events = [event async for event in verify_hash_chain(events)]
+
+        total_event_count = 4
+        assert len(verified_events) == total_event_count
+
+    @staticmethod
+    @pytest.mark.asyncio
+    async def test_verifies_hashes_on_an_executor(
+        prepared_database: Database,
+    ) -> None:
+        client = prepared_database.get_client()
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            events = client.read_events("/", ReadEventsOptions(recursive=True))
+            verified_events = [
+                event async for event in verify_hash_chain(events, executor=executor, max_pending=2)
+            ]
+
+        total_event_count = 4
+        assert len(verified_events) == total_event_count
+        assert [event.event_id for event in verified_events] == ["0", "1", "2", "3"]
+
+    @staticmethod
+    @pytest.mark.asyncio
+    async def test_fails_at_the_position_of_an_invalid_hash(
+        database: Database,
+        test_data: TestData,
+    ) -> None:
+        client = database.get_client()
+
+        written_events = await client.write_events(
+            [
+                EventCandidate(
+                    source=test_data.TEST_SOURCE_STRING,
+                    subject="/test",
+                    type="io.eventsourcingdb.test",
+                    data={"value": value},
+                )
+                for value in range(3)
+            ],
+        )
+        written_events[1].hash = sha256(b"invalid data").hexdigest()
+
+        async def stream_written_events():
+            for event in written_events:
+                yield event
+
+        verified_event_ids = []
+        with pytest.raises(ValidationError, match="position 1"):
+            async for event in verify_hash_chain(stream_written_events()):
+                verified_event_ids.append(event.event_id)
+
+        assert verified_event_ids == ["0"]
+
+    @staticmethod
+    @pytest.mark.asyncio
+    async def test_fails_if_the_predecessor_link_is_broken(
+        database: Database,
+        test_data: TestData,
+    ) -> None:
+        candidates = [
+            EventCandidate(
+                source=test_data.TEST_SOURCE_STRING,
+                subject="/test",
+                type="io.eventsourcingdb.test",
+                data={"value": value},
+            )
+            for value in range(2)
+        ]
+
+        first_chain = await database.get_client().write_events(candidates)
+
+        container = Container()
+        container.start()
+
+        try:
+            second_chain = await container.get_client().write_events(candidates)
+        finally:
+            container.stop()
+
+        async def stream_mixed_chains():
+            yield first_chain[0]
+            yield second_chain[1]
+
+        with pytest.raises(ValidationError, match="position 1"):
+            async for _ in verify_hash_chain(stream_mixed_chains()):
+                pass
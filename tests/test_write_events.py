@@ -2,11 +2,13 @@ import pytest
 from aiohttp import ClientConnectorDNSError
 
 from eventsourcingdb import (
+    ConflictError,
     EventCandidate,
     IsEventQlQueryTrue,
     IsSubjectOnEventId,
     IsSubjectPopulated,
     IsSubjectPristine,
+    ReadEventsOptions,
     ServerError,
 )
 
@@ -322,3 +324,176 @@ class TestWriteSubjects:
                     ),
                 ]
             )
+
+    @staticmethod
+    @pytest.mark.asyncio
+    async def test_writes_large_batches_with_a_streamed_request_body(
+        database: Database,
+        test_data: TestData,
+    ) -> None:
+        client = database.get_client()
+        event_count = 2500
+
+        written_events = await client.write_events(
+            [
+                EventCandidate(
+                    source=test_data.TEST_SOURCE_STRING,
+                    subject="/test",
+                    type="io.eventsourcingdb.test",
+                    data={"index": index},
+                )
+                for index in range(event_count)
+            ],
+            [IsSubjectPristine("/test")],
+        )
+
+        assert len(written_events) == event_count
+        assert written_events[-1].data == {"index": event_count - 1}
+
+    @staticmethod
+    @pytest.mark.asyncio
+    async def test_writes_events_with_pre_encoded_data(
+        database: Database,
+        test_data: TestData,
+    ) -> None:
+        client = database.get_client()
+
+        written_events = await client.write_events(
+            [
+                EventCandidate(
+                    source=test_data.TEST_SOURCE_STRING,
+                    subject="/test",
+                    type="io.eventsourcingdb.test",
+                    data=b'{"value":23,"nested":{"name":"Jane"}}',
+                ),
+            ]
+        )
+
+        assert len(written_events) == 1
+        assert written_events[0].data == {"value": 23, "nested": {"name": "Jane"}}
+
+    @staticmethod
+    @pytest.mark.asyncio
+    async def test_reencodes_candidates_after_a_field_was_reassigned(
+        database: Database,
+        test_data: TestData,
+    ) -> None:
+        client = database.get_client()
+
+        event_candidate = EventCandidate(
+            source=test_data.TEST_SOURCE_STRING,
+            subject="/test",
+            type="io.eventsourcingdb.test",
+            data={"value": 23},
+        )
+        await client.write_events([event_candidate])
+
+        event_candidate.subject = "/other"
+        event_candidate.data = {"value": 42}
+        written_events = await client.write_events([event_candidate])
+
+        assert written_events[0].subject == "/other"
+        assert written_events[0].data == {"value": 42}
+
+    @staticmethod
+    @pytest.mark.asyncio
+    async def test_reencodes_candidates_after_data_was_modified_in_place(
+        database: Database,
+        test_data: TestData,
+    ) -> None:
+        client = database.get_client()
+
+        event_candidate = EventCandidate(
+            source=test_data.TEST_SOURCE_STRING,
+            subject="/test",
+            type="io.eventsourcingdb.test",
+            data={"value": 23},
+        )
+        await client.write_events([event_candidate])
+
+        assert isinstance(event_candidate.data, dict)
+        event_candidate.data["value"] = 42
+        written_events = await client.write_events([event_candidate])
+
+        assert written_events[0].data == {"value": 42}
+
+    @staticmethod
+    @pytest.mark.asyncio
+    async def test_returns_acknowledgements_for_written_events(
+        database: Database,
+        test_data: TestData,
+    ) -> None:
+        client = database.get_client()
+
+        acknowledgements = await client.write_events_acknowledged(
+            [
+                EventCandidate(
+                    source=test_data.TEST_SOURCE_STRING,
+                    subject=f"/test/{index}",
+                    type="io.eventsourcingdb.test",
+                    data={"index": index},
+                )
+                for index in range(2)
+            ]
+        )
+
+        read_events = [
+            event async for event in client.read_events("/test", ReadEventsOptions(recursive=True))
+        ]
+
+        assert [acknowledgement.event_id for acknowledgement in acknowledgements] == ["0", "1"]
+        assert [acknowledgement.subject for acknowledgement in acknowledgements] == [
+            "/test/0",
+            "/test/1",
+        ]
+        assert [acknowledgement.hash for acknowledgement in acknowledgements] == [
+            event.hash for event in read_events
+        ]
+
+    @staticmethod
+    @pytest.mark.asyncio
+    async def test_writes_events_without_decoding_the_response(
+        database: Database,
+        test_data: TestData,
+    ) -> None:
+        client = database.get_client()
+
+        result = await client.write_events_without_response(
+            [
+                EventCandidate(
+                    source=test_data.TEST_SOURCE_STRING,
+                    subject="/test",
+                    type="io.eventsourcingdb.test",
+                    data={"value": 23},
+                ),
+            ]
+        )
+
+        read_events = [
+            event async for event in client.read_events("/test", ReadEventsOptions(recursive=False))
+        ]
+
+        assert result is None
+        assert len(read_events) == 1
+        assert read_events[0].data == {"value": 23}
+
+    @staticmethod
+    @pytest.mark.asyncio
+    async def test_raises_a_conflict_error_for_acknowledged_writes_if_a_precondition_fails(
+        prepared_database: Database,
+        test_data: TestData,
+    ) -> None:
+        client = prepared_database.get_client()
+
+        with pytest.raises(ConflictError):
+            await client.write_events_acknowledged(
+                [
+                    EventCandidate(
+                        source=test_data.TEST_SOURCE_STRING,
+                        subject=test_data.REGISTERED_SUBJECT,
+                        type="io.eventsourcingdb.test",
+                        data={"value": 23},
+                    ),
+                ],
+                [IsSubjectPristine(test_data.REGISTERED_SUBJECT)],
+            )
@@ -0,0 +1,157 @@
+import pytest
+from aiohttp import web
+
+from eventsourcingdb import BulkWriteError, EventCandidate, ReadEventsOptions
+
+from .conftest import TestData
+from .shared.database import Database
+from .shared.stub_server import HEADERS, StubServer, get_event_payload
+
+
+class TestWriteEventsBulk:
+    @staticmethod
+    @pytest.mark.asyncio
+    async def test_writes_all_events_in_chunks(
+        database: Database,
+        test_data: TestData,
+    ) -> None:
+        client = database.get_client()
+        event_count = 25
+
+        event_candidates = [
+            EventCandidate(
+                source=test_data.TEST_SOURCE_STRING,
+                subject=f"/test/{index % 3}",
+                type="io.eventsourcingdb.test",
+                data={"index": index},
+            )
+            for index in range(event_count)
+        ]
+
+        progress = []
+        written_events = [
+            event
+            async for event in client.write_events_bulk(
+                event_candidates,
+                max_chunk_size=10,
+                max_concurrency=2,
+                on_progress=progress.append,
+            )
+        ]
+
+        assert [event.data["index"] for event in written_events] == list(range(event_count))
+        assert [item.written_count for item in progress] == [10, 20, 25]
+        assert progress[-1].chunk_count == 3
+
+        read_events = [
+            event async for event in client.read_events("/test", ReadEventsOptions(recursive=True))
+        ]
+        assert len(read_events) == event_count
+
+    @staticmethod
+    @pytest.mark.asyncio
+    async def test_keeps_the_order_of_events_within_a_subject(
+        database: Database,
+        test_data: TestData,
+    ) -> None:
+        client = database.get_client()
+        event_count = 30
+
+        event_candidates = [
+            EventCandidate(
+                source=test_data.TEST_SOURCE_STRING,
+                subject=f"/test/{index % 2}",
+                type="io.eventsourcingdb.test",
+                data={"index": index},
+            )
+            for index in range(event_count)
+        ]
+
+        async for _ in client.write_events_bulk(
+            event_candidates,
+            max_chunk_size=4,
+            max_concurrency=4,
+        ):
+            pass
+
+        for subject_index in range(2):
+            indices = [
+                event.data["index"]
+                async for event in client.read_events(
+                    f"/test/{subject_index}", ReadEventsOptions(recursive=False)
+                )
+            ]
+            assert indices == list(range(subject_index, event_count, 2))
+
+    @staticmethod
+    @pytest.mark.asyncio
+    async def test_splits_chunks_by_encoded_size(
+        database: Database,
+        test_data: TestData,
+    ) -> None:
+        client = database.get_client()
+
+        event_candidates = [
+            EventCandidate(
+                source=test_data.TEST_SOURCE_STRING,
+                subject="/test",
+                type="io.eventsourcingdb.test",
+                data={"value": "x" * 1000},
+            )
+            for _ in range(3)
+        ]
+
+        progress = []
+        async for _ in client.write_events_bulk(
+            event_candidates,
+            max_chunk_bytes=1500,
+            on_progress=progress.append,
+        ):
+            pass
+
+        assert [item.written_count for item in progress] == [1, 2, 3]
+
+    @staticmethod
+    @pytest.mark.asyncio
+    async def test_reports_where_to_resume_if_a_chunk_fails(test_data: TestData) -> None:
+        async def write_events(request: web.Request) -> web.Response:
+            event_candidates = (await request.json())["events"]
+            if any(event_candidate["subject"] == "" for event_candidate in event_candidates):
+                return web.Response(status=400, text="Subject must not be empty.", headers=HEADERS)
+
+            return web.json_response(
+                [
+                    get_event_payload(event_candidate["data"]["index"], event_candidate["subject"])
+                    for event_candidate in event_candidates
+                ],
+                headers=HEADERS,
+            )
+
+        server = StubServer()
+        server.add_post("/api/v1/write-events", write_events)
+
+        # Each chunk has a subject of its own, so all chunks run at once. The
+        # empty subject in the middle makes the server reject the second one.
+        event_candidates = [
+            EventCandidate(
+                source=test_data.TEST_SOURCE_STRING,
+                subject="" if index == 12 else f"/test/{index // 10}",
+                type="io.eventsourcingdb.test",
+                data={"index": index},
+            )
+            for index in range(30)
+        ]
+
+        written_ids = []
+        async with server:
+            with pytest.raises(BulkWriteError) as error_info:
+                async for event in server.get_client().write_events_bulk(
+                    event_candidates,
+                    max_chunk_size=10,
+                    max_concurrency=3,
+                ):
+                    written_ids.append(int(event.event_id))
+
+        assert error_info.value.resume_offset == 10
+        assert error_info.value.written_ranges == [range(20, 30)]
+        assert written_ids == [*range(10), *range(20, 30)]